@@ -62,10 +62,20 @@ HIBP_API_KEY = os.environ.get('HIBP_API_KEY', '')
 # Configuration WSL (pour les outils OSINT/Pentest)
 WSL_DISTRO = os.environ.get('WSL_DISTRO', 'kali-linux')
 WSL_USER = os.environ.get('WSL_USER', 'loupix')
+# Réutiliser des shells WSL persistants au lieu de lancer wsl.exe à chaque commande
+WSL_PERSISTENT_SHELL = os.environ.get('WSL_PERSISTENT_SHELL', 'true').lower() == 'true'
+# Lancer les outils sans shell intermédiaire avec l'environnement de login mémorisé
+WSL_ENV_BYPASS = os.environ.get('WSL_ENV_BYPASS', 'true').lower() == 'true'
 
 # Configuration timeout pour les outils externes
 OSINT_TOOL_TIMEOUT = int(os.environ.get('OSINT_TOOL_TIMEOUT', '60'))  # secondes
 PENTEST_TOOL_TIMEOUT = int(os.environ.get('PENTEST_TOOL_TIMEOUT', '120'))  # secondes
+# Nombre maximum d'outils OSINT lancés en parallèle pour une même analyse
+OSINT_MAX_CONCURRENT_TOOLS = int(os.environ.get('OSINT_MAX_CONCURRENT_TOOLS', '4'))
+
+# Cache des résultats OSINT (WHOIS, DNS, sous-domaines...) en mémoire et sur disque
+OSINT_CACHE_ENABLED = os.environ.get('OSINT_CACHE_ENABLED', 'true').lower() == 'true'
+OSINT_CACHE_DIR = os.environ.get('OSINT_CACHE_DIR', str(APP_DIR / 'cache' / 'osint'))
 
 # Configuration des limites de requêtes API
 SIRENE_API_RATE_LIMIT = int(os.environ.get('SIRENE_API_RATE_LIMIT', '10'))  # requêtes par minute
@@ -6,7 +6,10 @@ Utilise probablepeople et nameparser si disponibles pour une meilleure détectio
 """
 
 import re
-from typing import Optional, Tuple
+import string
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 # Essayer d'importer les bibliothèques optionnelles
 try:
@@ -21,6 +24,12 @@ try:
 except ImportError:
     NAMEPARSER_AVAILABLE = False
 
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
 
 # Mots-clés à exclure (lieux, entreprises, fonctions, etc.)
 EXCLUDED_KEYWORDS = {
@@ -63,12 +72,56 @@ EXCLUDED_KEYWORDS = {
     'espace', 'jean', 'pierre', 'marie', 'paul', 'sophie'
 }
 
+# Lettres accentuées autorisées dans un nom
+ACCENTED_LETTERS = 'àâäéèêëïîôöùûüÿçÀÂÄÉÈÊËÏÎÔÖÙÛÜŸÇ'
+
+# Lettres autorisées dans un nom (avec accents)
+NAME_LETTERS = 'a-zA-Z' + ACCENTED_LETTERS
+
+# Caractères autorisés dans un nom (lettres, accents, apostrophes, tirets, espaces)
+NAME_CHARS = NAME_LETTERS + '\'\\-\\s'
+
+# Règles au niveau des caractères, compilées une seule fois
+_DIGITS_TABLE = str.maketrans('', '', string.digits)
+# Table de suppression des caractères autorisés : ce qui reste après
+# str.translate() est soit des espaces, soit des caractères interdits
+_ALLOWED_CHARS_TABLE = str.maketrans(
+    '', '', string.ascii_letters + ACCENTED_LETTERS + "'-" + string.whitespace
+)
+_LETTER_RE = re.compile(f'[{NAME_LETTERS}]')
+_REPEAT_RE = re.compile(r'(.)\1{3,}')
+
+# Motifs suspects à l'intérieur du nom (ex: "abc", "aaa", "test")
+_SUSPICIOUS_SUBSTRING_RE = re.compile(r'abc|xyz|aaa|test|demo|admin')
+
+# Combinaisons suspectes (titres de sections plutôt que des noms), en une seule regex
+_SUSPICIOUS_RE = re.compile(
+    r'\b(?:formation|espace|bilan|orientation|lieu|jeune|publics|tourisme|industrie|educatif|routiers|humaines)\s+\w+'
+    r'|\w+\s+(?:adultes|particulier|coiffure|industrie|petite|retrouvez|aucune|titre)'
+    r'|\b(?:madame|monsieur|mme|m\.|mr|mrs|ms)\s+\w+'  # Titres seuls sans nom valide après
+)
+
+# Au-delà de ce nombre de noms, filter_valid_names pré-filtre le lot avec pandas
+BULK_FILTER_THRESHOLD = 500
+
+# Au-delà de ce nombre de noms, la validation est répartie sur plusieurs processus
+PARALLEL_FILTER_THRESHOLD = 5000
+PARALLEL_CHUNK_SIZE = 1000
+
+# Pré-filtre vectorisé : nom de 2 à 30 caractères autorisés, sans mot-clé exclu long
+_BULK_NAME_PATTERN = f'[{NAME_CHARS}]{{2,30}}'
+_BULK_EXCLUDED_PATTERN = '|'.join(
+    re.escape(keyword) for keyword in sorted(EXCLUDED_KEYWORDS) if len(keyword) >= 4
+)
+_EXCLUDED_SUBSTRING_RE = re.compile(_BULK_EXCLUDED_PATTERN)
+
 
 def is_valid_human_name(name: str) -> bool:
     """
     Valide si un nom/prénom ressemble à un nom humain valide
     
     Utilise probablepeople et nameparser si disponibles pour une meilleure détection.
+    Les résultats sont mis en cache (les mêmes prénoms/noms reviennent souvent).
     
     Args:
         name: Le nom à valider
@@ -76,11 +129,26 @@ def is_valid_human_name(name: str) -> bool:
     Returns:
         True si le nom semble être un nom humain valide, False sinon
     """
-    if not name or not isinstance(name, str):
+    if not isinstance(name, str) or len(name) < 2:
         return False
     
-    # Nettoyer le nom
-    name = name.strip()
+    # Nettoyer le nom avant l'appel en cache pour avoir des clés canoniques
+    return _is_valid_human_name_cached(name.strip())
+
+
+@lru_cache(maxsize=8192)
+def _is_valid_human_name_cached(name: str) -> bool:
+    """
+    Implémentation de is_valid_human_name, mise en cache
+    
+    Args:
+        name: Le nom à valider, déjà nettoyé (strip)
+        
+    Returns:
+        True si le nom semble être un nom humain valide, False sinon
+    """
+    # Les vérifications sont ordonnées de la moins coûteuse à la plus coûteuse,
+    # pour rejeter au plus tôt la majorité des entrées invalides
     
     # Vérifier la longueur minimale (au moins 2 caractères)
     if len(name) < 2:
@@ -90,25 +158,14 @@ def is_valid_human_name(name: str) -> bool:
     if len(name) > 30:
         return False
     
-    # Vérifier qu'il n'y a pas de chiffres
-    if re.search(r'\d', name):
-        return False
-    
-    # Vérifier qu'il n'y a pas de caractères spéciaux (sauf apostrophes, tirets, espaces)
-    if re.search(r'[^a-zA-ZàâäéèêëïîôöùûüÿçÀÂÄÉÈÊËÏÎÔÖÙÛÜŸÇ\'\-\s]', name):
+    # Vérifications caractère par caractère, avant les tests plus coûteux
+    if _has_invalid_characters(name):
         return False
     
-    # Vérifier qu'il n'y a pas de mots-clés exclus (vérifier chaque mot individuellement)
+    # Vérifier qu'il n'y a pas de patterns suspects (ex: "abc", "123", "aaa")
     name_lower = name.lower()
-    words = name_lower.split()
-    for word in words:
-        # Vérifier si le mot entier est dans les mots-clés exclus
-        if word in EXCLUDED_KEYWORDS:
-            return False
-        # Vérifier si le mot contient un mot-clé exclu (pour détecter "formation-adultes", etc.)
-        for keyword in EXCLUDED_KEYWORDS:
-            if keyword in word and len(keyword) >= 4:  # Éviter les faux positifs avec des mots courts
-                return False
+    if _SUSPICIOUS_SUBSTRING_RE.search(name_lower):
+        return False
     
     # Vérifier qu'il n'y a pas trop de mots (les noms/prénoms ont généralement 1-3 mots)
     words = name.split()
@@ -119,61 +176,114 @@ def is_valid_human_name(name: str) -> bool:
     if any(len(word) < 2 for word in words):
         return False
     
-    # Vérifier qu'il y a au moins une lettre majuscule (les noms propres commencent par une majuscule)
-    # Mais on accepte aussi les noms en minuscules (cas où ils ne sont pas capitalisés)
-    if not re.search(r'[a-zA-ZàâäéèêëïîôöùûüÿçÀÂÄÉÈÊËÏÎÔÖÙÛÜŸÇ]', name):
-        return False
-    
-    # Vérifier qu'il n'y a pas de répétitions suspectes (ex: "aaaa", "testtest")
-    if re.search(r'(.)\1{3,}', name.lower()):
-        return False
-    
-    # Vérifier qu'il n'y a pas de patterns suspects (ex: "abc", "123", "aaa")
-    if re.search(r'(abc|xyz|aaa|test|demo|admin)', name_lower):
+    # Vérifier qu'il n'y a pas de mots-clés exclus (vérifier chaque mot individuellement)
+    for word in words:
+        # Vérifier si le mot entier est dans les mots-clés exclus
+        if word.lower() in EXCLUDED_KEYWORDS:
+            return False
+    # Vérifier si un mot contient un mot-clé exclu (pour détecter "formation-adultes", etc.),
+    # en une seule recherche ; seuls les mots-clés d'au moins 4 caractères sont utilisés
+    # pour éviter les faux positifs avec des mots courts
+    if _EXCLUDED_SUBSTRING_RE.search(name_lower):
         return False
     
     # Vérifier qu'il n'y a pas de combinaisons suspectes (ex: "Formation Adultes", "Espace Jean")
     # Ces combinaisons sont souvent des titres de sections, pas des noms
-    suspicious_patterns = [
-        r'\b(formation|espace|bilan|orientation|lieu|jeune|publics|tourisme|industrie|educatif|routiers|humaines)\s+\w+',
-        r'\w+\s+(adultes|particulier|coiffure|industrie|petite|retrouvez|aucune|titre)',
-        r'\b(madame|monsieur|mme|m\.|mr|mrs|ms)\s+\w+',  # Titres seuls sans nom valide après
-    ]
-    for pattern in suspicious_patterns:
-        if re.search(pattern, name_lower):
-            return False
+    if _SUSPICIOUS_RE.search(name_lower):
+        return False
     
     # Utiliser probablepeople si disponible pour détecter si c'est une Person vs Corporation
-    if PROBABLEPEOPLE_AVAILABLE:
-        try:
-            tagged, label = probablepeople.tag(name)
-            # Si probablepeople détecte que ce n'est PAS une Person, rejeter
-            # Les labels possibles sont généralement 'Person' ou 'Corporation'
-            if label and label != 'Person':
-                return False
-        except Exception:
-            # Si probablepeople échoue, continuer avec les autres vérifications
-            pass
+    # (sur un seul mot, la distinction Person/Corporation n'est pas fiable : on l'évite)
+    if PROBABLEPEOPLE_AVAILABLE and len(words) >= 2:
+        label = _probablepeople_label(name)
+        # Si probablepeople détecte que ce n'est PAS une Person, rejeter
+        # Les labels possibles sont généralement 'Person' ou 'Corporation'
+        if label and label != 'Person':
+            return False
     
     # Utiliser nameparser si disponible pour vérifier la structure
     if NAMEPARSER_AVAILABLE:
-        try:
-            parsed = HumanName(name)
+        parsed = _parse_human_name(name)
+        if parsed:
+            first, last, title = parsed
             # Si nameparser ne trouve ni prénom ni nom, c'est suspect
-            if not parsed.first and not parsed.last:
+            if not first and not last:
                 return False
             # Si le nom contient trop de composants suspects (titre, suffixe, etc.), rejeter
-            if parsed.title and parsed.title.lower() in ['mr', 'mrs', 'ms', 'dr', 'prof']:
+            if title and title.lower() in ['mr', 'mrs', 'ms', 'dr', 'prof']:
                 # Les titres sont OK, mais vérifier qu'il y a bien un nom/prénom
-                if not parsed.first and not parsed.last:
+                if not first and not last:
                     return False
-        except Exception:
-            # Si nameparser échoue, continuer avec les autres vérifications
-            pass
     
     return True
 
 
+def _has_invalid_characters(name: str) -> bool:
+    """
+    Applique en une passe les règles portant sur les caractères du nom
+    
+    Args:
+        name: Le nom à vérifier, déjà nettoyé (strip)
+        
+    Returns:
+        True si une règle est enfreinte (chiffre, caractère spécial,
+        aucune lettre ou répétition suspecte), False sinon
+    """
+    # Pas de chiffres (les chiffres non ASCII sont rejetés par le test suivant)
+    if len(name.translate(_DIGITS_TABLE)) != len(name):
+        return True
+    
+    # Pas de caractères spéciaux (sauf apostrophes, tirets, espaces)
+    remaining = name.translate(_ALLOWED_CHARS_TABLE)
+    if remaining and not remaining.isspace():
+        return True
+    
+    # Au moins une lettre (on accepte aussi les noms en minuscules)
+    if not _LETTER_RE.search(name):
+        return True
+    
+    # Pas de répétitions suspectes (ex: "aaaa")
+    return bool(_REPEAT_RE.search(name.lower()))
+
+
+@lru_cache(maxsize=4096)
+def _probablepeople_label(name: str) -> Optional[str]:
+    """
+    Label probablepeople d'un nom ('Person', 'Corporation', ...), mis en cache
+    
+    Args:
+        name: Le nom à étiqueter
+        
+    Returns:
+        Le label, ou None si probablepeople échoue
+    """
+    try:
+        tagged, label = probablepeople.tag(name)
+        return label
+    except Exception:
+        # Si probablepeople échoue, continuer avec les autres vérifications
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_human_name(name: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Analyse un nom avec nameparser, mise en cache
+    
+    Args:
+        name: Le nom à analyser
+        
+    Returns:
+        Tuple (first, last, title), ou None si nameparser échoue
+    """
+    try:
+        parsed = HumanName(name)
+        return (parsed.first, parsed.last, parsed.title)
+    except Exception:
+        # Si nameparser échoue, continuer avec les autres vérifications
+        return None
+
+
 def validate_name_pair(first_name: str, last_name: str) -> Optional[Tuple[str, str]]:
     """
     Valide une paire prénom/nom et retourne les versions validées
@@ -202,24 +312,59 @@ def validate_name_pair(first_name: str, last_name: str) -> Optional[Tuple[str, s
     if first_name.lower() == last_name.lower():
         return None
     
-    # Capitaliser correctement
-    first_name = first_name.capitalize()
-    last_name = last_name.capitalize()
+    # Capitaliser correctement chaque segment ("jean-pierre" -> "Jean-Pierre",
+    # "d'arcy" -> "D'Arcy") : après validation, les seuls séparateurs possibles
+    # sont les espaces, tirets et apostrophes, que str.title() traite en une passe
+    first_name = first_name.title()
+    last_name = last_name.title()
     
     return (first_name, last_name)
 
 
-def filter_valid_names(names: list) -> list:
+def _bulk_prefilter(names: list) -> list:
     """
-    Filtre une liste de noms pour ne garder que les noms valides
+    Pré-filtre vectorisé (pandas) d'un gros lot de noms
+    
+    Écarte en une passe les entrées rejetées à coup sûr par les vérifications
+    simples (longueur, caractères, mots-clés exclus). Les entrées restantes
+    passent ensuite par la validation complète.
     
     Args:
-        names: Liste de dictionnaires avec 'first_name', 'last_name', 'full_name'
+        names: Liste de dictionnaires avec 'first_name', 'last_name'
         
     Returns:
-        Liste filtrée avec seulement les noms valides
+        Sous-liste (ordre conservé) des dictionnaires candidats
     """
-    valid_names = []
+    records = [name_data for name_data in names if isinstance(name_data, dict)]
+    if not records:
+        return []
+    
+    df = pd.DataFrame({
+        'first_name': [name_data.get('first_name', '') for name_data in records],
+        'last_name': [name_data.get('last_name', '') for name_data in records],
+    }, dtype=object)
+    
+    mask = pd.Series(True, index=df.index)
+    for column in ('first_name', 'last_name'):
+        # Les valeurs non textuelles sont laissées à la validation complète
+        values = df[column].str.strip()
+        mask &= values.str.fullmatch(_BULK_NAME_PATTERN, na=True).astype(bool)
+        mask &= ~values.str.lower().str.contains(_BULK_EXCLUDED_PATTERN, regex=True, na=False).astype(bool)
+    
+    return [records[i] for i in mask.to_numpy().nonzero()[0]]
+
+
+def _validate_chunk(names: list) -> List[Tuple[str, str]]:
+    """
+    Valide une portion de liste de noms (sans dédoublonnage)
+    
+    Args:
+        names: Liste de dictionnaires avec 'first_name', 'last_name'
+        
+    Returns:
+        Liste des paires (prénom, nom) validées, dans l'ordre d'entrée
+    """
+    validated_pairs = []
     
     for name_data in names:
         if not isinstance(name_data, dict):
@@ -233,16 +378,65 @@ def filter_valid_names(names: list) -> list:
         
         validated = validate_name_pair(first_name, last_name)
         if validated:
-            valid_first, valid_last = validated
-            full_name = f'{valid_first} {valid_last}'
-            
-            # Éviter les doublons
-            if not any(n.get('full_name') == full_name for n in valid_names):
-                valid_names.append({
-                    'first_name': valid_first,
-                    'last_name': valid_last,
-                    'full_name': full_name
-                })
+            validated_pairs.append(validated)
     
-    return valid_names
+    return validated_pairs
 
+
+def _validate_names_parallel(names: list) -> List[Tuple[str, str]]:
+    """
+    Valide un gros lot de noms par morceaux dans plusieurs processus
+    
+    Revient à une validation séquentielle si les processus ne peuvent pas
+    être créés (ex: worker Celery prefork, dont les processus sont démons).
+    
+    Args:
+        names: Liste de dictionnaires avec 'first_name', 'last_name'
+        
+    Returns:
+        Liste des paires (prénom, nom) validées, dans l'ordre d'entrée
+    """
+    chunks = [names[i:i + PARALLEL_CHUNK_SIZE] for i in range(0, len(names), PARALLEL_CHUNK_SIZE)]
+    try:
+        with ProcessPoolExecutor() as executor:
+            # map() conserve l'ordre des morceaux
+            return [pair for pairs in executor.map(_validate_chunk, chunks) for pair in pairs]
+    except Exception:
+        return _validate_chunk(names)
+
+
+def filter_valid_names(names: list) -> list:
+    """
+    Filtre une liste de noms pour ne garder que les noms valides
+    
+    Args:
+        names: Liste de dictionnaires avec 'first_name', 'last_name', 'full_name'
+        
+    Returns:
+        Liste filtrée avec seulement les noms valides
+    """
+    if PANDAS_AVAILABLE and len(names) > BULK_FILTER_THRESHOLD:
+        names = _bulk_prefilter(names)
+    
+    if len(names) > PARALLEL_FILTER_THRESHOLD:
+        validated_pairs = _validate_names_parallel(names)
+    else:
+        validated_pairs = _validate_chunk(names)
+    
+    valid_names = []
+    seen = set()
+    
+    for valid_first, valid_last in validated_pairs:
+        full_name = f'{valid_first} {valid_last}'
+        
+        # Éviter les doublons
+        if full_name in seen:
+            continue
+        seen.add(full_name)
+        valid_names.append({
+            'first_name': valid_first,
+            'last_name': valid_last,
+            'full_name': full_name
+        })
+    
+    return valid_names
@@ -5,21 +5,32 @@ Collecte d'informations depuis des sources publiques
 
 import subprocess
 import shutil
+import shlex
 import socket
 import json
 import re
 import os
+import string
+import threading
 import logging
-from urllib.parse import urlparse
-from typing import Dict, List, Optional
+import operator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from urllib.parse import urljoin, urlparse
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+from services import osint_cache, wsl_shell
+from services.osint_cache import cached
+
 logger = logging.getLogger(__name__)
 
 # Importer la configuration
 try:
-    from config import SIRENE_API_KEY, SIRENE_API_URL, WSL_DISTRO, WSL_USER, OSINT_TOOL_TIMEOUT
+    from config import (SIRENE_API_KEY, SIRENE_API_URL, WSL_DISTRO, WSL_USER, OSINT_TOOL_TIMEOUT,
+                        OSINT_MAX_CONCURRENT_TOOLS, WSL_PERSISTENT_SHELL, WSL_ENV_BYPASS)
 except ImportError:
     # Valeurs par défaut si config n'est pas disponible
     SIRENE_API_KEY = os.environ.get('SIRENE_API_KEY', '')
@@ -27,6 +38,9 @@ except ImportError:
     WSL_DISTRO = os.environ.get('WSL_DISTRO', 'kali-linux')
     WSL_USER = os.environ.get('WSL_USER', 'loupix')
     OSINT_TOOL_TIMEOUT = int(os.environ.get('OSINT_TOOL_TIMEOUT', '60'))
+    OSINT_MAX_CONCURRENT_TOOLS = int(os.environ.get('OSINT_MAX_CONCURRENT_TOOLS', '4'))
+    WSL_PERSISTENT_SHELL = os.environ.get('WSL_PERSISTENT_SHELL', 'true').lower() == 'true'
+    WSL_ENV_BYPASS = os.environ.get('WSL_ENV_BYPASS', 'true').lower() == 'true'
 
 try:
     import whois
@@ -38,6 +52,394 @@ try:
 except ImportError:
     dns = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Outils OSINT vérifiés au démarrage (clé dans self.tools -> exécutable)
+OSINT_TOOLS = {
+    # Reconnaissance de domaines
+    'dnsrecon': 'dnsrecon',
+    'theharvester': 'theharvester',
+    'sublist3r': 'sublist3r',
+    'amass': 'amass',
+    'subfinder': 'subfinder',
+    'findomain': 'findomain',
+    'dnsenum': 'dnsenum',
+    'fierce': 'fierce',
+    # Analyse web
+    'whatweb': 'whatweb',
+    'sslscan': 'sslscan',
+    'testssl': 'testssl.sh',
+    'wafw00f': 'wafw00f',
+    'nikto': 'nikto',
+    'gobuster': 'gobuster',
+    # Recherche de personnes
+    'sherlock': 'sherlock',
+    'maigret': 'maigret',
+    'phoneinfoga': 'phoneinfoga',
+    'holehe': 'holehe',
+    # Métadonnées
+    'metagoofil': 'metagoofil',
+    'exiftool': 'exiftool',
+    # Frameworks OSINT
+    'recon-ng': 'recon-ng',
+    # APIs CLI
+    'shodan': 'shodan',
+    'censys': 'censys',
+}
+
+# Types d'enregistrements récupérés par get_dns_records
+DNS_RECORD_TYPES = ('A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME')
+
+_dns_resolver = None
+
+
+def _get_dns_resolver():
+    """Retourne le résolveur DNS partagé (créé à la première utilisation)"""
+    global _dns_resolver
+    if _dns_resolver is None:
+        _dns_resolver = dns.resolver.Resolver()
+    return _dns_resolver
+
+
+# Regex de parsing des sorties d'outils, compilées une seule fois
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_URL_RE = re.compile(r'(https?://[^\s]+)')
+# Liens <a href=...> d'une page HTML (comptés directement sur les octets de la réponse)
+_HREF_RE = re.compile(rb'<a\s(?:[^>]*\s)?href\s*=', re.IGNORECASE)
+# Format typique TheHarvester LinkedIn: "Name - Title - LinkedIn URL"
+_LINKEDIN_RE = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*-\s*([^-]+?)\s*-\s*(https?://[^\s]+)')
+# Nom du WAF dans la sortie wafw00f (longueur bornée, sans retour à la ligne)
+_WAF_RE = re.compile(r'(?:is behind|is protected by)[ \t]+([A-Za-z0-9][A-Za-z0-9 \t-]{0,59})', re.IGNORECASE)
+# Lignes "port service bannière" de `shodan host`
+_SHODAN_PORT_RE = re.compile(r'(\d+)\s+(\S+)\s+(.+)')
+# Lignes de résultat gobuster dir -q : "/chemin (Status: 200) [Size: 1234]"
+# (bannière et séparateurs "=====" ne correspondent pas : aucun filtrage préalable)
+_GOBUSTER_RE = re.compile(r'^\r?/?(\S+)\s+\(Status:\s*(\d+)\)(?:\s*\[Size:\s*(\d+)\])?', re.MULTILINE)
+# Lignes utiles de Metagoofil : début d'un document ("File: ...") ou champ ("Clé: valeur")
+_METAGOOFIL_LINE_RE = re.compile(r'^(?:.*?File:(?P<file>.*)|(?P<key>[^:\n]*):(?P<value>.*))$', re.MULTILINE)
+_SPACE_TO_UNDERSCORE = str.maketrans(' ', '_')
+# Ports dans la sortie texte de Censys
+_CENSYS_PORT_RE = re.compile(r'port[:\s]+(\d+)', re.IGNORECASE)
+# Champs texte de PhoneInfoga, sujet du certificat sslscan, comptes trouvés par holehe
+_CARRIER_RE = re.compile(r'Carrier:\s*([^\n]+)')
+_LOCATION_RE = re.compile(r'Location:\s*([^\n]+)')
+_CERT_SUBJECT_RE = re.compile(r'Subject:\s*(.+)')
+_HOLEHE_SITE_RE = re.compile(r'\[\*\]\s*([^\s]+)')
+# Caractères retirés d'un numéro de téléphone avant recherche
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+
+# Disponibilité des outils par (distribution, utilisateur, WSL présent)
+_tools_availability = {}
+_tools_availability_lock = threading.Lock()
+
+# Champs WHOIS retournés par get_whois_info (lus en une fois avec attrgetter)
+_WHOIS_FIELDS = ('domain_name', 'registrar', 'creation_date', 'expiration_date', 'updated_date',
+                 'name_servers', 'emails', 'country', 'org')
+_whois_getter = operator.attrgetter(*_WHOIS_FIELDS)
+
+# Marqueur de section séparant les sorties des outils lancés dans un même appel WSL
+_SECTION_MARKER = '__PROSPECTLAB_SECTION__'
+
+# Nombre maximum de sous-domaines conservés par outil (la lecture s'arrête au-delà)
+MAX_SUBDOMAINS_PER_TOOL = 5000
+
+# Début de sortie lu pour wafw00f (seul un extrait est analysé et conservé). Pas de
+# limite pour testssl.sh : son rapport JSON tronqué ne pourrait pas être décodé
+WAF_MAX_OUTPUT = 4096
+
+# Nombre maximum de recherches de profils (Maigret/Sherlock) simultanées
+SOCIAL_MEDIA_MAX_CONCURRENT = 3
+
+# Test de joignabilité de la cible avant les outils qui l'interrogent directement
+TARGET_PROBE_TIMEOUT = 5
+# Codes de passerelle signalant une origine hors ligne (dont ceux de Cloudflare)
+TARGET_DOWN_STATUS_CODES = (502, 504, 521, 522, 523)
+
+# Libellés des étapes OSINT lancées en parallèle (progression signalée à leur fin)
+OSINT_STEP_LABELS = {
+    'subdomains': 'découverte de sous-domaines',
+    'dns_records': 'enregistrements DNS',
+    'whois_info': 'WHOIS',
+    'emails': 'collecte d\'emails',
+    'ssl_info': 'certificat SSL',
+    'ssl_details': 'analyse SSL/TLS détaillée',
+    'waf_detections': 'détection des WAF',
+    'directories': 'découverte des répertoires',
+    'document_metadata': 'métadonnées de documents',
+    'image_metadata': 'métadonnées d\'images',
+    'technologies': 'détection des technologies',
+    'port_scan': 'scan des ports et services',
+    'ip_geolocation': 'géolocalisation IP',
+    'phone_osint': 'analyse OSINT des téléphones',
+    'people_osint': 'analyse OSINT approfondie des personnes',
+}
+
+# Connexions HTTP conservées par hôte dans la session de l'analyseur
+HTTP_POOL_SIZE = 20
+
+# Images d'une page analysées avec ExifTool (et nombre d'analyses simultanées)
+IMAGE_METADATA_MAX_IMAGES = 5
+
+# Images sans EXIF exploitable : ignorées sans lancer ExifTool
+EXIF_IMAGE_TYPES = ('image/jpeg', 'image/jpg', 'image/tiff', 'image/heic', 'image/heif')
+EXIF_MIN_IMAGE_BYTES = 4096
+_TRACKING_IMAGE_MARKERS = ('1x1', 'pixel', 'tracker')
+
+# Téléchargement des images (curl en parallèle) puis un seul appel ExifTool.
+# Les fichiers sont nommés par leur position dans la liste des URLs ("$@").
+_EXIF_BATCH_SCRIPT = (
+    'dir=$(mktemp -d) || exit 1; trap \'rm -rf "$dir"\' EXIT; i=0; '
+    'for url; do curl -fsL --max-time 10 -o "$dir/$i" "$url" & i=$((i+1)); done; wait; '
+    'exiftool -j -fast "$dir"/*'
+)
+
+# Structure des résultats OSINT par téléphone et par personne (valeurs par défaut).
+# Les résultats restent des dictionnaires : ils sont sérialisés en JSON par Celery
+# et lus champ par champ lors de la sauvegarde en base.
+PHONE_OSINT_FIELDS = {
+    'phone': None,
+    'carrier': None,
+    'location': None,
+    'line_type': None,
+    'valid': None,
+    'social_profiles': [],
+    'data_breaches': [],
+    'sources': []
+}
+
+PERSON_OSINT_FIELDS = {
+    'original': None,
+    'location': None,
+    'location_city': None,
+    'location_country': None,
+    'location_address': None,
+    'location_latitude': None,
+    'location_longitude': None,
+    'age_range': None,
+    'birth_date': None,
+    'family_members': [],
+    'social_profiles': {},
+    'data_breaches': [],
+    'professional_history': [],
+    'addresses': [],
+    'photos': [],
+    'hobbies': [],
+    'interests': [],
+    'education': None,
+    'bio': None,
+    'languages': [],
+    'skills': [],
+    'certifications': [],
+    'sources': []
+}
+
+# Niveaux hiérarchiques déduits du titre (1 = direction générale), par ordre de priorité
+HIERARCHY_LEVELS = (
+    (1, 'Direction', ('ceo', 'pdg', 'directeur général', 'président', 'founder')),
+    (2, 'Direction', ('directeur', 'directrice', 'director', 'head of')),
+    (3, 'Management', ('manager', 'responsable', 'chef de', 'lead')),
+    (4, 'Expert', ('senior', 'expert')),
+)
+DEFAULT_HIERARCHY_LEVEL = (5, 'Collaborateur')
+_HIERARCHY_BY_KEYWORD = {
+    keyword: (level, role)
+    for level, role, keywords in reversed(HIERARCHY_LEVELS)
+    for keyword in keywords
+}
+# Tous les mots-clés en une alternance (les plus longs d'abord : "directeur général"
+# avant "directeur"), recherchés comme sous-chaînes du titre. Le lookahead trouve
+# aussi les mots-clés qui se chevauchent, comme les tests `in` qu'il remplace.
+_HIERARCHY_RE = re.compile('(?=({}))'.format('|'.join(
+    re.escape(keyword) for keyword in sorted(_HIERARCHY_BY_KEYWORD, key=len, reverse=True)
+)))
+
+
+def _hierarchy_level(title: str) -> Tuple[int, str]:
+    """
+    Déduit le niveau hiérarchique et le rôle d'un titre de poste
+    
+    Args:
+        title: Titre en minuscules
+    
+    Returns:
+        Tuple (niveau, rôle) : le niveau le plus élevé parmi les mots-clés trouvés
+    """
+    matches = _HIERARCHY_RE.findall(title)
+    if not matches:
+        return DEFAULT_HIERARCHY_LEVEL
+    return min(_HIERARCHY_BY_KEYWORD[keyword] for keyword in matches)
+
+
+def _new_osint_record(fields: Dict, **values) -> Dict:
+    """
+    Crée un résultat OSINT à partir de sa structure par défaut
+    
+    Args:
+        fields: Structure par défaut (PHONE_OSINT_FIELDS, PERSON_OSINT_FIELDS)
+        **values: Valeurs initiales à renseigner
+    
+    Returns:
+        Dictionnaire avec tous les champs (listes et dictionnaires non partagés)
+    """
+    record = {
+        key: default.copy() if isinstance(default, (list, dict)) else default
+        for key, default in fields.items()
+    }
+    record.update(values)
+    return record
+
+
+def _is_exif_candidate_img(tag) -> bool:
+    """
+    Filtre BeautifulSoup : balise <img src> pouvant contenir des EXIF
+    
+    Les images inline (data:), vectorielles (SVG) et les pixels de suivi sont écartés.
+    """
+    if tag.name != 'img':
+        return False
+    src = tag.get('src')
+    if not src:
+        return False
+    src_lower = src.lower()
+    if src_lower.startswith('data:') or src_lower.split('?', 1)[0].endswith('.svg'):
+        return False
+    return not any(marker in src_lower for marker in _TRACKING_IMAGE_MARKERS)
+
+
+def _open_port(ip: str, port: int, source: str) -> Dict:
+    """Port ouvert au format attendu par la sauvegarde en base"""
+    return {'ip': ip, 'port': port, 'protocol': 'tcp', 'state': 'open', 'discovered_by': source}
+
+
+def _json_loads(data):
+    """
+    Décode du JSON (orjson si disponible)
+    
+    Les erreurs de orjson héritent de json.JSONDecodeError : les appelants
+    interceptent la même exception dans les deux cas.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(value) -> str:
+    """Encode en JSON (orjson si disponible, json pour les types qu'il refuse)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(value)
+
+
+@lru_cache(maxsize=256)
+def _subdomain_pattern(domain: str):
+    """
+    Regex (compilée une fois par domaine) des noms d'hôte du domaine
+    
+    Le domaine doit être précédé d'un point ou être le nom complet : un
+    `endswith(domain)` accepterait aussi "evilexample.com" pour "example.com".
+    
+    Args:
+        domain: Domaine analysé
+    
+    Returns:
+        re.Pattern: Regex dont le groupe 1 est le nom d'hôte complet
+    """
+    return re.compile(
+        r'(?<![A-Za-z0-9_.-])((?:[A-Za-z0-9_-]+\.)*' + re.escape(domain) + r')(?![A-Za-z0-9_-]|\.[A-Za-z0-9_-])',
+        re.IGNORECASE
+    )
+
+
+@lru_cache(maxsize=4096)
+def _name_from_local_part(local_part: str) -> str:
+    """
+    Déduit un nom de la partie locale d'un email (jean.dupont -> Jean Dupont)
+    
+    Seules les parties alphabétiques de plus de 2 caractères sont gardées ; sans
+    séparateur ou sans partie valable, la partie locale est retournée telle quelle.
+    """
+    if '.' not in local_part:
+        return local_part
+    name_parts = [part.capitalize() for part in local_part.split('.') if len(part) > 2 and part.isalpha()]
+    return ' '.join(name_parts) if name_parts else local_part
+
+
+# Caractères autorisés dans les parties locale et domaine d'un email
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+
+
+def _is_word_char(char: str) -> bool:
+    """Équivalent de \\w pour les frontières de mot"""
+    return char.isalnum() or char == '_'
+
+
+def _extract_emails(text: str, domain_filter: str = None) -> set:
+    """
+    Extrait les emails d'un texte sans passer par le moteur de regex
+    
+    Les '@' sont localisés avec str.find puis chaque candidat est étendu à
+    gauche et à droite ; le résultat est identique à _EMAIL_RE.findall.
+    
+    Args:
+        text: Texte à analyser (sortie complète d'un outil)
+        domain_filter: Si fourni, ne garder que les emails de ce domaine ou de ses sous-domaines
+    
+    Returns:
+        set: Emails trouvés
+    """
+    emails = set()
+    domain_filter = domain_filter.lower() if domain_filter else None
+    length = len(text)
+    last_end = 0
+    at = text.find('@')
+    
+    while at != -1:
+        # Partie domaine : [A-Za-z0-9.-]+ terminée par .[A-Za-z]{2,} et une frontière de mot
+        end = at + 1
+        while end < length and text[end] in _EMAIL_DOMAIN_CHARS:
+            end += 1
+        domain_end = 0
+        for k in range(end, at + 1, -1):
+            if not text[k - 1].isalpha() or (k < length and _is_word_char(text[k])):
+                continue
+            dot = k - 1
+            while text[dot].isalpha():
+                dot -= 1
+            if text[dot] == '.' and k - dot > 2 and dot > at + 1:
+                domain_end = k
+                break
+        
+        if domain_end:
+            # Partie locale : [A-Za-z0-9._%+-]+ précédée d'une frontière de mot
+            start = at
+            while start > last_end and text[start - 1] in _EMAIL_LOCAL_CHARS:
+                start -= 1
+            while start < at:
+                before = _is_word_char(text[start - 1]) if start > 0 else False
+                if before != _is_word_char(text[start]):
+                    break
+                start += 1
+            
+            if start < at:
+                email = text[start:domain_end]
+                email_domain = text[at + 1:domain_end].lower()
+                if (not domain_filter or email_domain == domain_filter
+                        or email_domain.endswith('.' + domain_filter)):
+                    emails.add(email)
+                last_end = domain_end
+        
+        at = text.find('@', max(at + 1, last_end))
+    
+    return emails
+
 
 class OSINTAnalyzer:
     """
@@ -49,6 +451,17 @@ class OSINTAnalyzer:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        # Session HTTP partagée par les étapes (connexions réutilisées, y compris entre threads)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Résolutions DNS mémorisées pendant une analyse (vidées par analyze_osint)
+        self._dns_cache: Dict[str, Optional[str]] = {}
+        self._hostname_cache: Dict[str, Optional[str]] = {}
+        # Pages HTML déjà téléchargées et analysées (par URL), vidées comme les résolutions DNS
+        self._html_cache: Dict[str, Optional[BeautifulSoup]] = {}
         self._check_tools_availability()
     
     def _check_tools_availability(self):
@@ -58,43 +471,112 @@ class OSINTAnalyzer:
         # Utiliser les variables d'environnement pour WSL
         self.wsl_cmd_base = ['wsl', '-d', WSL_DISTRO, '-u', WSL_USER] if self.wsl_available else None
         
-        # Vérifier les outils disponibles
-        self.tools = {
-            # Reconnaissance de domaines
-            'dnsrecon': self._check_tool('dnsrecon'),
-            'theharvester': self._check_tool('theharvester'),
-            'sublist3r': self._check_tool('sublist3r'),
-            'amass': self._check_tool('amass'),
-            'subfinder': self._check_tool('subfinder'),
-            'findomain': self._check_tool('findomain'),
-            'dnsenum': self._check_tool('dnsenum'),
-            'fierce': self._check_tool('fierce'),
-            # Analyse web
-            'whatweb': self._check_tool('whatweb'),
-            'sslscan': self._check_tool('sslscan'),
-            'testssl': self._check_tool('testssl.sh'),
-            'wafw00f': self._check_tool('wafw00f'),
-            'nikto': self._check_tool('nikto'),
-            'gobuster': self._check_tool('gobuster'),
-            # Recherche de personnes
-            'sherlock': self._check_tool('sherlock'),
-            'maigret': self._check_tool('maigret'),
-            'phoneinfoga': self._check_tool('phoneinfoga'),
-            'holehe': self._check_tool('holehe'),
-            # Métadonnées
-            'metagoofil': self._check_tool('metagoofil'),
-            'exiftool': self._check_tool('exiftool'),
-            # Frameworks OSINT
-            'recon-ng': self._check_tool('recon-ng'),
-            # APIs CLI
-            'shodan': self._check_tool('shodan'),
-            'censys': self._check_tool('censys'),
+        # La détection coûte au moins un démarrage de WSL : elle est mémorisée pour
+        # le processus et dans le cache disque (partagé entre les workers)
+        cache_key = (WSL_DISTRO, WSL_USER, self.wsl_available)
+        with _tools_availability_lock:
+            availability = _tools_availability.get(cache_key)
+        if availability is None:
+            disk_key = osint_cache.make_key('osint_tools_availability', cache_key)
+            availability = osint_cache.get(disk_key)
+            if availability is None:
+                availability = self._detect_tools()
+                osint_cache.put(disk_key, availability, osint_cache.TOOLS_TTL)
+            with _tools_availability_lock:
+                _tools_availability[cache_key] = availability
+        
+        self.tools = dict(availability['tools'])
+        self.theharvester_cmd = availability['theharvester_cmd']
+    
+    def _detect_tools(self) -> Dict:
+        """
+        Détecte les outils OSINT installés (natifs ou via WSL)
+        
+        Returns:
+            Dictionnaire avec 'tools' (clé -> disponible) et 'theharvester_cmd'
+            (nom de l'exécutable TheHarvester à utiliser)
+        """
+        # Un seul appel WSL pour tous les outils
+        wsl_found = self._probe_wsl_tools(list(OSINT_TOOLS.values()) + ['theHarvester'])
+        if wsl_found is None and self.wsl_available:
+            # Vérification groupée impossible : un appel WSL par outil, lancés en parallèle
+            with ThreadPoolExecutor(max_workers=OSINT_MAX_CONCURRENT_TOOLS) as executor:
+                found = executor.map(self._check_tool, OSINT_TOOLS.values())
+                tools = dict(zip(OSINT_TOOLS, found))
+        else:
+            tools = {
+                key: self._check_tool(tool_name, wsl_found)
+                for key, tool_name in OSINT_TOOLS.items()
+            }
+        
+        # Nouveau nom de TheHarvester (theHarvester) si installé
+        if wsl_found is not None:
+            has_new_name = 'theHarvester' in wsl_found
+        else:
+            has_new_name = tools['theharvester'] and self._check_tool('theHarvester')
+        
+        return {
+            'tools': tools,
+            'theharvester_cmd': 'theHarvester' if has_new_name else 'theharvester'
         }
     
-    def _check_tool(self, tool_name: str) -> bool:
-        """Vérifie si un outil est disponible (natif ou via WSL)"""
+    def _probe_wsl_tools(self, tool_names: List[str]) -> Optional[set]:
+        """
+        Vérifie en un seul appel WSL quels outils sont installés
+        
+        Args:
+            tool_names: Noms des exécutables à rechercher
+        
+        Returns:
+            Ensemble des outils trouvés, ou None si la vérification groupée a échoué
+        """
+        if not self.wsl_available:
+            return None
+        
+        script = (
+            f'for t in {" ".join(shlex.quote(name) for name in tool_names)}; do '
+            'if command -v "$t" >/dev/null 2>&1; then echo "__FOUND__$t"; else echo "__MISS__$t"; fi; '
+            'done'
+        )
+        try:
+            result = subprocess.run(
+                self.wsl_cmd_base + ['bash', '-c', script],
+                capture_output=True,
+                text=True,
+                timeout=15
+            )
+        except Exception as e:
+            logger.debug(f'Vérification groupée des outils WSL impossible: {e}')
+            return None
+        
+        found = set()
+        checked = 0
+        for line in result.stdout.splitlines():
+            line = line.strip()
+            if line.startswith('__FOUND__'):
+                found.add(line[len('__FOUND__'):])
+                checked += 1
+            elif line.startswith('__MISS__'):
+                checked += 1
+        
+        # Sortie incomplète : revenir à la vérification outil par outil
+        if checked < len(tool_names):
+            return None
+        return found
+    
+    def _check_tool(self, tool_name: str, wsl_found: Optional[set] = None) -> bool:
+        """
+        Vérifie si un outil est disponible (natif ou via WSL)
+        
+        Args:
+            tool_name: Nom de l'exécutable
+            wsl_found: Résultat de _probe_wsl_tools (None pour interroger WSL outil par outil)
+        """
         if shutil.which(tool_name):
             return True
+        if wsl_found is not None:
+            # Pour theharvester, accepter aussi theHarvester (nouveau nom)
+            return tool_name in wsl_found or (tool_name == 'theharvester' and 'theHarvester' in wsl_found)
         if self.wsl_available:
             # Essayer d'abord avec l'utilisateur configuré
             try:
@@ -141,151 +623,340 @@ class OSINTAnalyzer:
         """
         Supprime les codes ANSI (couleurs) d'un texte
         """
-        import re
         # Supprimer les codes ANSI (ESC[ ... m)
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        return _ANSI_RE.sub('', text)
+    
+    def _wsl_exec_base(self) -> List[str]:
+        """
+        Commande WSL de base pour lancer un outil
+        
+        Avec WSL_ENV_BYPASS, l'outil est lancé directement (--exec) avec
+        l'environnement de login mémorisé, sans shell intermédiaire.
+        """
+        if WSL_ENV_BYPASS:
+            return self.wsl_cmd_base + wsl_shell.get_env_prefix(self.wsl_cmd_base)
+        return self.wsl_cmd_base
     
-    def _run_wsl_command(self, command: List[str], timeout: int = 30) -> Dict:
+    def _run_wsl_command(self, command: List[str], timeout: int = 30, cache_ttl: int = None,
+                         max_stdout_bytes: int = None) -> Dict:
         """
         Exécute une commande via WSL
         Optimisé pour réduire la surcharge de démarrage WSL
         Gère les cas où l'utilisateur spécifié ne fonctionne pas
+        
+        Args:
+            command: Commande et arguments
+            timeout: Timeout en secondes
+            cache_ttl: Si fourni, durée (secondes) de mise en cache des résultats réussis
+            max_stdout_bytes: Si fourni, seul le début de stdout est lu et la commande
+                est arrêtée au-delà (pour les outils dont on ne garde qu'un extrait)
         """
         if not self.wsl_available:
             return {'error': 'WSL non disponible'}
         
-        # Remplacer theharvester par theHarvester si nécessaire
+        if cache_ttl:
+            cache_key = osint_cache.make_key(
+                'wsl', command, {'max_stdout_bytes': max_stdout_bytes} if max_stdout_bytes else None
+            )
+            cached_result = osint_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+            result = self._run_wsl_command(command, timeout, max_stdout_bytes=max_stdout_bytes)
+            if result.get('success'):
+                osint_cache.put(cache_key, result, cache_ttl)
+            return result
+        
+        # Remplacer theharvester par theHarvester si nécessaire (détecté au démarrage)
         if len(command) > 0 and command[0] == 'theharvester':
-            # Vérifier si theHarvester existe
+            command[0] = self.theharvester_cmd
+        
+        # Réutiliser un shell WSL déjà démarré (évite le coût de lancement de wsl.exe)
+        if WSL_PERSISTENT_SHELL:
             try:
-                result = subprocess.run(
-                    self.wsl_cmd_base + ['which', 'theHarvester'],
-                    capture_output=True,
-                    text=True,
-                    timeout=3
+                return wsl_shell.get_pool(self._wsl_exec_base() + ['bash'], WSL_DISTRO).run(
+                    command, timeout, max_stdout_bytes
                 )
-                if result.returncode == 0:
-                    command[0] = 'theHarvester'
-            except:
-                pass
+            except Exception as e:
+                logger.debug(f'Shell WSL persistant indisponible, appel direct: {e}')
         
-        # Essayer d'abord avec l'utilisateur configuré
+        # Essayer d'abord avec l'utilisateur configuré (outil tué côté Linux au timeout,
+        # arbre de processus tué côté Windows si WSL ne répond plus)
+        linux_command = wsl_shell.with_linux_timeout(command, timeout)
         try:
-            cmd = self.wsl_cmd_base + command
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='ignore',
-                timeout=timeout,
-                start_new_session=False
-            )
-            return {
-                'success': result.returncode == 0,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'returncode': result.returncode
-            }
-        except subprocess.TimeoutExpired:
-            return {'error': 'Timeout'}
+            return wsl_shell.run_process(self._wsl_exec_base() + linux_command, timeout, WSL_DISTRO, max_stdout_bytes)
         except Exception as e:
             # Si ça échoue avec l'utilisateur, essayer sans
             try:
-                cmd = ['wsl', '-d', WSL_DISTRO] + command
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    errors='ignore',
-                    timeout=timeout,
-                    start_new_session=False
-                )
-                return {
-                    'success': result.returncode == 0,
-                    'stdout': result.stdout,
-                    'stderr': result.stderr,
-                    'returncode': result.returncode
-                }
-            except subprocess.TimeoutExpired:
-                return {'error': 'Timeout'}
+                return wsl_shell.run_process(['wsl', '-d', WSL_DISTRO] + linux_command, timeout, WSL_DISTRO,
+                                             max_stdout_bytes)
             except Exception as e2:
                 return {'error': str(e2)}
     
+    def _iter_wsl_lines(self, command: List[str], timeout: int = 30, needle: bytes = None) -> Iterator[str]:
+        """
+        Exécute une commande via WSL et produit sa sortie ligne par ligne
+        
+        La sortie est analysée au fil de l'eau au lieu d'être chargée en entier
+        en mémoire. Arrêter la lecture (break) tue la commande. En cas de timeout,
+        les lignes déjà produites restent exploitables.
+        
+        Args:
+            command: Commande et arguments
+            timeout: Timeout en secondes
+            needle: Si fourni, les lignes ne contenant pas ces octets sont écartées
+                avant décodage (le parseur ne voit que les lignes utiles)
+        
+        Yields:
+            Lignes de stdout (sans le saut de ligne final)
+        """
+        if not self.wsl_available:
+            return
+        
+        if WSL_PERSISTENT_SHELL:
+            lines = wsl_shell.get_pool(self._wsl_exec_base() + ['bash'], WSL_DISTRO).iter_lines(command, timeout, needle)
+            started = False
+            try:
+                for line in lines:
+                    started = True
+                    yield line
+                return
+            except Exception as e:
+                if started:
+                    logger.debug(f'Lecture de {command[0]} interrompue: {e}')
+                    return
+                logger.debug(f'Shell WSL persistant indisponible, appel direct: {e}')
+            finally:
+                lines.close()
+        
+        try:
+            process = subprocess.Popen(
+                self._wsl_exec_base() + wsl_shell.with_linux_timeout(command, timeout),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except Exception as e:
+            logger.debug(f'Erreur lancement de {command[0]}: {e}')
+            return
+        
+        def watchdog():
+            # WSL ne répond plus malgré le timeout côté Linux
+            wsl_shell.kill_process_tree(process)
+            wsl_shell.report_hang(WSL_DISTRO)
+        
+        timer = threading.Timer(wsl_shell.watchdog_timeout(timeout), watchdog)
+        timer.start()
+        try:
+            for line in process.stdout:
+                if needle is None or needle in line:
+                    yield wsl_shell.decode_output(line.rstrip(b'\n'))
+        finally:
+            timer.cancel()
+            if process.poll() is None:
+                wsl_shell.kill_process_tree(process)
+            process.stdout.close()
+            process.wait()
+    
+    @cached(ttl=osint_cache.SUBDOMAINS_TTL)
     def discover_subdomains(self, domain: str, progress_callback=None) -> List[str]:
         """
         Découvre les sous-domaines d'un domaine
         Utilise plusieurs outils : sublist3r, amass, dnsrecon
+        Les outils sont indépendants et sont donc lancés en parallèle
         """
         subdomains = set()
         
+        runners = {
+            'sublist3r': ('Sublist3r', self._subdomains_from_sublist3r),
+            'amass': ('Amass', self._subdomains_from_amass),
+            'dnsrecon': ('DNSrecon', self._subdomains_from_dnsrecon),
+        }
+        
         # Vérifier si des outils sont disponibles
-        available_tools = [k for k, v in self.tools.items() if v and k in ['sublist3r', 'amass', 'dnsrecon']]
+        available_tools = [tool for tool in runners if self.tools[tool]]
         if not available_tools:
             if progress_callback:
                 progress_callback('Aucun outil de découverte de sous-domaines disponible')
             return []
         
-        # Sublist3r
-        if self.tools['sublist3r']:
+        if len(available_tools) > 1:
+            # Un seul aller-retour WSL : les outils tournent en parallèle côté Linux
             if progress_callback:
-                progress_callback('Recherche avec Sublist3r...')
-            try:
-                result = self._run_wsl_command(['sublist3r', '-d', domain, '-t', '10'], timeout=30)
-                if result.get('success'):
-                    for line in result['stdout'].split('\n'):
-                        if domain in line and '.' in line:
-                            subdomain = line.strip().split()[0] if ' ' in line else line.strip()
-                            if subdomain.endswith(domain):
-                                subdomains.add(subdomain)
-                elif result.get('error') and 'Timeout' not in result['error']:
-                    # Erreur autre que timeout, on continue
-                    pass
-            except Exception as e:
-                # Erreur lors de l'exécution, on continue avec les autres outils
-                pass
-        
-        # Amass (plus long, on le fait en dernier)
-        if self.tools['amass']:
-            if progress_callback:
-                progress_callback('Recherche avec Amass...')
-            try:
-                result = self._run_wsl_command(['amass', 'enum', '-d', domain, '-passive'], timeout=45)
-                if result.get('success'):
-                    for line in result['stdout'].split('\n'):
-                        if domain in line:
-                            subdomain = line.strip()
-                            if subdomain.endswith(domain):
-                                subdomains.add(subdomain)
-                elif result.get('error') and 'Timeout' not in result['error']:
-                    pass
-            except Exception as e:
-                pass
-        
-        # DNSrecon
-        if self.tools['dnsrecon']:
+                labels = ', '.join(runners[tool][0] for tool in available_tools)
+                progress_callback(f'Recherche avec {labels}...')
+            subdomains.update(self._subdomains_from_fused_run(domain, available_tools))
+        else:
+            label, runner = runners[available_tools[0]]
             if progress_callback:
-                progress_callback('Recherche avec DNSrecon...')
+                progress_callback(f'Recherche avec {label}...')
             try:
-                result = self._run_wsl_command(['dnsrecon', '-d', domain, '-t', 'brt'], timeout=30)
-                if result.get('success'):
-                    for line in result['stdout'].split('\n'):
-                        if 'Found' in line or domain in line:
-                            match = re.search(r'([a-zA-Z0-9.-]+\.' + domain.replace('.', r'\.') + ')', line)
-                            if match:
-                                subdomains.add(match.group(1))
-                elif result.get('error') and 'Timeout' not in result['error']:
-                    pass
+                subdomains.update(runner(domain))
             except Exception as e:
-                pass
+                logger.debug(f'Erreur {available_tools[0]} pour {domain}: {e}')
         
         if progress_callback:
             progress_callback(f'{len(subdomains)} sous-domaines trouvés')
         
         return sorted(list(subdomains))
     
+    def _subdomain_commands(self, domain: str) -> Dict[str, tuple]:
+        """
+        Commandes des outils de découverte de sous-domaines
+        
+        Returns:
+            Dictionnaire outil -> (commande, timeout en secondes)
+        """
+        return {
+            'sublist3r': (['sublist3r', '-d', domain, '-t', '10'], 30),
+            'amass': (['amass', 'enum', '-d', domain, '-passive'], 45),
+            'dnsrecon': (['dnsrecon', '-d', domain, '-t', 'brt'], 30),
+        }
+    
+    def _subdomains_from_sublist3r(self, domain: str) -> set:
+        """Découverte de sous-domaines avec Sublist3r"""
+        command, timeout = self._subdomain_commands(domain)['sublist3r']
+        return self._collect_subdomains(command, domain, timeout=timeout)
+    
+    def _subdomains_from_amass(self, domain: str) -> set:
+        """Découverte de sous-domaines avec Amass (mode passif)"""
+        command, timeout = self._subdomain_commands(domain)['amass']
+        return self._collect_subdomains(command, domain, timeout=timeout)
+    
+    def _subdomains_from_dnsrecon(self, domain: str) -> set:
+        """Découverte de sous-domaines avec DNSrecon (brute force)"""
+        command, timeout = self._subdomain_commands(domain)['dnsrecon']
+        return self._collect_subdomains(command, domain, timeout=timeout)
+    
+    def _subdomains_from_fused_run(self, domain: str, tools: List[str]) -> set:
+        """
+        Lance plusieurs outils de découverte dans un seul appel WSL
+        
+        Chaque outil tourne en arrière-plan (avec son propre timeout) et écrit
+        dans un fichier temporaire ; les sorties sont ensuite affichées l'une
+        après l'autre, précédées d'un marqueur de section.
+        
+        Args:
+            domain: Domaine analysé
+            tools: Outils à lancer (clés de _subdomain_commands)
+        
+        Returns:
+            set: Sous-domaines trouvés (en minuscules)
+        """
+        commands = self._subdomain_commands(domain)
+        launches = []
+        for tool in tools:
+            command, timeout = commands[tool]
+            tool_command = shlex.join(wsl_shell.with_linux_timeout(command, timeout))
+            launches.append(f'{tool_command} >"$tmp/{tool}" 2>/dev/null </dev/null &')
+        script = (
+            'tmp=$(mktemp -d); '
+            + ' '.join(launches)
+            + f' wait; for t in {" ".join(tools)}; do echo "{_SECTION_MARKER}$t"; cat "$tmp/$t" 2>/dev/null; done; '
+            'rm -rf "$tmp"'
+        )
+        fused_timeout = max(commands[tool][1] for tool in tools) + wsl_shell.KILL_AFTER_SECONDS + 5
+        
+        subdomains = set()
+        subdomain_re = _subdomain_pattern(domain)
+        tool = None
+        tool_count = 0
+        for line in self._iter_wsl_lines(['bash', '-c', script], timeout=fused_timeout):
+            if line.startswith(_SECTION_MARKER):
+                tool = line[len(_SECTION_MARKER):]
+                tool_count = 0
+                continue
+            if domain not in line or tool_count >= MAX_SUBDOMAINS_PER_TOOL:
+                continue
+            for subdomain in subdomain_re.findall(line):
+                subdomain = subdomain.lower()
+                if subdomain not in subdomains:
+                    subdomains.add(subdomain)
+                    tool_count += 1
+        return subdomains
+    
+    def _collect_subdomains(self, command: List[str], domain: str, timeout: int = 30) -> set:
+        """
+        Exécute un outil de découverte et extrait les sous-domaines de sa sortie
+        
+        Args:
+            command: Commande de l'outil
+            domain: Domaine analysé
+            timeout: Timeout en secondes
+        
+        Returns:
+            set: Sous-domaines trouvés (en minuscules)
+        """
+        subdomains = set()
+        subdomain_re = _subdomain_pattern(domain)
+        # Seules les lignes contenant le domaine sont décodées puis passées à la regex
+        for line in self._iter_wsl_lines(command, timeout=timeout, needle=domain.encode('utf-8')):
+            for subdomain in subdomain_re.findall(line):
+                subdomains.add(subdomain.lower())
+            if len(subdomains) >= MAX_SUBDOMAINS_PER_TOOL:
+                break
+        return subdomains
+    
+    def _resolve(self, domain: str) -> Optional[str]:
+        """
+        Résout un domaine en adresse IP (une seule requête DNS par domaine)
+        
+        Args:
+            domain: Domaine à résoudre
+        
+        Returns:
+            str: Adresse IP, ou None si la résolution échoue
+        """
+        if domain not in self._dns_cache:
+            try:
+                self._dns_cache[domain] = socket.gethostbyname(domain)
+            except (socket.error, UnicodeError) as e:
+                logger.debug(f'Résolution DNS impossible pour {domain}: {e}')
+                self._dns_cache[domain] = None
+        return self._dns_cache[domain]
+    
+    def _reverse_resolve(self, ip: str) -> Optional[str]:
+        """
+        Résolution inverse d'une adresse IP (mémorisée comme _resolve)
+        
+        Args:
+            ip: Adresse IP
+        
+        Returns:
+            str: Nom d'hôte, ou None si la résolution inverse échoue
+        """
+        if ip not in self._hostname_cache:
+            try:
+                self._hostname_cache[ip] = socket.gethostbyaddr(ip)[0]
+            except (socket.error, UnicodeError) as e:
+                logger.debug(f'Résolution inverse impossible pour {ip}: {e}')
+                self._hostname_cache[ip] = None
+        return self._hostname_cache[ip]
+    
+    def _get_soup(self, url: str) -> Optional[BeautifulSoup]:
+        """
+        Télécharge une page et l'analyse avec lxml (une seule fois par URL)
+        
+        Args:
+            url: URL de la page
+        
+        Returns:
+            BeautifulSoup: Arbre de la page (à ne pas modifier, il est partagé),
+            ou None si la page n'a pas pu être récupérée
+        """
+        if url in self._html_cache:
+            return self._html_cache[url]
+        
+        soup = None
+        try:
+            response = self.session.get(url, timeout=10)
+            if response.status_code == 200:
+                soup = BeautifulSoup(response.content, 'lxml')
+        except Exception as e:
+            logger.debug(f'Erreur téléchargement de {url}: {e}')
+        self._html_cache[url] = soup
+        return soup
+    
+    @cached(ttl=osint_cache.DNS_TTL)
     def get_dns_records(self, domain: str) -> Dict:
         """Récupère les enregistrements DNS d'un domaine"""
         records = {}
@@ -294,53 +965,34 @@ class OSINTAnalyzer:
             return {'error': 'dnspython non installé'}
         
         try:
-            # Enregistrements A
-            try:
-                answers = dns.resolver.resolve(domain, 'A')
-                records['A'] = [str(rdata) for rdata in answers]
-            except:
-                records['A'] = []
-            
-            # Enregistrements AAAA (IPv6)
-            try:
-                answers = dns.resolver.resolve(domain, 'AAAA')
-                records['AAAA'] = [str(rdata) for rdata in answers]
-            except:
-                records['AAAA'] = []
-            
-            # Enregistrements MX
-            try:
-                answers = dns.resolver.resolve(domain, 'MX')
-                records['MX'] = [str(rdata.exchange) for rdata in answers]
-            except:
-                records['MX'] = []
-            
-            # Enregistrements NS
-            try:
-                answers = dns.resolver.resolve(domain, 'NS')
-                records['NS'] = [str(rdata) for rdata in answers]
-            except:
-                records['NS'] = []
+            resolver = _get_dns_resolver()
             
-            # Enregistrements TXT
-            try:
-                answers = dns.resolver.resolve(domain, 'TXT')
-                records['TXT'] = [str(rdata) for rdata in answers]
-            except:
-                records['TXT'] = []
+            def resolve_records(record_type):
+                try:
+                    answers = resolver.resolve(domain, record_type)
+                except Exception:
+                    return None
+                if record_type == 'MX':
+                    return [str(rdata.exchange) for rdata in answers]
+                return [str(rdata) for rdata in answers]
             
-            # Enregistrements CNAME
-            try:
-                answers = dns.resolver.resolve(domain, 'CNAME')
-                records['CNAME'] = [str(rdata) for rdata in answers]
-            except:
-                records['CNAME'] = []
+            # Les requêtes sont indépendantes : les lancer en parallèle (latence ~1 aller-retour)
+            answered = False
+            with ThreadPoolExecutor(max_workers=len(DNS_RECORD_TYPES)) as executor:
+                for record_type, values in zip(DNS_RECORD_TYPES, executor.map(resolve_records, DNS_RECORD_TYPES)):
+                    records[record_type] = values or []
+                    answered = answered or values is not None
+            # Aucune requête n'a abouti (résolveur indisponible, domaine inexistant) :
+            # signalé comme erreur pour ne pas mettre en cache un résultat vide
+            if not answered:
+                records['error'] = f'Aucune réponse DNS pour {domain}'
         
         except Exception as e:
             records['error'] = str(e)
         
         return records
     
+    @cached(ttl=osint_cache.WHOIS_TTL)
     def get_whois_info(self, domain: str) -> Dict:
         """Récupère les informations WHOIS d'un domaine"""
         if not whois:
@@ -348,16 +1000,10 @@ class OSINTAnalyzer:
         
         try:
             w = whois.whois(domain)
+            # Dates converties en texte (sérialisation JSON)
             return {
-                'domain_name': w.domain_name,
-                'registrar': w.registrar,
-                'creation_date': str(w.creation_date) if w.creation_date else None,
-                'expiration_date': str(w.expiration_date) if w.expiration_date else None,
-                'updated_date': str(w.updated_date) if w.updated_date else None,
-                'name_servers': w.name_servers,
-                'emails': w.emails,
-                'country': w.country,
-                'org': w.org
+                field: (str(value) if value else None) if field.endswith('_date') else value
+                for field, value in zip(_WHOIS_FIELDS, _whois_getter(w))
             }
         except Exception as e:
             return {'error': str(e)}
@@ -381,65 +1027,97 @@ class OSINTAnalyzer:
             return []
         
         # Si on a des noms, utiliser une recherche plus ciblée et rapide
+        name_terms = None
         if names and len(names) > 0:
             # Utiliser seulement les sources les plus rapides et efficaces avec les noms
             sources = ['google', 'bing']  # Sources rapides pour recherche avec noms
+            command_options = [
+                '-l', '50',  # Réduire le nombre de résultats pour aller plus vite
+                '-s', '0'  # Start à 0
+            ]
+            timeout = 30  # Réduire le timeout
             
+            # La commande ne dépend pas du nom : chaque source n'est interrogée qu'une
+            # fois et les lignes sont filtrées sur l'ensemble des noms recherchés
+            name_terms = []
             for name_data in names[:5]:  # Limiter à 5 noms pour éviter trop de requêtes
                 first_name = name_data.get('first_name', '')
                 last_name = name_data.get('last_name', '')
-                full_name = name_data.get('full_name', f'{first_name} {last_name}'.strip())
-                
-                if not first_name or not last_name:
-                    continue
-                
-                for source in sources:
-                    if progress_callback:
-                        progress_callback(f'Recherche d\'emails pour {full_name} via {source}...')
-                    
-                    # Recherche ciblée avec le nom complet
-                    result = self._run_wsl_command([
-                        'theHarvester',
-                        '-d', domain,
-                        '-b', source,
-                        '-l', '50',  # Réduire le nombre de résultats pour aller plus vite
-                        '-s', '0'  # Start à 0
-                    ], timeout=30)  # Réduire le timeout
-                    
-                    if result.get('success'):
-                        for line in result['stdout'].split('\n'):
-                            # Vérifier si le nom apparaît dans la ligne (recherche ciblée)
-                            if first_name.lower() in line.lower() or last_name.lower() in line.lower():
-                                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                                found_emails = re.findall(email_pattern, line)
-                                for email in found_emails:
-                                    if domain in email:
-                                        emails.add(email.lower())
+                if first_name and last_name:
+                    name_terms.append((first_name.lower(), last_name.lower()))
+            
+            if not name_terms:
+                return []
+            
+            if progress_callback:
+                progress_callback(
+                    f'Recherche d\'emails pour {len(name_terms)} nom(s) via {", ".join(sources)}...'
+                )
         else:
             # Recherche générique sans noms (plus lente)
             sources = ['google', 'bing', 'linkedin', 'twitter', 'github']
-            for source in sources:
-                if progress_callback:
-                    progress_callback(f'Recherche d\'emails via {source}...')
-                
-                result = self._run_wsl_command([
-                    'theHarvester',
-                    '-d', domain,
-                    '-b', source,
-                    '-l', '100'  # Augmenter le nombre de résultats
-                ], timeout=60)
+            command_options = ['-l', '100']  # Augmenter le nombre de résultats
+            timeout = 60
+            
+            if progress_callback:
+                progress_callback(f'Recherche d\'emails via {", ".join(sources)}...')
+        
+        # Les sources sont indépendantes : les interroger en parallèle (nombre borné)
+        max_workers = max(1, min(OSINT_MAX_CONCURRENT_TOOLS, len(sources)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._harvest_emails_from_source,
+                    domain, source, command_options, timeout, name_terms
+                ): source
+                for source in sources
+            }
+            
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    emails.update(future.result())
+                except Exception as e:
+                    logger.debug(f'Erreur theHarvester ({source}) pour {domain}: {e}')
+                    continue
                 
-                if result.get('success'):
-                    for line in result['stdout'].split('\n'):
-                        # Extraire les emails
-                        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                        found_emails = re.findall(email_pattern, line)
-                        for email in found_emails:
-                            if domain in email:
-                                emails.add(email.lower())
+                if progress_callback:
+                    progress_callback(f'Recherche d\'emails via {source} terminée ({len(emails)} email(s))')
         
         return sorted(list(emails))
     
+    def _harvest_emails_from_source(self, domain: str, source: str, command_options: List[str],
+                                    timeout: int, name_terms: List[tuple] = None) -> set:
+        """
+        Interroge une source TheHarvester et extrait les emails au fil de la sortie
+        
+        Args:
+            domain: Domaine à analyser
+            source: Source TheHarvester (google, bing...)
+            command_options: Options supplémentaires de la commande
+            timeout: Timeout en secondes
+            name_terms: Couples (prénom, nom) en minuscules ; si fourni, seules les
+                lignes contenant un de ces noms sont analysées
+        
+        Returns:
+            set: Emails trouvés (en minuscules)
+        """
+        emails = set()
+        domain_lower = domain.lower()
+        command = ['theHarvester', '-d', domain, '-b', source] + command_options
+        for line in self._iter_wsl_lines(command, timeout, needle=b'@'):
+            # Un email du domaine contient forcément le domaine : écarter les autres lignes sans les analyser
+            line_lower = line.lower()
+            if domain_lower not in line_lower:
+                continue
+            # Recherche ciblée : vérifier si un des noms apparaît dans la ligne
+            if name_terms is not None:
+                if not any(first in line_lower or last in line_lower for first, last in name_terms):
+                    continue
+            # L'ensemble déduplique les emails retrouvés sur plusieurs lignes ou sources
+            emails.update(_extract_emails(line_lower, domain_lower))
+        return emails
+    
     def find_people_from_emails(self, emails: List[str], domain: str) -> List[Dict]:
         """
         Extrait les noms de personnes depuis les emails trouvés
@@ -451,18 +1129,8 @@ class OSINTAnalyzer:
         
         for email in emails:
             # Extraire le nom depuis l'email (ex: jean.dupont@domain.com -> Jean Dupont)
-            local_part = email.split('@')[0]
-            
-            # Patterns courants
-            name_parts = []
-            if '.' in local_part:
-                parts = local_part.split('.')
-                # Filtrer les parties qui ressemblent à des noms (pas des chiffres, pas trop courtes)
-                for part in parts:
-                    if len(part) > 2 and part.isalpha():
-                        name_parts.append(part.capitalize())
-            
-            person_name = ' '.join(name_parts) if name_parts else local_part
+            local_part = email.partition('@')[0]
+            person_name = _name_from_local_part(local_part)
             
             # Filtrer les noms invalides (lieux, entreprises, fonctions, etc.)
             if not person_name or not is_valid_human_name(person_name):
@@ -479,6 +1147,7 @@ class OSINTAnalyzer:
         
         return people
     
+    @cached(ttl=osint_cache.PEOPLE_TTL)
     def search_linkedin_people(self, domain: str, progress_callback=None) -> List[Dict]:
         """
         Recherche des personnes sur LinkedIn liées au domaine
@@ -492,22 +1161,16 @@ class OSINTAnalyzer:
         if progress_callback:
             progress_callback('Recherche de personnes sur LinkedIn...')
         
-        result = self._run_wsl_command([
+        lines = self._iter_wsl_lines([
             'theHarvester',
             '-d', domain,
             '-b', 'linkedin',
             '-l', '200'
-        ], timeout=90)
+        ], timeout=90, needle=b'http')
         
-        if result.get('success'):
-            output = result['stdout']
-            # Parser les résultats LinkedIn de TheHarvester
-            # Format typique: "Name - Title - LinkedIn URL"
-            linkedin_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*-\s*([^-]+?)\s*-\s*(https?://[^\s]+)'
-            matches = re.findall(linkedin_pattern, output)
-            
-            for match in matches:
-                name, title, url = match
+        # Parser les résultats LinkedIn de TheHarvester au fil de la sortie
+        for line in lines:
+            for name, title, url in _LINKEDIN_RE.findall(line):
                 person = {
                     'name': name.strip(),
                     'title': title.strip(),
@@ -522,65 +1185,68 @@ class OSINTAnalyzer:
         """
         Recherche des profils sur les réseaux sociaux pour une liste d'utilisateurs
         Utilise Sherlock ou Maigret si disponibles
+        
+        Les utilisateurs sont recherchés en parallèle (au plus SOCIAL_MEDIA_MAX_CONCURRENT
+        à la fois pour limiter le rate-limiting des sites interrogés).
         """
         profiles = {}
         
-        # Essayer d'abord Maigret (plus moderne)
+        # Essayer d'abord Maigret (plus moderne), sinon Sherlock
         if self.tools['maigret']:
-            for username in usernames[:5]:  # Limiter pour éviter les timeouts
-                if progress_callback:
-                    progress_callback(f'Recherche de profils pour {username}...')
-                
-                result = self._run_wsl_command([
-                    'maigret',
-                    username,
-                    '--no-color',
-                    '--print-found'
-                ], timeout=60)
-                
-                if result.get('success'):
-                    found_profiles = []
-                    for line in result['stdout'].split('\n'):
-                        if 'Found:' in line or 'http' in line:
-                            # Parser les résultats Maigret
-                            if 'http' in line:
-                                url_match = re.search(r'(https?://[^\s]+)', line)
-                                if url_match:
-                                    found_profiles.append({
-                                        'url': url_match.group(1),
-                                        'source': 'maigret'
-                                    })
-                    if found_profiles:
-                        profiles[username] = found_profiles
-        
-        # Sinon essayer Sherlock
+            tool = 'maigret'
         elif self.tools['sherlock']:
-            for username in usernames[:5]:
-                if progress_callback:
-                    progress_callback(f'Recherche de profils pour {username}...')
-                
-                result = self._run_wsl_command([
-                    'sherlock',
-                    username,
-                    '--no-color',
-                    '--print-found'
-                ], timeout=60)
+            tool = 'sherlock'
+        else:
+            return profiles
+        
+        usernames = usernames[:5]  # Limiter pour éviter les timeouts
+        if not usernames:
+            return profiles
+        
+        if progress_callback:
+            progress_callback(f'Recherche de profils pour {", ".join(usernames)}...')
+        
+        max_workers = min(SOCIAL_MEDIA_MAX_CONCURRENT, len(usernames))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._run_wsl_command,
+                    [tool, username, '--no-color', '--print-found'],
+                    60
+                ): username
+                for username in usernames
+            }
+            
+            found = {}
+            for future in as_completed(futures):
+                username = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.debug(f'Erreur {tool} pour {username}: {e}')
+                    continue
                 
                 if result.get('success'):
                     found_profiles = []
                     for line in result['stdout'].split('\n'):
-                        if 'Found:' in line or 'http' in line:
-                            url_match = re.search(r'(https?://[^\s]+)', line)
+                        if 'http' in line:
+                            url_match = _URL_RE.search(line)
                             if url_match:
                                 found_profiles.append({
                                     'url': url_match.group(1),
-                                    'source': 'sherlock'
+                                    'source': tool
                                 })
                     if found_profiles:
-                        profiles[username] = found_profiles
+                        found[username] = found_profiles
+        
+        # Conserver l'ordre des utilisateurs demandés
+        for username in usernames:
+            if username in found:
+                profiles[username] = found[username]
         
         return profiles
     
+    @cached(ttl=osint_cache.PHONE_TTL)
     def analyze_phones_osint(self, phones: List[str], progress_callback=None) -> Dict:
         """
         Analyse OSINT approfondie des numéros de téléphone
@@ -594,83 +1260,119 @@ class OSINTAnalyzer:
             Dictionnaire avec les informations trouvées pour chaque téléphone
         """
         phone_data = {}
+        phones = phones[:5]  # Limiter à 5 pour éviter les timeouts
+        if not phones:
+            return phone_data
         
-        for phone in phones[:5]:  # Limiter à 5 pour éviter les timeouts
-            if progress_callback:
-                progress_callback(f'Analyse OSINT du téléphone {phone}...')
-            
-            phone_info = {
-                'phone': phone,
-                'carrier': None,
-                'location': None,
-                'line_type': None,
-                'valid': None,
-                'social_profiles': [],
-                'data_breaches': [],
-                'sources': []
+        if progress_callback:
+            progress_callback(f'Analyse OSINT de {len(phones)} téléphone(s)...')
+        
+        # Session HTTP de l'analyseur (connexions réutilisées) et les téléphones en parallèle
+        results = {}
+        max_workers = max(1, min(OSINT_MAX_CONCURRENT_TOOLS, len(phones)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._analyze_phone, phone, self.session): phone
+                for phone in phones
             }
-            
-            # Utiliser PhoneInfoga si disponible
-            if self.tools.get('phoneinfoga'):
+            for future in as_completed(futures):
+                phone = futures[future]
                 try:
-                    result = self._run_wsl_command([
-                        'phoneinfoga',
-                        'scan',
-                        '--number', phone,
-                        '--output', 'json'
-                    ], timeout=30)
-                    
-                    if result.get('success'):
-                        try:
-                            phoneinfoga_data = json.loads(result['stdout'])
-                            if isinstance(phoneinfoga_data, dict):
-                                phone_info['carrier'] = phoneinfoga_data.get('carrier')
-                                phone_info['location'] = phoneinfoga_data.get('location')
-                                phone_info['line_type'] = phoneinfoga_data.get('line_type')
-                                phone_info['valid'] = phoneinfoga_data.get('valid')
-                                phone_info['sources'].append('phoneinfoga')
-                        except:
-                            # Parser le texte si JSON échoue
-                            output = result['stdout']
-                            if 'Carrier:' in output:
-                                carrier_match = re.search(r'Carrier:\s*([^\n]+)', output)
-                                if carrier_match:
-                                    phone_info['carrier'] = carrier_match.group(1).strip()
-                            if 'Location:' in output:
-                                loc_match = re.search(r'Location:\s*([^\n]+)', output)
-                                if loc_match:
-                                    phone_info['location'] = loc_match.group(1).strip()
+                    results[phone] = future.result()
                 except Exception as e:
-                    logger.debug(f'Erreur PhoneInfoga pour {phone}: {e}')
-            
-            # Recherche via APIs publiques
+                    logger.debug(f'Erreur analyse OSINT du téléphone {phone}: {e}')
+                    continue
+                if progress_callback:
+                    progress_callback(f'Analyse OSINT du téléphone {phone} terminée')
+        
+        # Conserver l'ordre des téléphones demandés. Un téléphone pour lequel aucune
+        # source n'a répondu (ni PhoneInfoga ni la recherche web) n'est pas retourné :
+        # un échec passager ne doit pas être mis en cache comme un résultat
+        for phone in phones:
+            phone_info = results.get(phone)
+            if phone_info and (phone_info['sources'] or 'web_mentions' in phone_info):
+                phone_data[phone] = phone_info
+        
+        return phone_data
+    
+    def _analyze_phone(self, phone: str, session: requests.Session = None) -> Dict:
+        """
+        Analyse OSINT d'un numéro de téléphone (PhoneInfoga puis recherche web)
+        
+        Args:
+            phone: Numéro de téléphone
+            session: Session HTTP partagée (optionnelle)
+        
+        Returns:
+            Dictionnaire au format PHONE_OSINT_FIELDS
+        """
+        phone_info = _new_osint_record(PHONE_OSINT_FIELDS, phone=phone)
+        
+        # Utiliser PhoneInfoga si disponible
+        if self.tools.get('phoneinfoga'):
             try:
-                search_results = self._search_phone_online(phone)
-                if search_results:
-                    phone_info.update(search_results)
+                result = self._run_wsl_command([
+                    'phoneinfoga',
+                    'scan',
+                    '--number', phone,
+                    '--output', 'json'
+                ], timeout=30)
+                
+                if result.get('success'):
+                    try:
+                        phoneinfoga_data = _json_loads(result['stdout'])
+                        if isinstance(phoneinfoga_data, dict):
+                            phone_info['carrier'] = phoneinfoga_data.get('carrier')
+                            phone_info['location'] = phoneinfoga_data.get('location')
+                            phone_info['line_type'] = phoneinfoga_data.get('line_type')
+                            phone_info['valid'] = phoneinfoga_data.get('valid')
+                            phone_info['sources'].append('phoneinfoga')
+                    except:
+                        # Parser le texte si JSON échoue
+                        output = result['stdout']
+                        if 'Carrier:' in output:
+                            carrier_match = _CARRIER_RE.search(output)
+                            if carrier_match:
+                                phone_info['carrier'] = carrier_match.group(1).strip()
+                        if 'Location:' in output:
+                            loc_match = _LOCATION_RE.search(output)
+                            if loc_match:
+                                phone_info['location'] = loc_match.group(1).strip()
+                        if phone_info['carrier'] or phone_info['location']:
+                            phone_info['sources'].append('phoneinfoga')
             except Exception as e:
-                logger.debug(f'Erreur recherche web pour {phone}: {e}')
-            
-            phone_data[phone] = phone_info
+                logger.debug(f'Erreur PhoneInfoga pour {phone}: {e}')
         
-        return phone_data
+        # Recherche via APIs publiques
+        try:
+            search_results = self._search_phone_online(phone, session)
+            if search_results:
+                phone_info.update(search_results)
+        except Exception as e:
+            logger.debug(f'Erreur recherche web pour {phone}: {e}')
+        
+        return phone_info
     
-    def _search_phone_online(self, phone: str) -> Dict:
+    def _search_phone_online(self, phone: str, session: requests.Session = None) -> Dict:
         """
         Recherche basique d'un téléphone en ligne
         Utilise des moteurs de recherche publics
+        
+        Args:
+            phone: Numéro de téléphone
+            session: Session HTTP à réutiliser (sinon requête isolée)
         """
         results = {}
         
         try:
-            clean_phone = re.sub(r'[^\d+]', '', phone)
+            clean_phone = _PHONE_STRIP_RE.sub('', phone)
             search_query = f'"{clean_phone}"'
             search_url = f'https://html.duckduckgo.com/html/?q={search_query}'
             
-            response = requests.get(search_url, headers=self.headers, timeout=10)
+            http = session or requests
+            response = http.get(search_url, headers=self.headers, timeout=10)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                results['web_mentions'] = len(soup.find_all('a', href=True))
+                results['web_mentions'] = len(_HREF_RE.findall(response.content))
         except Exception as e:
             logger.debug(f'Erreur recherche web téléphone: {e}')
         
@@ -707,31 +1409,7 @@ class OSINTAnalyzer:
             if progress_callback:
                 progress_callback(f'Analyse OSINT approfondie pour {person_name}...')
             
-            person_data = {
-                'original': person,
-                'location': None,
-                'location_city': None,
-                'location_country': None,
-                'location_address': None,
-                'location_latitude': None,
-                'location_longitude': None,
-                'age_range': None,
-                'birth_date': None,
-                'family_members': [],
-                'social_profiles': {},
-                'data_breaches': [],
-                'professional_history': [],
-                'addresses': [],
-                'photos': [],
-                'hobbies': [],
-                'interests': [],
-                'education': None,
-                'bio': None,
-                'languages': [],
-                'skills': [],
-                'certifications': [],
-                'sources': []
-            }
+            person_data = _new_osint_record(PERSON_OSINT_FIELDS, original=person)
             
             # Recherche via Holehe pour les emails (comptes sur différents sites)
             if person_email and self.tools.get('holehe'):
@@ -749,7 +1427,7 @@ class OSINTAnalyzer:
                         accounts = []
                         for line in output.split('\n'):
                             if '[' in line and ']' in line:
-                                site_match = re.search(r'\[\*\]\s*([^\s]+)', line)
+                                site_match = _HOLEHE_SITE_RE.search(line)
                                 if site_match:
                                     accounts.append(site_match.group(1).strip())
                         
@@ -835,11 +1513,9 @@ class OSINTAnalyzer:
                 search_query += f' "{domain}"'
             
             search_url = f'https://html.duckduckgo.com/html/?q={search_query}'
-            response = requests.get(search_url, headers=self.headers, timeout=10)
+            soup = self._get_soup(search_url)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
+            if soup is not None:
                 # Chercher des liens d'images
                 for img in soup.find_all('img'):
                     src = img.get('src') or img.get('data-src')
@@ -866,10 +1542,9 @@ class OSINTAnalyzer:
                 search_query += f' "{domain}"'
             
             search_url = f'https://html.duckduckgo.com/html/?q={search_query}'
-            response = requests.get(search_url, headers=self.headers, timeout=10)
+            soup = self._get_soup(search_url)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+            if soup is not None:
                 text = soup.get_text().lower()
                 
                 # Chercher des indices de localisation (ville, pays)
@@ -900,10 +1575,9 @@ class OSINTAnalyzer:
                 search_query += f' "{linkedin_url}"'
             
             search_url = f'https://html.duckduckgo.com/html/?q={search_query}'
-            response = requests.get(search_url, headers=self.headers, timeout=10)
+            soup = self._get_soup(search_url)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+            if soup is not None:
                 text = soup.get_text().lower()
                 
                 # Hobbies communs à chercher
@@ -966,10 +1640,8 @@ class OSINTAnalyzer:
             search_query = f'"{name}" "{domain}"'
             search_url = f'https://html.duckduckgo.com/html/?q={search_query}'
             
-            response = requests.get(search_url, headers=self.headers, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
+            soup = self._get_soup(search_url)
+            if soup is not None:
                 social_links = []
                 for link in soup.find_all('a', href=True):
                     href = link['href']
@@ -1224,7 +1896,7 @@ class OSINTAnalyzer:
                         'uniteLegale': result,
                         'total_results': data.get('total_results', 0)
                     }
-            
+        
         except Exception as e:
             # Si l'API ne fonctionne pas, on continue sans erreur
             # L'API peut nécessiter une clé API ou avoir des limitations
@@ -1324,7 +1996,7 @@ class OSINTAnalyzer:
                 ssl_info['tls_1_3'] = 'Activé' if 'enabled' in output.lower() else 'Désactivé'
             
             # Certificat
-            cert_match = re.search(r'Subject:\s*(.+)', output)
+            cert_match = _CERT_SUBJECT_RE.search(output)
             if cert_match:
                 ssl_info['certificate_subject'] = cert_match.group(1)
         
@@ -1394,7 +2066,7 @@ class OSINTAnalyzer:
                 output = result['stdout']
                 # Parser le JSON de testssl.sh
                 try:
-                    json_data = json.loads(output)
+                    json_data = _json_loads(output)
                     if isinstance(json_data, list):
                         for item in json_data:
                             ssl_details.append({
@@ -1408,7 +2080,7 @@ class OSINTAnalyzer:
                                 'cipher_suites': item.get('cipher'),
                                 'vulnerabilities': item.get('severity'),
                                 'grade': item.get('grade'),
-                                'details_json': json.dumps(item)
+                                'details_json': _json_dumps(item)
                             })
                 except json.JSONDecodeError:
                     # Si ce n'est pas du JSON, parser le texte
@@ -1438,12 +2110,12 @@ class OSINTAnalyzer:
             progress_callback('Détection des WAF avec wafw00f...')
         
         try:
-            result = self._run_wsl_command(['wafw00f', url], timeout=30)
+            result = self._run_wsl_command(['wafw00f', url], timeout=30, max_stdout_bytes=WAF_MAX_OUTPUT)
             if result.get('success'):
                 output = result['stdout']
                 # Parser les résultats wafw00f
                 if 'is behind' in output.lower() or 'is protected by' in output.lower():
-                    waf_match = re.search(r'(?:is behind|is protected by)\s+([A-Za-z0-9\s-]+)', output, re.IGNORECASE)
+                    waf_match = _WAF_RE.search(output)
                     if waf_match:
                         waf_name = waf_match.group(1).strip()
                         waf_detections.append({
@@ -1452,7 +2124,7 @@ class OSINTAnalyzer:
                             'waf_vendor': waf_name.split()[0] if waf_name else None,
                             'detected': True,
                             'detection_method': 'wafw00f',
-                            'details_json': json.dumps({'output': output[:500]})
+                            'details_json': _json_dumps({'output': output[:500]})
                         })
                 elif 'no waf detected' in output.lower():
                     waf_detections.append({
@@ -1461,7 +2133,7 @@ class OSINTAnalyzer:
                         'waf_vendor': None,
                         'detected': False,
                         'detection_method': 'wafw00f',
-                        'details_json': json.dumps({'output': output[:500]})
+                        'details_json': _json_dumps({'output': output[:500]})
                     })
         except Exception as e:
             logger.debug(f'Erreur détection WAF: {e}')
@@ -1484,24 +2156,21 @@ class OSINTAnalyzer:
             # Utiliser une wordlist commune
             result = self._run_wsl_command([
                 'gobuster', 'dir', '-u', url, '-w', '/usr/share/wordlists/dirb/common.txt', 
-                '--no-error', '-q', '-t', '10'
+                '--no-error', '--no-progress', '-q', '-t', '10'
             ], timeout=60)
             
             if result.get('success'):
                 output = result['stdout']
-                for line in output.split('\n'):
-                    if line.strip() and not line.startswith('='):
-                        # Parser les résultats gobuster
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            path = parts[0] if parts[0].startswith('/') else '/' + parts[0]
-                            status_code = parts[1] if parts[1].isdigit() else None
-                            directories.append({
-                                'path': path,
-                                'status_code': int(status_code) if status_code else None,
-                                'size': parts[2] if len(parts) > 2 else None,
-                                'discovered_by': 'gobuster'
-                            })
+                if '\x1b' in output:
+                    output = self._clean_ansi_codes(output)
+                # Parser les résultats gobuster (un seul passage sur toute la sortie)
+                for match in _GOBUSTER_RE.finditer(output):
+                    directories.append({
+                        'path': '/' + match.group(1),
+                        'status_code': int(match.group(2)),
+                        'size': match.group(3),
+                        'discovered_by': 'gobuster'
+                    })
         except Exception as e:
             logger.debug(f'Erreur découverte répertoires: {e}')
         
@@ -1519,80 +2188,92 @@ class OSINTAnalyzer:
         }
         
         if not ip:
-            try:
-                ip = socket.gethostbyname(domain)
-            except:
+            ip = self._resolve(domain)
+            if not ip:
                 return result
         
-        # Shodan
+        # Shodan et Censys sont interrogés en parallèle
+        scans = {}
         if self.tools['shodan']:
             if progress_callback:
                 progress_callback('Scan Shodan...')
-            try:
-                shodan_result = self._run_wsl_command(['shodan', 'host', ip], timeout=30)
-                if shodan_result.get('success'):
-                    output = shodan_result['stdout']
-                    # Parser les résultats Shodan
-                    port_pattern = r'(\d+)\s+([^\s]+)\s+(.+)'
-                    for match in re.finditer(port_pattern, output):
-                        port = int(match.group(1))
-                        service = match.group(2)
-                        banner = match.group(3)
-                        result['open_ports'].append({
-                            'ip': ip,
-                            'port': port,
-                            'protocol': 'tcp',
-                            'state': 'open',
-                            'discovered_by': 'shodan'
-                        })
-                        result['services'].append({
-                            'ip': ip,
-                            'port': port,
-                            'service_name': service,
-                            'banner': banner[:500],
-                            'discovered_by': 'shodan'
-                        })
-            except Exception as e:
-                logger.debug(f'Erreur scan Shodan: {e}')
-        
-        # Censys
+            scans['shodan'] = lambda: self._shodan_host_scan(ip)
         if self.tools['censys']:
             if progress_callback:
                 progress_callback('Scan Censys...')
-            try:
-                censys_result = self._run_wsl_command(['censys', 'search', f'ip:{ip}'], timeout=30)
-                if censys_result.get('success'):
-                    output = censys_result['stdout']
-                    # Parser les résultats Censys (format JSON possible)
-                    try:
-                        data = json.loads(output)
-                        if isinstance(data, list):
-                            for item in data:
-                                port = item.get('port', 443)
-                                result['open_ports'].append({
-                                    'ip': ip,
-                                    'port': port,
-                                    'protocol': 'tcp',
-                                    'state': 'open',
-                                    'discovered_by': 'censys'
-                                })
-                    except json.JSONDecodeError:
-                        # Parser texte
-                        port_pattern = r'port[:\s]+(\d+)'
-                        for match in re.finditer(port_pattern, output, re.IGNORECASE):
-                            port = int(match.group(1))
-                            result['open_ports'].append({
-                                'ip': ip,
-                                'port': port,
-                                'protocol': 'tcp',
-                                'state': 'open',
-                                'discovered_by': 'censys'
-                            })
-            except Exception as e:
-                logger.debug(f'Erreur scan Censys: {e}')
+            scans['censys'] = lambda: self._censys_host_scan(ip)
+        
+        scan_results, _ = self._run_concurrently(scans)
+        # Un port signalé par les deux sources (ou plusieurs fois) n'est gardé qu'une fois
+        seen_ports = set()
+        for name in ('shodan', 'censys'):
+            scan = scan_results.get(name) or {}
+            for open_port in scan.get('open_ports', []):
+                if open_port['port'] not in seen_ports:
+                    seen_ports.add(open_port['port'])
+                    result['open_ports'].append(open_port)
+            result['services'].extend(scan.get('services', []))
         
         return result
     
+    def _shodan_host_scan(self, ip: str) -> Dict:
+        """
+        Ports et services d'une IP connus de Shodan
+        
+        Args:
+            ip: Adresse IP à rechercher
+        
+        Returns:
+            Dictionnaire avec open_ports et services
+        """
+        scan = {'open_ports': [], 'services': []}
+        try:
+            shodan_result = self._run_wsl_command(['shodan', 'host', ip], timeout=30)
+            if shodan_result.get('success'):
+                output = shodan_result['stdout']
+                # Parser les résultats Shodan : (port, service, bannière) par ligne
+                entries = [
+                    (int(port), service, banner[:500])
+                    for port, service, banner in _SHODAN_PORT_RE.findall(output)
+                ]
+                scan['open_ports'] = [_open_port(ip, port, 'shodan') for port, _, _ in entries]
+                scan['services'] = [
+                    {'ip': ip, 'port': port, 'service_name': service, 'banner': banner, 'discovered_by': 'shodan'}
+                    for port, service, banner in entries
+                ]
+        except Exception as e:
+            logger.debug(f'Erreur scan Shodan: {e}')
+        return scan
+    
+    def _censys_host_scan(self, ip: str) -> Dict:
+        """
+        Ports d'une IP connus de Censys
+        
+        Args:
+            ip: Adresse IP à rechercher
+        
+        Returns:
+            Dictionnaire avec open_ports
+        """
+        scan = {'open_ports': []}
+        try:
+            censys_result = self._run_wsl_command(['censys', 'search', f'ip:{ip}'], timeout=30)
+            if censys_result.get('success'):
+                output = censys_result['stdout']
+                # Parser les résultats Censys (format JSON possible)
+                try:
+                    data = _json_loads(output)
+                    if isinstance(data, list):
+                        scan['open_ports'] = [_open_port(ip, item.get('port', 443), 'censys') for item in data]
+                except json.JSONDecodeError:
+                    # Parser texte
+                    scan['open_ports'] = [
+                        _open_port(ip, int(port), 'censys') for port in _CENSYS_PORT_RE.findall(output)
+                    ]
+        except Exception as e:
+            logger.debug(f'Erreur scan Censys: {e}')
+        return scan
+    
     def _search_document_metadata(self, domain: str, progress_callback=None) -> List[Dict]:
         """
         Recherche les métadonnées de documents avec Metagoofil
@@ -1606,24 +2287,24 @@ class OSINTAnalyzer:
             progress_callback('Recherche des métadonnées de documents avec Metagoofil...')
         
         try:
-            result = self._run_wsl_command(['metagoofil', '-d', domain, '-t', 'pdf,doc,docx,xls,xlsx', '-l', '20'], timeout=60)
+            # Résultats stables et recherche lente (requêtes moteur de recherche) : mis en cache
+            result = self._run_wsl_command(
+                ['metagoofil', '-d', domain, '-t', 'pdf,doc,docx,xls,xlsx', '-l', '20'],
+                timeout=60, cache_ttl=osint_cache.TOOLS_TTL
+            )
             if result.get('success'):
                 output = result['stdout']
-                # Parser les résultats Metagoofil
-                current_doc = {}
-                for line in output.split('\n'):
-                    if 'File:' in line:
-                        if current_doc:
-                            document_metadata.append(current_doc)
-                        current_doc = {'file_name': line.replace('File:', '').strip()}
-                    elif ':' in line and current_doc:
-                        key, value = line.split(':', 1)
-                        key = key.strip().lower().replace(' ', '_')
-                        value = value.strip()
-                        current_doc[key] = value
-                
-                if current_doc:
-                    document_metadata.append(current_doc)
+                # Parser les résultats Metagoofil (un seul passage : seules les lignes
+                # "File: ..." et "Clé: valeur" sont vues par Python)
+                current_doc = None
+                for match in _METAGOOFIL_LINE_RE.finditer(output):
+                    file_name = match.group('file')
+                    if file_name is not None:
+                        current_doc = {'file_name': file_name.strip()}
+                        document_metadata.append(current_doc)
+                    elif current_doc is not None:
+                        key = match.group('key').strip().lower().translate(_SPACE_TO_UNDERSCORE)
+                        current_doc[key] = match.group('value').strip()
         except Exception as e:
             logger.debug(f'Erreur recherche métadonnées documents: {e}')
         
@@ -1643,47 +2324,111 @@ class OSINTAnalyzer:
         
         try:
             # Télécharger la page et extraire les URLs d'images
-            response = requests.get(url, headers=self.headers, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                img_urls = []
-                for img in soup.find_all('img', src=True):
-                    img_url = img['src']
-                    if not img_url.startswith('http'):
-                        img_url = url + img_url if img_url.startswith('/') else url + '/' + img_url
-                    img_urls.append(img_url)
+            soup = self._get_soup(url)
+            if soup is not None:
+                # Le parcours de l'arbre s'arrête dès que assez d'images candidates sont trouvées
+                img_urls = [
+                    urljoin(url, img['src'])
+                    for img in soup.find_all(_is_exif_candidate_img, limit=IMAGE_METADATA_MAX_IMAGES)
+                ]
                 
-                # Analyser les 5 premières images avec ExifTool
-                for img_url in img_urls[:5]:
-                    try:
-                        result = self._run_wsl_command(['exiftool', '-j', img_url], timeout=10)
-                        if result.get('success'):
-                            output = result['stdout']
-                            try:
-                                exif_data = json.loads(output)
-                                if isinstance(exif_data, list) and len(exif_data) > 0:
-                                    exif = exif_data[0]
-                                    image_metadata.append({
-                                        'image_url': img_url,
-                                        'camera_make': exif.get('Make'),
-                                        'camera_model': exif.get('Model'),
-                                        'date_taken': exif.get('DateTimeOriginal') or exif.get('CreateDate'),
-                                        'gps_latitude': exif.get('GPSLatitude'),
-                                        'gps_longitude': exif.get('GPSLongitude'),
-                                        'gps_altitude': exif.get('GPSAltitude'),
-                                        'location_description': exif.get('Location'),
-                                        'software': exif.get('Software'),
-                                        'metadata_json': json.dumps(exif)
-                                    })
-                            except json.JSONDecodeError:
-                                pass
-                    except:
-                        continue
+                # Analyser ces images avec ExifTool (vérifications HEAD en parallèle,
+                # puis un seul appel ExifTool pour toutes les images retenues)
+                if img_urls:
+                    with ThreadPoolExecutor(max_workers=len(img_urls)) as executor:
+                        keep = list(executor.map(self._may_have_exif, img_urls))
+                    img_urls = [img_url for img_url, kept in zip(img_urls, keep) if kept]
+                    image_metadata.extend(self._images_exif_metadata(img_urls))
         except Exception as e:
             logger.debug(f'Erreur recherche métadonnées images: {e}')
         
         return image_metadata
     
+    def _may_have_exif(self, img_url: str) -> bool:
+        """
+        Vérifie par une requête HEAD qu'une image peut contenir des EXIF
+        
+        Les images trop petites ou d'un format sans EXIF (PNG, GIF, WebP...) sont
+        écartées. Si le serveur ne renseigne pas ces en-têtes, l'image est gardée.
+        
+        Args:
+            img_url: URL de l'image
+        
+        Returns:
+            bool: False si l'image ne mérite pas un appel à ExifTool
+        """
+        try:
+            response = self.session.head(img_url, timeout=3, allow_redirects=True)
+        except Exception as e:
+            logger.debug(f'Erreur HEAD pour {img_url}: {e}')
+            return True
+        if response.status_code != 200:
+            return response.status_code not in (404, 410)
+        
+        content_type = response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        if content_type and content_type not in EXIF_IMAGE_TYPES:
+            return False
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) < EXIF_MIN_IMAGE_BYTES:
+            return False
+        return True
+    
+    def _images_exif_metadata(self, img_urls: List[str]) -> List[Dict]:
+        """
+        Lit les métadonnées EXIF de plusieurs images distantes en un seul appel ExifTool
+        
+        ExifTool ne télécharge pas les URLs : les images sont récupérées en parallèle
+        par curl dans un dossier temporaire côté Linux, puis analysées ensemble
+        (un seul processus ExifTool, une seule sortie JSON).
+        
+        Args:
+            img_urls: URLs des images
+        
+        Returns:
+            Liste des métadonnées, dans l'ordre des URLs
+        """
+        if not img_urls:
+            return []
+        
+        try:
+            result = self._run_wsl_command(['bash', '-c', _EXIF_BATCH_SCRIPT, 'exiftool'] + img_urls, timeout=20)
+            # ExifTool sort en erreur si une image est illisible, mais décrit quand même les autres
+            exif_data = _json_loads(result['stdout']) if result.get('stdout') else []
+        except Exception as e:
+            logger.debug(f'Erreur ExifTool: {e}')
+            return []
+        if not isinstance(exif_data, list):
+            return []
+        
+        exif_by_index = {}
+        for exif in exif_data:
+            if not isinstance(exif, dict) or exif.get('Error'):
+                continue
+            index = os.path.basename(str(exif.get('SourceFile', '')))
+            if index.isdigit() and int(index) < len(img_urls):
+                # Chemin temporaire remplacé par l'URL de l'image
+                exif['SourceFile'] = img_urls[int(index)]
+                exif_by_index[int(index)] = exif
+        
+        image_metadata = []
+        for index, img_url in enumerate(img_urls):
+            exif = exif_by_index.get(index)
+            if exif is None:
+                continue
+            image_metadata.append({
+                'image_url': img_url,
+                'camera_make': exif.get('Make'),
+                'camera_model': exif.get('Model'),
+                'date_taken': exif.get('DateTimeOriginal') or exif.get('CreateDate'),
+                'gps_latitude': exif.get('GPSLatitude'),
+                'gps_longitude': exif.get('GPSLongitude'),
+                'gps_altitude': exif.get('GPSAltitude'),
+                'location_description': exif.get('Location'),
+                'software': exif.get('Software'),
+                'metadata_json': _json_dumps(exif)
+            })
+        return image_metadata
+    
     def enrich_people_from_scrapers(self, people_list: List[Dict], domain: str, progress_callback=None) -> List[Dict]:
         """
         Enrichit les personnes trouvées par les scrapers avec des données OSINT
@@ -1697,6 +2442,9 @@ class OSINTAnalyzer:
             List[Dict]: Liste des personnes enrichies
         """
         enriched_people = []
+        # Résultats LinkedIn du domaine : recherchés une seule fois, indexés par nom
+        linkedin_results = None
+        linkedin_index = {}
         
         for person in people_list:
             enriched_person = person.copy()
@@ -1714,16 +2462,28 @@ class OSINTAnalyzer:
             linkedin_url = person.get('linkedin_url')
             if not linkedin_url and name:
                 # Essayer de trouver le profil LinkedIn
-                try:
-                    linkedin_results = self.search_linkedin_people(domain, progress_callback=None)
+                if linkedin_results is None:
+                    try:
+                        linkedin_results = self.search_linkedin_people(domain, progress_callback=None)
+                    except Exception as e:
+                        logger.debug(f'Erreur recherche LinkedIn pour {domain}: {e}')
+                        linkedin_results = []
                     for linkedin_person in linkedin_results:
-                        if name.lower() in linkedin_person.get('name', '').lower():
-                            linkedin_url = linkedin_person.get('linkedin_url')
-                            if not enriched_person.get('title'):
-                                enriched_person['title'] = linkedin_person.get('title', '')
-                            break
-                except:
-                    pass
+                        linkedin_index.setdefault(linkedin_person.get('name', '').lower(), linkedin_person)
+                
+                name_lower = name.lower()
+                match = linkedin_index.get(name_lower)
+                if match is None:
+                    # Nom partiel (ex: prénom seul ou nom sans titre) : recherche par sous-chaîne
+                    match = next(
+                        (candidate for candidate in linkedin_results
+                         if name_lower in candidate.get('name', '').lower()),
+                        None
+                    )
+                if match is not None:
+                    linkedin_url = match.get('linkedin_url')
+                    if not enriched_person.get('title'):
+                        enriched_person['title'] = match.get('title', '')
             
             enriched_person['linkedin_url'] = linkedin_url
             
@@ -1740,24 +2500,7 @@ class OSINTAnalyzer:
             
             # Déterminer le niveau hiérarchique basé sur le titre
             title = enriched_person.get('title', '').lower()
-            niveau_hierarchique = None
-            role = None
-            
-            if any(keyword in title for keyword in ['ceo', 'pdg', 'directeur général', 'président', 'founder']):
-                niveau_hierarchique = 1
-                role = 'Direction'
-            elif any(keyword in title for keyword in ['directeur', 'directrice', 'director', 'head of']):
-                niveau_hierarchique = 2
-                role = 'Direction'
-            elif any(keyword in title for keyword in ['manager', 'responsable', 'chef de', 'lead']):
-                niveau_hierarchique = 3
-                role = 'Management'
-            elif any(keyword in title for keyword in ['senior', 'senior', 'expert']):
-                niveau_hierarchique = 4
-                role = 'Expert'
-            else:
-                niveau_hierarchique = 5
-                role = 'Collaborateur'
+            niveau_hierarchique, role = _hierarchy_level(title)
             
             enriched_person['niveau_hierarchique'] = niveau_hierarchique
             enriched_person['role'] = role
@@ -1767,6 +2510,126 @@ class OSINTAnalyzer:
         
         return enriched_people
     
+    def _probe_target(self, url: str, ip: Optional[str]) -> Dict[str, bool]:
+        """
+        Vérifie rapidement que la cible répond (HTTP et port 443)
+        
+        Évite de payer le timeout complet de wafw00f, gobuster ou testssl.sh sur
+        un site injoignable. Un code 5xx de passerelle (origine hors ligne) compte
+        comme injoignable ; les autres codes, y compris 403/503 d'un WAF, non.
+        
+        Args:
+            url: URL du site
+            ip: Adresse IP résolue (None si la résolution a échoué)
+        
+        Returns:
+            Dictionnaire {'http': bool, 'https': bool}
+        """
+        reachable = {'http': False, 'https': False}
+        try:
+            response = self.session.head(url, timeout=TARGET_PROBE_TIMEOUT, allow_redirects=True)
+            reachable['http'] = response.status_code not in TARGET_DOWN_STATUS_CODES
+        except requests.exceptions.SSLError:
+            # Certificat invalide : le site répond, les outils peuvent l'analyser
+            reachable['http'] = True
+        except Exception as e:
+            logger.debug(f'Cible injoignable ({url}): {e}')
+        
+        if ip:
+            try:
+                with socket.create_connection((ip, 443), timeout=TARGET_PROBE_TIMEOUT):
+                    reachable['https'] = True
+            except OSError as e:
+                logger.debug(f'Port 443 fermé ou filtré ({ip}): {e}')
+        
+        return reachable
+    
+    def _run_concurrently(self, tasks: Dict[str, Callable[[], object]],
+                          progress_callback=None) -> Tuple[Dict, Dict]:
+        """
+        Exécute des étapes indépendantes en parallèle (threads)
+        
+        Les étapes sont des appels bloquants (outils WSL, réseau) : elles
+        s'exécutent dans des threads et le temps total est celui de la plus lente.
+        Elles ne doivent pas appeler progress_callback elles-mêmes (update_state de
+        Celery échoue hors du thread de la tâche) : la fin de chaque étape est
+        signalée depuis le thread appelant.
+        
+        Args:
+            tasks: Dictionnaire nom -> fonction sans argument
+            progress_callback: Callback pour la progression (optionnel)
+        
+        Returns:
+            Tuple (résultats, erreurs) : deux dictionnaires indexés par nom d'étape
+        """
+        results = {}
+        errors = {}
+        if not tasks:
+            return results, errors
+        
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {executor.submit(task): name for name, task in tasks.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.debug(f'Erreur étape OSINT {name}: {e}')
+                    errors[name] = e
+                if progress_callback:
+                    status = 'en erreur' if name in errors else 'terminée'
+                    progress_callback(f'Étape {status} : {OSINT_STEP_LABELS.get(name, name)}')
+        return results, errors
+    
+    def run_full_scan(self, domain: str, progress_callback=None) -> Dict:
+        """
+        Scan OSINT rapide d'un domaine
+        
+        DNS, WHOIS, découverte de sous-domaines et collecte d'emails sont lancés
+        en parallèle, puis les personnes déduites des emails sont recherchées
+        sur les réseaux sociaux.
+        
+        Args:
+            domain: Domaine à analyser
+            progress_callback: Callback pour la progression
+        
+        Returns:
+            Dictionnaire avec dns_records, whois_info, subdomains, emails, people,
+            social_profiles (et <étape>_error en cas d'échec d'une étape)
+        """
+        if progress_callback:
+            progress_callback(f'Scan OSINT de {domain} (DNS, WHOIS, sous-domaines, emails)...')
+        
+        results, errors = self._run_concurrently({
+            'dns_records': lambda: self.get_dns_records(domain),
+            'whois_info': lambda: self.get_whois_info(domain),
+            'subdomains': lambda: self.discover_subdomains(domain),
+            'emails': lambda: self.harvest_emails(domain)
+        }, progress_callback)
+        
+        scan = {
+            'domain': domain,
+            'dns_records': results.get('dns_records') or {},
+            'whois_info': results.get('whois_info') or {},
+            'subdomains': results.get('subdomains') or [],
+            'emails': results.get('emails') or [],
+            'people': [],
+            'social_profiles': {}
+        }
+        for name, error in errors.items():
+            scan[f'{name}_error'] = str(error)
+        
+        # Étapes dépendantes : personnes déduites des emails, puis leurs profils sociaux
+        scan['people'] = self.find_people_from_emails(scan['emails'], domain)
+        usernames = [person['username'] for person in scan['people']]
+        if usernames:
+            try:
+                scan['social_profiles'] = self.search_social_media_profiles(usernames, progress_callback)
+            except Exception as e:
+                scan['social_profiles_error'] = str(e)
+        
+        return scan
+    
     def analyze_osint(self, url: str, progress_callback=None, people_from_scrapers=None,
                      emails_from_scrapers=None, social_profiles_from_scrapers=None,
                      phones_from_scrapers=None, names_from_scraper_emails=None) -> Dict:
@@ -1807,257 +2670,243 @@ class OSINTAnalyzer:
             }
         }
         
-        # Découverte de sous-domaines
-        try:
-            if progress_callback:
-                progress_callback('Démarrage de la découverte de sous-domaines...')
-            results['subdomains'] = self.discover_subdomains(domain, progress_callback)
-        except Exception as e:
-            results['subdomains_error'] = str(e)
-            if progress_callback:
-                progress_callback(f'Erreur lors de la découverte de sous-domaines: {str(e)}')
-        
-        # Enregistrements DNS
+        # Informations IP (résolues en premier : scan de ports et géolocalisation en dépendent)
         if progress_callback:
-            progress_callback('Récupération des enregistrements DNS...')
-        try:
-            results['dns_records'] = self.get_dns_records(domain)
-        except Exception as e:
-            results['dns_error'] = str(e)
+            progress_callback('Récupération des informations IP...')
+        self._dns_cache.clear()
+        self._hostname_cache.clear()
+        self._html_cache.clear()
+        ip = self._resolve(domain)
+        if ip:
+            results['ip_info'] = {
+                'ip': ip,
+                'hostname': self._reverse_resolve(ip)
+            }
+        else:
+            results['ip_error'] = f'Impossible de résoudre {domain}'
+        
+        # Étapes indépendantes (outils WSL, APIs, requêtes HTTP) : lancées en parallèle,
+        # pendant que la collecte d'emails et l'enrichissement des personnes s'exécutent.
+        # Les outils qui interrogent le site lui-même attendent le test de joignabilité
+        # (reachability) et sont sautés si la cible ne répond pas.
+        # Les étapes ne reçoivent pas progress_callback : appelé depuis un thread de
+        # l'exécuteur, update_state de Celery n'a pas l'id de la tâche et lève une
+        # exception. La progression est signalée ici, à la fin de chaque étape.
+        steps = {
+            'subdomains': lambda: self.discover_subdomains(domain),
+            'dns_records': lambda: self.get_dns_records(domain),
+            'whois_info': lambda: self.get_whois_info(domain),
+            'ssl_info': lambda: self.analyze_ssl(domain) if reachability.result()['https'] else {},
+            'ssl_details': lambda: self._analyze_ssl_details(domain) if reachability.result()['https'] else [],
+            'waf_detections': lambda: self._detect_waf(url) if reachability.result()['http'] else [],
+            'directories': lambda: self._discover_directories(url) if reachability.result()['http'] else [],
+            'document_metadata': lambda: self._search_document_metadata(domain),
+            'image_metadata': lambda: self._search_image_metadata(url) if reachability.result()['http'] else [],
+            'technologies': lambda: self.detect_technologies(url)
+        }
+        if ip:
+            steps['port_scan'] = lambda: self._scan_ports_and_services(domain, ip)
+            steps['ip_geolocation'] = lambda: self.get_ip_geolocation(ip)
+        if phones_from_scrapers:
+            steps['phone_osint'] = lambda: self.analyze_phones_osint(phones_from_scrapers[:5])
+        if people_from_scrapers:
+            steps['people_osint'] = lambda: self.analyze_people_osint(people_from_scrapers[:5], domain)
         
-        # Informations WHOIS
         if progress_callback:
-            progress_callback('Récupération des informations WHOIS...')
-        try:
-            results['whois_info'] = self.get_whois_info(domain)
-        except Exception as e:
-            results['whois_error'] = str(e)
+            progress_callback('Lancement en parallèle des analyses (sous-domaines, DNS, WHOIS, SSL, WAF, technologies...)')
         
-        # Emails : utiliser ceux du scraper si disponibles, sinon chercher avec optimisation
+        # Toutes les étapes démarrent immédiatement : la durée totale est celle de la plus
+        # lente (chaque outil est borné par son propre timeout côté Linux)
+        executor = ThreadPoolExecutor(max_workers=len(steps) + 1)
         try:
-            if emails_from_scrapers:
-                # 1) On part des emails trouvés par le scraper
-                if progress_callback:
-                    progress_callback(f'Utilisation de {len(emails_from_scrapers)} email(s) du scraper...')
-                results['emails'] = list(set(emails_from_scrapers))  # Dédupliquer
-                results['emails_from_scrapers'] = True
-                
-                # 2) Si on a des noms extraits des emails, chercher des emails supplémentaires avec ces noms
-                if names_from_scraper_emails and len(names_from_scraper_emails) > 0:
+            reachability = executor.submit(self._probe_target, url, ip)
+            futures = {name: executor.submit(step) for name, step in steps.items()}
+            
+            # Emails : utiliser ceux du scraper si disponibles, sinon chercher avec optimisation
+            try:
+                if emails_from_scrapers:
+                    # 1) On part des emails trouvés par le scraper
                     if progress_callback:
-                        progress_callback(
-                            f'Recherche d\'emails supplémentaires avec {len(names_from_scraper_emails)} nom(s) trouvé(s)...'
-                        )
-                    try:
-                        additional_emails = self.harvest_emails(
-                            domain,
-                            progress_callback,
-                            names=names_from_scraper_emails
-                        )
-                        existing_emails_set = set(e.lower() for e in results['emails'])
-                        for email in additional_emails:
-                            email_lower = email.lower()
-                            if email_lower not in existing_emails_set:
-                                results['emails'].append(email)
-                                existing_emails_set.add(email_lower)
-                    except Exception as e:
-                        logger.warning(
-                            f'Erreur lors de la recherche d\'emails supplémentaires avec les noms: {e}'
-                        )
-            else:
-                # Pas d'emails du scraper -> on fait une collecte classique
-                if progress_callback:
-                    progress_callback('Collecte d\'emails...')
-                harvested_emails = self.harvest_emails(
-                    domain,
-                    progress_callback,
-                    names=names_from_scraper_emails
-                )
-                results['emails'] = harvested_emails
-                results['emails_from_scrapers'] = False
-        except Exception as e:
-            # En cas d'erreur, ne pas écraser complètement mais au pire laisser la liste existante
-            logger.warning(f'Erreur lors de la collecte d\'emails: {e}')
-            results['emails_error'] = str(e)
-            if not isinstance(results.get('emails'), list):
-                results['emails'] = []
-        
-        # Recherche de personnes et profils sociaux : enrichir celles du scraper
-        if progress_callback:
-            progress_callback('Enrichissement des personnes avec OSINT...')
-        try:
-            if people_from_scrapers:
-                # Si on a des personnes du scraper, les enrichir puis construire le résumé
-                enriched_people = self.enrich_people_from_scrapers(
-                    people_from_scrapers,
-                    domain,
-                    progress_callback
-                )
-                results['people'] = {
-                    'from_scrapers': enriched_people,
-                    'people': enriched_people,
-                    'summary': {
-                        'total_people': len(enriched_people),
-                        'with_emails': len([p for p in enriched_people if p.get('email')]),
-                        'with_linkedin': len([p for p in enriched_people if p.get('linkedin_url')]),
-                        'with_social_profiles': len([p for p in enriched_people if p.get('social_profiles')]),
-                        'from_website': len(
-                            [p for p in enriched_people if 'website_scraping' in p.get('source', '')]
-                        )
-                    }
-                }
-            else:
-                # Sinon, chercher avec OSINT classique (emails récoltés ci-dessus)
-                people_data = self.search_people_osint(domain, results['emails'], progress_callback)
-                results['people'] = people_data
-        except Exception as e:
-            results['people_error'] = str(e)
-            results['people'] = {}
-        
-        # Ajouter les profils sociaux du scraper si disponibles
-        if social_profiles_from_scrapers:
-            if progress_callback:
-                progress_callback(f'Ajout de {len(social_profiles_from_scrapers)} profil(s) social/social du scraper...')
-            if 'people' not in results or not isinstance(results['people'], dict):
-                results['people'] = {}
-            if 'social_profiles_from_scrapers' not in results['people']:
-                results['people']['social_profiles_from_scrapers'] = social_profiles_from_scrapers
-        
-        # Ajouter les téléphones du scraper si disponibles
-        if phones_from_scrapers:
-            if progress_callback:
-                progress_callback(f'Ajout de {len(phones_from_scrapers)} téléphone(s) du scraper...')
-            results['phones_from_scrapers'] = phones_from_scrapers
-        
-        # Recherche OSINT avancée sur les téléphones
-        if phones_from_scrapers and len(phones_from_scrapers) > 0:
+                        progress_callback(f'Utilisation de {len(emails_from_scrapers)} email(s) du scraper...')
+                    # Dédupliquer sans tenir compte de la casse, dans l'ordre de découverte
+                    emails_by_key = {}
+                    for email in emails_from_scrapers:
+                        emails_by_key.setdefault(email.lower(), email)
+                    results['emails'] = list(emails_by_key.values())
+                    results['emails_from_scrapers'] = True
+                    
+                    # 2) Si on a des noms extraits des emails, chercher des emails supplémentaires avec ces noms
+                    if names_from_scraper_emails and len(names_from_scraper_emails) > 0:
+                        if progress_callback:
+                            progress_callback(
+                                f'Recherche d\'emails supplémentaires avec {len(names_from_scraper_emails)} nom(s) trouvé(s)...'
+                            )
+                        try:
+                            additional_emails = self.harvest_emails(
+                                domain,
+                                progress_callback,
+                                names=names_from_scraper_emails
+                            )
+                            for email in additional_emails:
+                                emails_by_key.setdefault(email.lower(), email)
+                            results['emails'] = list(emails_by_key.values())
+                        except Exception as e:
+                            logger.warning(
+                                f'Erreur lors de la recherche d\'emails supplémentaires avec les noms: {e}'
+                            )
+                else:
+                    # Pas d'emails du scraper -> on fait une collecte classique
+                    if progress_callback:
+                        progress_callback('Collecte d\'emails...')
+                    harvested_emails = self.harvest_emails(
+                        domain,
+                        progress_callback,
+                        names=names_from_scraper_emails
+                    )
+                    results['emails'] = harvested_emails
+                    results['emails_from_scrapers'] = False
+            except Exception as e:
+                # En cas d'erreur, ne pas écraser complètement mais au pire laisser la liste existante
+                logger.warning(f'Erreur lors de la collecte d\'emails: {e}')
+                results['emails_error'] = str(e)
+                if not isinstance(results.get('emails'), list):
+                    results['emails'] = []
+            
+            # Recherche de personnes et profils sociaux : enrichir celles du scraper
             if progress_callback:
-                progress_callback('Analyse OSINT des numéros de téléphone...')
+                progress_callback('Enrichissement des personnes avec OSINT...')
             try:
-                phone_osint_data = self.analyze_phones_osint(phones_from_scrapers[:5], progress_callback)
-                results['phone_osint'] = phone_osint_data
+                if people_from_scrapers:
+                    # Si on a des personnes du scraper, les enrichir puis construire le résumé
+                    enriched_people = self.enrich_people_from_scrapers(
+                        people_from_scrapers,
+                        domain,
+                        progress_callback
+                    )
+                    # Compteurs du résumé calculés en un seul passage sur les personnes
+                    people_summary = {
+                        'total_people': len(enriched_people),
+                        'with_emails': 0,
+                        'with_linkedin': 0,
+                        'with_social_profiles': 0,
+                        'from_website': 0
+                    }
+                    for person in enriched_people:
+                        people_summary['with_emails'] += bool(person.get('email'))
+                        people_summary['with_linkedin'] += bool(person.get('linkedin_url'))
+                        people_summary['with_social_profiles'] += bool(person.get('social_profiles'))
+                        people_summary['from_website'] += 'website_scraping' in person.get('source', '')
+                    results['people'] = {
+                        'from_scrapers': enriched_people,
+                        'people': enriched_people,
+                        'summary': people_summary
+                    }
+                else:
+                    # Sinon, chercher avec OSINT classique (emails récoltés ci-dessus)
+                    people_data = self.search_people_osint(domain, results['emails'], progress_callback)
+                    results['people'] = people_data
             except Exception as e:
-                logger.warning(f'Erreur lors de l\'analyse OSINT des téléphones: {e}')
-                results['phone_osint_error'] = str(e)
-        
-        # Recherche OSINT avancée sur les personnes (famille, localisation, etc.)
-        if people_from_scrapers and len(people_from_scrapers) > 0:
-            if progress_callback:
-                progress_callback('Recherche OSINT approfondie sur les personnes...')
+                results['people_error'] = str(e)
+                results['people'] = {}
+            
+            # Ajouter les profils sociaux du scraper si disponibles
+            if social_profiles_from_scrapers:
+                if progress_callback:
+                    progress_callback(f'Ajout de {len(social_profiles_from_scrapers)} profil(s) social/social du scraper...')
+                if 'people' not in results or not isinstance(results['people'], dict):
+                    results['people'] = {}
+                if 'social_profiles_from_scrapers' not in results['people']:
+                    results['people']['social_profiles_from_scrapers'] = social_profiles_from_scrapers
+            
+            # Ajouter les téléphones du scraper si disponibles
+            if phones_from_scrapers:
+                if progress_callback:
+                    progress_callback(f'Ajout de {len(phones_from_scrapers)} téléphone(s) du scraper...')
+                results['phones_from_scrapers'] = phones_from_scrapers
+            
+            # Informations WHOIS (nécessaires pour le nom de l'entreprise)
             try:
-                people_osint_data = self.analyze_people_osint(people_from_scrapers[:5], domain, progress_callback)
-                results['people_osint'] = people_osint_data
+                results['whois_info'] = futures['whois_info'].result()
             except Exception as e:
-                logger.warning(f'Erreur lors de l\'analyse OSINT approfondie des personnes: {e}')
-                results['people_osint_error'] = str(e)
-        
-        # Géolocalisation depuis les IPs trouvées
-        if results.get('ip_info', {}).get('ip'):
+                results['whois_error'] = str(e)
+            
+            # Recherche de données financières et juridiques
+            # Extraire le nom de l'entreprise depuis le domaine ou WHOIS
+            company_name = domain.split('.')[0].capitalize()
+            if results.get('whois_info', {}).get('org'):
+                company_name = results['whois_info']['org']
+            
             if progress_callback:
-                progress_callback('Géolocalisation des adresses IP...')
+                progress_callback('Recherche des données financières et juridiques...')
             try:
-                ip_geolocation = self.get_ip_geolocation(results['ip_info'].get('ip'))
-                if ip_geolocation:
-                    results['ip_geolocation'] = ip_geolocation
+                financial_data = self.search_company_financial_data(company_name, domain, progress_callback)
+                results['financial_data'] = financial_data
             except Exception as e:
-                logger.warning(f'Erreur lors de la géolocalisation IP: {e}')
-        
-        # Recherche de données financières et juridiques
-        # Extraire le nom de l'entreprise depuis le domaine ou WHOIS
-        company_name = domain.split('.')[0].capitalize()
-        if results.get('whois_info', {}).get('org'):
-            company_name = results['whois_info']['org']
-        
-        if progress_callback:
-            progress_callback('Recherche des données financières et juridiques...')
-        try:
-            financial_data = self.search_company_financial_data(company_name, domain, progress_callback)
-            results['financial_data'] = financial_data
-        except Exception as e:
-            results['financial_data_error'] = str(e)
-            results['financial_data'] = {}
-        
-        # Analyse SSL basique
-        if progress_callback:
-            progress_callback('Analyse SSL/TLS...')
-        try:
-            results['ssl_info'] = self.analyze_ssl(domain)
-        except Exception as e:
-            results['ssl_error'] = str(e)
-        
-        # Analyse SSL détaillée avec testssl.sh
-        try:
-            ssl_details = self._analyze_ssl_details(domain, progress_callback)
-            if ssl_details:
-                results['ssl_details'] = ssl_details
-        except Exception as e:
-            logger.debug(f'Erreur analyse SSL détaillée: {e}')
-        
-        # Détection WAF
-        try:
-            waf_detections = self._detect_waf(url, progress_callback)
-            if waf_detections:
-                results['waf_detections'] = waf_detections
-        except Exception as e:
-            logger.debug(f'Erreur détection WAF: {e}')
-        
-        # Découverte de répertoires
-        try:
-            directories = self._discover_directories(url, progress_callback)
-            if directories:
-                results['directories'] = directories
-        except Exception as e:
-            logger.debug(f'Erreur découverte répertoires: {e}')
-        
-        # Informations IP
-        if progress_callback:
-            progress_callback('Récupération des informations IP...')
-        ip = None
-        try:
-            ip = socket.gethostbyname(domain)
-            results['ip_info'] = {
-                'ip': ip,
-                'hostname': socket.gethostbyaddr(ip)[0] if ip else None
-            }
-        except Exception as e:
-            results['ip_error'] = str(e)
+                results['financial_data_error'] = str(e)
+                results['financial_data'] = {}
+            
+            # Test de joignabilité (terminé avant les étapes qui en dépendent)
+            if progress_callback and reachability.exception() is None:
+                reachable = reachability.result()
+                if not reachable['http']:
+                    progress_callback('Site injoignable : détection WAF, répertoires et images ignorées')
+                if not reachable['https']:
+                    progress_callback('Port 443 injoignable : analyses SSL/TLS ignorées')
+            
+            step_results = {}
+            step_errors = {}
+            step_names = {future: name for name, future in futures.items()}
+            for future in as_completed(step_names):
+                name = step_names[future]
+                try:
+                    step_results[name] = future.result()
+                except Exception as e:
+                    step_errors[name] = e
+                if progress_callback:
+                    status = 'en erreur' if name in step_errors else 'terminée'
+                    progress_callback(f'Étape {status} : {OSINT_STEP_LABELS.get(name, name)}')
+        finally:
+            executor.shutdown(wait=True)
+        
+        # Étapes principales : erreur remontée dans les résultats
+        for name, error_key in (('subdomains', 'subdomains_error'), ('dns_records', 'dns_error'),
+                                ('ssl_info', 'ssl_error'), ('technologies', 'tech_error')):
+            if name in step_errors:
+                results[error_key] = str(step_errors[name])
+            elif name in step_results:
+                results[name] = step_results[name]
+        # Erreur de résolution : remontée à part (pas enregistrée comme un type d'enregistrement)
+        if isinstance(results['dns_records'], dict) and 'error' in results['dns_records']:
+            results['dns_error'] = results['dns_records'].pop('error')
+        if 'subdomains_error' in results and progress_callback:
+            progress_callback(f'Erreur lors de la découverte de sous-domaines: {results["subdomains_error"]}')
+        # Compté à la réception des enregistrements (les valeurs non-listes sont des erreurs)
+        dns_records_count = sum(len(v) for v in results['dns_records'].values() if isinstance(v, list))
+        
+        # Analyses OSINT avancées (téléphones, personnes)
+        for name, label in (('phone_osint', 'de l\'analyse OSINT des téléphones'),
+                            ('people_osint', 'de l\'analyse OSINT approfondie des personnes')):
+            if name in step_errors:
+                logger.warning(f'Erreur lors {label}: {step_errors[name]}')
+                results[f'{name}_error'] = str(step_errors[name])
+            elif name in step_results:
+                results[name] = step_results[name]
+        
+        # Étapes complémentaires : conservées seulement si elles ont trouvé quelque chose
+        for name in ('ssl_details', 'waf_detections', 'directories', 'document_metadata',
+                     'image_metadata', 'ip_geolocation'):
+            if name in step_errors:
+                logger.debug(f'Erreur étape OSINT {name}: {step_errors[name]}')
+            elif step_results.get(name):
+                results[name] = step_results[name]
         
         # Scan des ports et services (Shodan/Censys)
-        if ip:
-            try:
-                port_scan_results = self._scan_ports_and_services(domain, ip, progress_callback)
-                if port_scan_results.get('open_ports'):
-                    results['open_ports'] = port_scan_results['open_ports']
-                if port_scan_results.get('services'):
-                    results['services'] = port_scan_results['services']
-                if port_scan_results.get('certificates'):
-                    results['certificates'] = port_scan_results['certificates']
-            except Exception as e:
-                logger.debug(f'Erreur scan ports/services: {e}')
-        
-        # Recherche de métadonnées de documents
-        try:
-            document_metadata = self._search_document_metadata(domain, progress_callback)
-            if document_metadata:
-                results['document_metadata'] = document_metadata
-        except Exception as e:
-            logger.debug(f'Erreur recherche métadonnées documents: {e}')
-        
-        # Recherche de métadonnées d'images
-        try:
-            image_metadata = self._search_image_metadata(url, progress_callback)
-            if image_metadata:
-                results['image_metadata'] = image_metadata
-        except Exception as e:
-            logger.debug(f'Erreur recherche métadonnées images: {e}')
-        
-        # Technologies
-        if progress_callback:
-            progress_callback('Détection des technologies...')
-        try:
-            results['technologies'] = self.detect_technologies(url)
-        except Exception as e:
-            results['tech_error'] = str(e)
+        if 'port_scan' in step_errors:
+            logger.debug(f'Erreur scan ports/services: {step_errors["port_scan"]}')
+        port_scan_results = step_results.get('port_scan') or {}
+        for key in ('open_ports', 'services', 'certificates'):
+            if port_scan_results.get(key):
+                results[key] = port_scan_results[key]
         
         # Résumé
         people_count = results.get('people', {}).get('summary', {}).get('total_people', 0)
@@ -2065,7 +2914,7 @@ class OSINTAnalyzer:
             'subdomains_count': len(results['subdomains']),
             'emails_count': len(results['emails']),
             'people_count': people_count,
-            'dns_records_count': sum(len(v) for v in results['dns_records'].values() if isinstance(v, list)),
+            'dns_records_count': dns_records_count,
             'tools_used': [k for k, v in self.tools.items() if v]
         }
         
@@ -0,0 +1,229 @@
+"""
+Cache des résultats OSINT (WHOIS, DNS, sous-domaines, outils WSL, analyses techniques)
+
+Deux niveaux :
+- un cache mémoire (LRU avec TTL) propre au processus
+- un cache disque partagé entre les processus (diskcache, si installé)
+
+Les clés sont calculées à partir du nom de la fonction et de ses arguments.
+"""
+
+import copy
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    from config import OSINT_CACHE_ENABLED, OSINT_CACHE_DIR
+except ImportError:
+    OSINT_CACHE_ENABLED = os.environ.get('OSINT_CACHE_ENABLED', 'true').lower() == 'true'
+    OSINT_CACHE_DIR = os.environ.get('OSINT_CACHE_DIR', str(Path(__file__).parent.parent / 'cache' / 'osint'))
+
+logger = logging.getLogger(__name__)
+
+# Durées de validité par type de donnée (secondes)
+WHOIS_TTL = 24 * 3600
+DNS_TTL = 3600
+SUBDOMAINS_TTL = 6 * 3600
+PEOPLE_TTL = 6 * 3600
+PHONE_TTL = 24 * 3600
+TOOLS_TTL = 3600
+# Analyse technique complète d'un site (courte : le site peut changer entre deux analyses)
+TECHNICAL_ANALYSIS_TTL = 600
+
+# Clés signalant un résultat en erreur ou partiel (jamais mis en cache) : erreur
+# globale, tâches hors délai, page d'une analyse technique inaccessible
+PARTIAL_RESULT_KEYS = ('error', 'timed_out_tasks', 'page_error')
+
+# Nombre maximum d'entrées dans le cache mémoire
+MEMORY_CACHE_SIZE = 1024
+
+_memory_cache = OrderedDict()
+_memory_lock = threading.Lock()
+
+_disk_cache = None
+_disk_lock = threading.Lock()
+
+
+def _get_disk_cache():
+    """
+    Retourne le cache disque (créé à la première utilisation)
+    
+    Returns:
+        diskcache.Cache ou None si diskcache n'est pas disponible
+    """
+    global _disk_cache
+    
+    if diskcache is None:
+        return None
+    
+    if _disk_cache is None:
+        with _disk_lock:
+            if _disk_cache is None:
+                try:
+                    _disk_cache = diskcache.Cache(str(OSINT_CACHE_DIR))
+                except Exception as e:
+                    logger.warning(f'Cache disque OSINT indisponible: {e}')
+                    return None
+    return _disk_cache
+
+
+def make_key(name, args=(), kwargs=None):
+    """
+    Calcule la clé de cache d'un appel
+    
+    Args:
+        name: Nom de la fonction ou de l'outil
+        args: Arguments positionnels
+        kwargs: Arguments nommés
+    
+    Returns:
+        str: Empreinte SHA-256 de l'appel
+    """
+    payload = json.dumps(
+        {'fn': name, 'args': list(args), 'kwargs': kwargs or {}},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def is_cacheable(value):
+    """
+    Indique si un résultat mérite d'être mis en cache
+    
+    Les résultats vides, en erreur ou partiels (voir PARTIAL_RESULT_KEYS) ne
+    sont pas conservés pour ne pas masquer une indisponibilité passagère d'un outil.
+    """
+    if not value:
+        return False
+    if isinstance(value, dict) and any(value.get(key) for key in PARTIAL_RESULT_KEYS):
+        return False
+    return True
+
+
+def get(key):
+    """
+    Récupère une valeur du cache (mémoire puis disque)
+    
+    Args:
+        key: Clé de cache
+    
+    Returns:
+        La valeur (copie) ou None si absente ou expirée
+    """
+    if not OSINT_CACHE_ENABLED:
+        return None
+    
+    now = time.time()
+    with _memory_lock:
+        entry = _memory_cache.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                _memory_cache.move_to_end(key)
+                return copy.deepcopy(value)
+            del _memory_cache[key]
+    
+    disk = _get_disk_cache()
+    if disk is not None:
+        try:
+            entry = disk.get(key)
+        except Exception as e:
+            logger.debug(f'Erreur lecture cache disque OSINT: {e}')
+            entry = None
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                _set_memory(key, value, expires_at)
+                return copy.deepcopy(value)
+    
+    return None
+
+
+def put(key, value, ttl):
+    """
+    Enregistre une valeur dans le cache (mémoire et disque)
+    
+    Args:
+        key: Clé de cache
+        value: Valeur à conserver
+        ttl: Durée de validité en secondes
+    """
+    if not OSINT_CACHE_ENABLED:
+        return
+    
+    expires_at = time.time() + ttl
+    value = copy.deepcopy(value)
+    _set_memory(key, value, expires_at)
+    
+    disk = _get_disk_cache()
+    if disk is not None:
+        try:
+            disk.set(key, (expires_at, value), expire=ttl)
+        except Exception as e:
+            logger.debug(f'Erreur écriture cache disque OSINT: {e}')
+
+
+def _set_memory(key, value, expires_at):
+    """Enregistre une entrée dans le cache mémoire (éviction LRU)"""
+    with _memory_lock:
+        _memory_cache[key] = (expires_at, value)
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def clear():
+    """Vide le cache mémoire et le cache disque"""
+    with _memory_lock:
+        _memory_cache.clear()
+    disk = _get_disk_cache()
+    if disk is not None:
+        disk.clear()
+
+
+def cached(ttl, ignore=('progress_callback',)):
+    """
+    Décorateur de mise en cache pour les méthodes des analyseurs
+    
+    Le premier argument (self), les callables (callbacks de progression passés
+    en positionnel) et les arguments listés dans `ignore` ne font pas partie
+    de la clé.
+    
+    Args:
+        ttl: Durée de validité en secondes
+        ignore: Noms d'arguments nommés à exclure de la clé
+    
+    Example:
+        >>> @cached(ttl=WHOIS_TTL)
+        ... def get_whois_info(self, domain): ...
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key_args = [arg for arg in args if not callable(arg)]
+            key_kwargs = {k: v for k, v in kwargs.items() if k not in ignore}
+            key = make_key(func.__qualname__, key_args, key_kwargs)
+            
+            value = get(key)
+            if value is not None:
+                return value
+            
+            value = func(self, *args, **kwargs)
+            if is_cacheable(value):
+                put(key, value, ttl)
+            return value
+        return wrapper
+    return decorator
@@ -4,14 +4,30 @@ Détection de versions, frameworks, hébergeur, scan serveur avec nmap
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 import re
 import socket
 import subprocess
 import shutil
+import codecs
+import html
+import io
 import json
+import logging
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime
+from functools import lru_cache
+
+from services import osint_cache, wsl_shell
+from services.osint_cache import cached
+
 try:
     import whois
 except ImportError:
@@ -22,14 +38,444 @@ try:
 except ImportError:
     dns = None
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Importer la configuration
 try:
-    from config import WSL_DISTRO, WSL_USER
+    from config import WSL_DISTRO, WSL_USER, WSL_PERSISTENT_SHELL
 except ImportError:
     # Valeurs par défaut si config n'est pas disponible
     import os
     WSL_DISTRO = os.environ.get('WSL_DISTRO', 'kali-linux')
     WSL_USER = os.environ.get('WSL_USER', 'loupix')
+    WSL_PERSISTENT_SHELL = os.environ.get('WSL_PERSISTENT_SHELL', 'true').lower() == 'true'
+
+logger = logging.getLogger(__name__)
+
+# Taille du pool de connexions HTTP de la session partagée
+HTTP_POOL_SIZE = 20
+# Nombre de requêtes réseau (HTTP, DNS, WHOIS, SSL, nmap) lancées en parallèle par analyse
+ANALYSIS_MAX_WORKERS = 8
+# Nombre de pages téléchargées en parallèle par le crawl multi-pages
+CRAWL_MAX_WORKERS = 8
+# Durée maximale d'un scan nmap, par hôte scanné (secondes)
+NMAP_TIMEOUT = 60
+# Délai maximal de chaque tâche d'une analyse, compté depuis son lancement (secondes) :
+# une tâche hors délai est ignorée (résultats partiels) au lieu de bloquer l'analyse
+ANALYSIS_TASK_TIMEOUTS = {
+    'page': 30,
+    'dns': 15,
+    'dns_advanced': 20,
+    'whois': 20,
+    'ssl': 15,
+    'robots': 20,
+    'sitemap': 20,
+    # Lancé après la page (30 s), sondes de 5 s comprises
+    'waf': 45,
+    'nmap': NMAP_TIMEOUT + 30,
+}
+# Taille maximale lue d'une page HTML (au-delà, le corps est tronqué). Supérieure au
+# dernier palier du score de performance (1,5 Mo) pour que le score reste inchangé
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Méthode nmap détectée par (distribution, utilisateur) pour le processus
+_nmap_availability = {}
+_nmap_availability_lock = threading.Lock()
+
+
+# Regex de détection, compilées une seule fois
+_VERSION = r'(\d+\.\d+(?:\.\d+)?)'
+_VERSION_RE = re.compile(_VERSION)
+_APACHE_VERSION_RE = re.compile(r'apache[/\s]' + _VERSION)
+# Versions cherchées dans tout le HTML : motifs en minuscules appliqués au texte
+# déjà mis en minuscules (sans re.I, le moteur saute directement au mot-clé
+# au lieu de tester chaque caractère ; environ 9x plus rapide sur une grosse page)
+_WORDPRESS_VERSION_RE = re.compile(r'wordpress\s+' + _VERSION)
+_WP_ASSET_VERSION_RE = re.compile(r'ver=' + _VERSION)
+_DRUPAL_VERSION_RE = re.compile(r'drupal\s+' + _VERSION)
+_DRUPAL_JS_VERSION_RE = re.compile(r'drupal\.js\?v=' + _VERSION)
+_JOOMLA_GENERATOR_VERSION_RE = re.compile(r'joomla[!\s]+' + _VERSION)
+_JOOMLA_VERSION_RE = re.compile(r'joomla[.\s]+' + _VERSION)
+_MAGENTO_VERSION_RE = re.compile(r'magento[.\s]+' + _VERSION)
+_PRESTASHOP_VERSION_RE = re.compile(r'prestashop[.\s]+' + _VERSION)
+_SHOPIFY_VERSION_RE = re.compile(r'shopify[.\s]+' + _VERSION)
+_REACT_VERSION_RE = re.compile(r'react[.-]?' + _VERSION, re.I)
+_VUE_VERSION_RE = re.compile(r'vue[.-]?' + _VERSION, re.I)
+_ANGULAR_VERSION_RE = re.compile(r'angular[.-]?' + _VERSION, re.I)
+_NEXT_VERSION_RE = re.compile(r'next[.-]?' + _VERSION, re.I)
+_BOOTSTRAP_VERSION_RE = re.compile(r'bootstrap[.-]?' + _VERSION)
+_JQUERY_VERSION_RE = re.compile(r'jquery[.-]?' + _VERSION)
+_SITEMAP_RE = re.compile(r'sitemap:\s*(.+)', re.I)
+_CHARSET_RE = re.compile(r'charset=([^;]+)', re.I)
+_TITLE_RE = re.compile(r'<title[^>]*>([^<]*)</title>', re.I)
+# Filtres d'attributs BeautifulSoup
+_OG_PROPERTY_RE = re.compile(r'^og:')
+_TWITTER_NAME_RE = re.compile(r'^twitter:')
+_FONT_REL_RE = re.compile(r'font|preload', re.I)
+_CONTENT_TYPE_RE = re.compile(r'content-type', re.I)
+_APPLE_TOUCH_ICON_RE = re.compile(r'apple-touch-icon', re.I)
+_SKIP_LINK_RE = re.compile(r'#(main|content|skip)', re.I)
+
+# Marqueurs des frameworks (HTML en minuscules), testés dans l'ordre : le premier l'emporte
+# ('reactjs' et 'vuejs' contiennent déjà 'react' et 'vue')
+FRAMEWORK_KEYWORDS = (
+    ('WordPress', ('wp-content', 'wordpress')),
+    ('Drupal', ('drupal',)),
+    ('Joomla', ('joomla',)),
+    ('React', ('react',)),
+    ('Vue.js', ('vue',)),
+    ('Angular', ('angular',)),
+)
+# Frameworks JS dont la version est lue dans l'URL des scripts (les autres : meta generator)
+_FRAMEWORK_SCRIPT_VERSION_RE = {
+    'React': _REACT_VERSION_RE,
+    'Vue.js': _VUE_VERSION_RE,
+    'Angular': _ANGULAR_VERSION_RE,
+}
+
+# Marqueurs HTML de chaque CMS (sous-chaînes en minuscules, cherchées dans le HTML
+# mis en minuscules), dans l'ordre de test : le premier CMS reconnu l'emporte, les plus
+# répandus sont donc testés d'abord (et Shopify, aux marqueurs spécifiques, avant les
+# chemins génériques de Magento/PrestaShop)
+CMS_PATTERNS = {
+    'WordPress': [
+        'wp-content', 'wp-includes', '/wp-admin', 'wordpress',
+        'wp-json', 'wp-embed'
+    ],
+    'Shopify': [
+        'shopify', 'shopifycdn', 'cdn.shopify'
+    ],
+    'Joomla': [
+        '/media/jui', '/administrator', 'joomla'
+    ],
+    'Drupal': [
+        '/sites/default', 'drupal.js', 'drupal.css', 'drupal.settings'
+    ],
+    'Magento': [
+        '/media/', '/skin/', 'mage.', 'magento'
+    ],
+    'PrestaShop': [
+        '/themes/', '/modules/', 'prestashop'
+    ],
+    'WooCommerce': [
+        'woocommerce', 'wc-', '/wp-content/plugins/woocommerce'
+    ]
+}
+
+# Marqueurs HTML des services d'analytics (sous-chaînes en minuscules)
+ANALYTICS_SERVICES = {
+    'Google Analytics': ['google-analytics', 'ga.js', 'analytics.js', 'gtag.js', 'googletagmanager'],
+    'Google Tag Manager': ['googletagmanager', 'gtm.js'],
+    'Facebook Pixel': ['facebook.net', 'fbq', 'facebook.com/tr'],
+    'Hotjar': ['hotjar'],
+    'Mixpanel': ['mixpanel'],
+    'Segment': ['segment'],
+    'Adobe Analytics': ['omniture', 'adobe', 'adobedtm']
+}
+
+
+# Préfixes des mots-clés qui désignent des noms de headers HTTP
+_HEADER_NAME_PREFIXES = ('x-', 'cf-')
+# Headers de sécurité pris en compte dans les scores (minuscules avec tirets)
+_IMPORTANT_SECURITY_HEADERS = frozenset({
+    'content-security-policy',
+    'strict-transport-security',
+    'x-frame-options',
+    'x-content-type-options',
+    'referrer-policy'
+})
+
+
+def _first_owner_keywords(groups):
+    """
+    Aplatit un dictionnaire {nom: [mots-clés]} en liste ordonnée (mot-clé, nom)
+    
+    Les mots-clés sont mis en minuscules une seule fois. Un mot-clé déjà vu
+    pour un nom précédent est ignoré : absent pour le premier, il l'est aussi
+    pour les suivants.
+    
+    Args:
+        groups: Dictionnaire {nom: liste de mots-clés}, dans l'ordre de priorité
+    
+    Returns:
+        list: Couples (mot-clé en minuscules, nom)
+    """
+    keywords = []
+    seen = set()
+    for name, group_keywords in groups.items():
+        for keyword in group_keywords:
+            keyword_lower = keyword.lower()
+            if keyword_lower not in seen:
+                seen.add(keyword_lower)
+                keywords.append((keyword_lower, name))
+    return keywords
+
+
+def _os_family(os_info):
+    """
+    Ramène une description d'OS nmap à une famille (Debian, Windows...)
+    
+    Args:
+        os_info: Nom d'OS proposé par nmap (ex: "Linux 5.0 - 5.4")
+    
+    Returns:
+        str: Famille d'OS ou None si non reconnue
+    """
+    if 'Linux' in os_info:
+        if 'Debian' in os_info:
+            return 'Debian'
+        if 'Ubuntu' in os_info:
+            return 'Ubuntu'
+        if 'CentOS' in os_info:
+            return 'CentOS'
+        if 'Red Hat' in os_info or 'RHEL' in os_info:
+            return 'Red Hat'
+        if 'Fedora' in os_info:
+            return 'Fedora'
+        return 'Linux'
+    if 'Windows' in os_info:
+        return 'Windows'
+    if 'FreeBSD' in os_info:
+        return 'FreeBSD'
+    if 'OpenBSD' in os_info:
+        return 'OpenBSD'
+    return None
+
+
+def _script_version(soup, pattern):
+    """
+    Cherche une version dans les src des balises <script> (première trouvée)
+    
+    Les balises sont sélectionnées par leur seul nom (chemin rapide de
+    BeautifulSoup) : le filtre src=True de find_all coûte environ 3x plus cher.
+    
+    Args:
+        soup: Page analysée
+        pattern: Regex compilée dont le groupe 1 est la version
+    
+    Returns:
+        str: Version trouvée ou None
+    """
+    for script in soup.find_all('script'):
+        src = script.get('src')
+        if src:
+            version_match = pattern.search(src)
+            if version_match:
+                return version_match.group(1)
+    return None
+
+
+def _declared_length(response):
+    """
+    Taille du corps annoncée par le header Content-Length
+    
+    Args:
+        response: Réponse HTTP
+    
+    Returns:
+        int: Taille en octets (0 si le header est absent ou invalide)
+    """
+    try:
+        return int(response.headers.get('Content-Length', 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+@lru_cache(maxsize=4096)
+def _href_parts(href):
+    """
+    Domaine et schéma d'un lien (mis en cache : menus et pieds de page
+    répètent les mêmes liens sur toutes les pages d'un site)
+    
+    Args:
+        href: Valeur de l'attribut href
+    
+    Returns:
+        tuple: (netloc, scheme)
+    """
+    parsed = urlparse(href)
+    return parsed.netloc, parsed.scheme
+
+
+def _task_result(future, started, task, default=None, timed_out=None):
+    """
+    Résultat d'une tâche d'analyse, ou valeur par défaut si elle dépasse son délai
+    
+    Le délai court depuis le lancement de l'analyse : les tâches tournant en
+    parallèle, celles déjà terminées sont lues sans attente.
+    
+    Args:
+        future: Tâche soumise à l'exécuteur
+        started: Instant de lancement de l'analyse (time.monotonic())
+        task: Nom de la tâche dans ANALYSIS_TASK_TIMEOUTS
+        default: Valeur retournée si la tâche n'a pas fini à temps
+        timed_out: Liste complétée du nom de la tâche si elle dépasse son délai
+    
+    Returns:
+        Résultat de la tâche ou default
+    """
+    try:
+        return future.result(timeout=max(0, started + ANALYSIS_TASK_TIMEOUTS[task] - time.monotonic()))
+    except FuturesTimeoutError:
+        logger.debug(f'Tâche {task} hors délai, ignorée')
+        if timed_out is not None and task not in timed_out:
+            timed_out.append(task)
+        return default
+
+
+# Encodages où un octet ASCII est toujours un caractère ASCII (minuscules possibles sur les octets)
+_ASCII_SAFE_ENCODINGS = ('utf-8', 'ascii', 'cp1252', 'iso8859-1', 'iso8859-15')
+
+
+def _lower_html(response, html_content):
+    """
+    Met le HTML d'une réponse en minuscules pour les détecteurs
+    
+    Les marqueurs cherchés sont tous ASCII : bytes.lower() (ASCII seulement)
+    suivi du décodage suffit, et évite le chemin Unicode de str.lower(),
+    environ 10x plus lent dès que la page contient un caractère accentué.
+    
+    Args:
+        response: Réponse HTTP (corps et encodage)
+        html_content: Texte déjà décodé (response.text), utilisé pour les autres encodages
+    
+    Returns:
+        str: HTML en minuscules
+    """
+    encoding = response.encoding
+    try:
+        if encoding and codecs.lookup(encoding).name in _ASCII_SAFE_ENCODINGS:
+            return response.content.lower().decode(encoding, errors='replace')
+    except LookupError:
+        pass
+    return html_content.lower()
+
+
+def _build_automaton(categories):
+    """
+    Construit un automate Aho-Corasick couvrant plusieurs listes de mots-clés
+    
+    Args:
+        categories: Dictionnaire {catégorie: {nom: [mots-clés en minuscules]}}
+    
+    Returns:
+        ahocorasick.Automaton dont chaque mot-clé donne ses (catégorie, nom),
+        ou None si pyahocorasick n'est pas installé
+    """
+    if ahocorasick is None:
+        return None
+    owners = {}
+    for category, groups in categories.items():
+        for name, keywords in groups.items():
+            for keyword in keywords:
+                owners.setdefault(keyword, []).append((category, name))
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_owners in owners.items():
+        automaton.add_word(keyword, keyword_owners)
+    automaton.make_automaton()
+    return automaton
+
+
+def _keyword_matches(text, categories, automaton):
+    """
+    Repère les noms dont au moins un mot-clé apparaît dans le texte
+    
+    Avec pyahocorasick, tous les mots-clés sont cherchés en une seule passe
+    sur le texte au lieu d'une recherche par mot-clé.
+    
+    Args:
+        text: Texte en minuscules (HTML de la page)
+        categories: Dictionnaire {catégorie: {nom: [mots-clés]}}
+        automaton: Automate construit par _build_automaton, ou None
+    
+    Returns:
+        set: Couples (catégorie, nom) trouvés
+    """
+    if automaton is not None:
+        return {owner for _, keyword_owners in automaton.iter(text) for owner in keyword_owners}
+    return {
+        (category, name)
+        for category, groups in categories.items()
+        for name, keywords in groups.items()
+        if any(keyword in text for keyword in keywords)
+    }
+
+
+# Indicateurs des WAF dans les headers, cherchés dans les lignes "nom: valeur" en
+# minuscules (premier trouvé dans l'ordre du dictionnaire)
+WAF_HEADER_PATTERNS = {
+    'waf': {
+        'Cloudflare': ['cf-ray', 'cf-request-id', 'cf-connecting-ip', 'server: cloudflare', 'cf-visitor'],
+        'Sucuri': ['x-sucuri-id', 'x-sucuri-cache', 'x-sucuri-blocked'],
+        'Incapsula': ['x-iinfo', 'x-cdn', 'incap_ses', 'incap_ses_'],
+        'Akamai': ['x-akamai-transformed', 'akamai-', 'x-akamai-request-id'],
+        'AWS WAF': ['x-amzn-requestid', 'x-amzn-trace-id'],
+        'ModSecurity': ['x-modsec', 'mod_security'],
+        'Wordfence': ['x-wf-', 'wordfence'],
+        'Barracuda': ['barracuda', 'x-barracuda'],
+        'FortiWeb': ['fortinet', 'fortiweb'],
+        'F5 BIG-IP': ['f5', 'bigip', 'x-f5-'],
+        'Imperva': ['imperva', 'x-imperva'],
+        'Radware': ['radware', 'x-radware'],
+        'Citrix NetScaler': ['netscaler', 'ns-cache'],
+        'Palo Alto': ['palo-alto', 'pan-'],
+        'SonicWall': ['sonicwall', 'x-sonicwall'],
+        'Sophos': ['sophos', 'x-sophos'],
+        'Juniper': ['juniper', 'x-juniper']
+    }
+}
+_WAF_HEADER_AUTOMATON = _build_automaton(WAF_HEADER_PATTERNS)
+
+# Marqueurs HTML des WAF (premier trouvé dans l'ordre du dictionnaire)
+WAF_HTML_PATTERNS = {
+    'waf': {
+        'Cloudflare': ['cloudflare', 'checking your browser', 'cf-browser-verification'],
+        'Sucuri': ['sucuri', 'access denied', 'sucuri website firewall'],
+        'Wordfence': ['wordfence', 'blocked by wordfence'],
+        'ModSecurity': ['mod_security', 'modsecurity', 'this error was generated by mod_security'],
+        'Barracuda': ['barracuda', 'barracuda web application firewall'],
+        'FortiWeb': ['fortinet', 'fortiweb'],
+        'Incapsula': ['incapsula', 'incapsula incident id']
+    }
+}
+_WAF_HTML_AUTOMATON = _build_automaton(WAF_HTML_PATTERNS)
+
+# Services tiers cherchés dans le HTML, par clé de résultat
+THIRD_PARTY_SERVICES = {
+    'chat_service': {
+        'Intercom': ['intercom'],
+        'Zendesk Chat': ['zendesk', 'zopim'],
+        'LiveChat': ['livechatinc'],
+        'Tawk.to': ['tawk'],
+        'Drift': ['drift'],
+        'Crisp': ['crisp']
+    },
+    'payment_gateway': {
+        'Stripe': ['stripe', 'stripe.com'],
+        'PayPal': ['paypal'],
+        'Square': ['square'],
+        'Mollie': ['mollie'],
+        'Lydia': ['lydia']
+    },
+    'email_service': {
+        'Mailchimp': ['mailchimp', 'mc-embedded-subscribe-form'],
+        'SendGrid': ['sendgrid'],
+        'Mandrill': ['mandrill'],
+        'Sendinblue': ['sendinblue', 'sib-form']
+    }
+}
+_THIRD_PARTY_AUTOMATON = _build_automaton(THIRD_PARTY_SERVICES)
+
+# Marqueurs des CMS et des analytics, repérés ensemble en une passe sur la page :
+# detect_cms et _detect_analytics n'examinent ensuite que les noms trouvés
+PAGE_MARKERS = {
+    'cms': CMS_PATTERNS,
+    'analytics': ANALYTICS_SERVICES
+}
+_PAGE_MARKERS_AUTOMATON = _build_automaton(PAGE_MARKERS)
 
 
 class TechnicalAnalyzer:
@@ -42,32 +488,21 @@ class TechnicalAnalyzer:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
+        # Session HTTP partagée par toutes les requêtes de l'analyse (connexions réutilisées)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Une nouvelle tentative sur erreur de connexion (connexion keep-alive fermée
+        # par le serveur), sans rejouer les lectures qui ont expiré
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=1, read=0, backoff_factor=0.2)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
-        # Base de données de technologies
-        self.cms_patterns = {
-            'WordPress': [
-                r'wp-content', r'wp-includes', r'/wp-admin', r'wordpress',
-                r'wp-json', r'wp-embed'
-            ],
-            'Drupal': [
-                r'/sites/default', r'drupal\.js', r'drupal\.css', r'Drupal\.settings'
-            ],
-            'Joomla': [
-                r'/media/jui', r'/administrator', r'joomla', r'Joomla'
-            ],
-            'Magento': [
-                r'/media/', r'/skin/', r'Mage\.', r'magento'
-            ],
-            'PrestaShop': [
-                r'/themes/', r'/modules/', r'prestashop'
-            ],
-            'Shopify': [
-                r'shopify', r'shopifycdn', r'cdn\.shopify'
-            ],
-            'WooCommerce': [
-                r'woocommerce', r'wc-', r'/wp-content/plugins/woocommerce'
-            ]
-        }
+        # Base de données de technologies (regex précompilées)
+        self.cms_patterns = CMS_PATTERNS
         
         self.cdn_providers = {
             'Cloudflare': ['cloudflare', 'cf-ray', 'cf-request-id', 'cf-cache-status', 'cf-connecting-ip'],
@@ -99,16 +534,14 @@ class TechnicalAnalyzer:
             'WordPress.com CDN': ['wp.com', 'wordpress.com'],
             'Shopify CDN': ['shopify', 'shopifycdn', 'cdn.shopify.com']
         }
+        # Les mots-clés en 'x-'/'cf-' sont des noms de headers : inutile de les chercher
+        # dans les valeurs ni dans le HTML
+        self._cdn_keywords = [
+            (keyword, cdn, keyword.startswith(_HEADER_NAME_PREFIXES))
+            for keyword, cdn in _first_owner_keywords(self.cdn_providers)
+        ]
         
-        self.analytics_services = {
-            'Google Analytics': ['google-analytics', 'ga.js', 'analytics.js', 'gtag.js', 'googletagmanager'],
-            'Google Tag Manager': ['googletagmanager', 'gtm.js'],
-            'Facebook Pixel': ['facebook.net', 'fbq', 'facebook.com/tr'],
-            'Hotjar': ['hotjar'],
-            'Mixpanel': ['mixpanel'],
-            'Segment': ['segment'],
-            'Adobe Analytics': ['omniture', 'adobe', 'adobedtm']
-        }
+        self.analytics_services = ANALYTICS_SERVICES
         
         # Détecter la disponibilité de nmap (natif ou via WSL)
         self._check_nmap_availability()
@@ -117,13 +550,30 @@ class TechnicalAnalyzer:
         """
         Vérifie si nmap est disponible (natif ou via WSL)
         Stocke le chemin et la méthode à utiliser
+        
+        La détection (un ou deux démarrages de WSL) est faite une seule fois
+        par processus, puis réutilisée par les analyseurs suivants.
+        """
+        cache_key = (WSL_DISTRO, WSL_USER)
+        with _nmap_availability_lock:
+            availability = _nmap_availability.get(cache_key)
+        if availability is None:
+            availability = self._detect_nmap()
+            with _nmap_availability_lock:
+                _nmap_availability[cache_key] = availability
+        self.nmap_method, self.nmap_cmd_base = availability
+    
+    def _detect_nmap(self):
+        """
+        Détecte nmap, d'abord en natif puis via WSL
+        
+        Returns:
+            tuple: (méthode 'native'/'wsl' ou None, commande de base ou None)
         """
         # Vérifier nmap natif
         nmap_path = shutil.which('nmap')
         if nmap_path:
-            self.nmap_method = 'native'
-            self.nmap_cmd_base = ['nmap']
-            return
+            return 'native', ['nmap']
         
         # Vérifier WSL
         wsl_path = shutil.which('wsl')
@@ -137,9 +587,7 @@ class TechnicalAnalyzer:
                     timeout=5
                 )
                 if test_result.returncode == 0:
-                    self.nmap_method = 'wsl'
-                    self.nmap_cmd_base = ['wsl', '-d', WSL_DISTRO, '-u', WSL_USER, 'nmap']
-                    return
+                    return 'wsl', ['wsl', '-d', WSL_DISTRO, '-u', WSL_USER, 'nmap']
             except:
                 pass
             
@@ -152,28 +600,143 @@ class TechnicalAnalyzer:
                     timeout=10
                 )
                 if test_result.returncode == 0 or 'Nmap version' in test_result.stdout:
-                    self.nmap_method = 'wsl'
-                    self.nmap_cmd_base = ['wsl', '-d', WSL_DISTRO, 'nmap']
-                    return
+                    return 'wsl', ['wsl', '-d', WSL_DISTRO, 'nmap']
             except:
                 pass
         
         # Aucune méthode disponible
-        self.nmap_method = None
-        self.nmap_cmd_base = None
+        return None, None
+    
+    @cached(ttl=osint_cache.DNS_TTL)
+    def _resolve_a(self, domain):
+        """
+        Résout un domaine en adresse IPv4 (résultat mis en cache)
+        
+        Args:
+            domain: Domaine à résoudre
+        
+        Returns:
+            str: Adresse IP, ou None si la résolution échoue
+        """
+        try:
+            return socket.gethostbyname(domain)
+        except (socket.error, UnicodeError) as e:
+            logger.debug(f'Résolution DNS impossible pour {domain}: {e}')
+            return None
+    
+    @cached(ttl=osint_cache.DNS_TTL)
+    def _resolve_ptr(self, ip):
+        """
+        Résolution inverse d'une adresse IP (résultat mis en cache)
+        
+        Args:
+            ip: Adresse IP
+        
+        Returns:
+            str: Nom d'hôte, ou None si la résolution inverse échoue
+        """
+        try:
+            return socket.gethostbyaddr(ip)[0]
+        except (socket.error, UnicodeError) as e:
+            logger.debug(f'Résolution inverse impossible pour {ip}: {e}')
+            return None
+    
+    @cached(ttl=osint_cache.DNS_TTL)
+    def _resolve_ns(self, domain):
+        """
+        Récupère les serveurs de noms d'un domaine (résultat mis en cache)
+        
+        Args:
+            domain: Domaine à interroger
+        
+        Returns:
+            list: Serveurs de noms en minuscules (vide si indisponible)
+        """
+        if not dns:
+            return []
+        try:
+            return [str(rdata.target).lower() for rdata in dns.resolver.resolve(domain, 'NS')]
+        except Exception as e:
+            logger.debug(f'Requête NS impossible pour {domain}: {e}')
+            return []
     
     def get_server_headers(self, url):
         """Récupère les headers HTTP du serveur"""
         try:
-            response = requests.head(url, headers=self.headers, timeout=10, allow_redirects=True)
+            response = self.session.head(url, timeout=10, allow_redirects=True)
             return dict(response.headers)
         except:
             try:
-                response = requests.get(url, headers=self.headers, timeout=10, allow_redirects=True)
+                response = self.session.get(url, timeout=10, allow_redirects=True)
                 return dict(response.headers)
             except:
                 return {}
     
+    def _fetch_page(self, url, timeout=15):
+        """
+        Télécharge la page une seule fois : ses headers servent à l'analyse
+        serveur et son contenu aux détections HTML (pas de HEAD préalable)
+        
+        Args:
+            url: URL de la page
+            timeout: Timeout de la requête GET en secondes
+        
+        Returns:
+            tuple: (headers, response). Si le GET échoue, response vaut None et
+            les headers proviennent d'une simple requête HEAD
+        """
+        try:
+            response = self._get_page(url, timeout)
+            return dict(response.headers), response
+        except requests.RequestException as e:
+            logger.debug(f'Téléchargement de {url} impossible: {e}')
+        try:
+            return dict(self.session.head(url, timeout=10, allow_redirects=True).headers), None
+        except requests.RequestException:
+            return {}, None
+    
+    def _get_page(self, url, timeout, html_only=False, skip_oversized=False):
+        """
+        Requête GET dont le corps est lu en flux et limité à MAX_PAGE_BYTES
+        
+        Les empreintes utiles sont en tête de page : une page énorme n'est pas
+        chargée en entier en mémoire, ni mise en minuscules et analysée en entier.
+        
+        Args:
+            url: URL de la page
+            timeout: Timeout de la requête en secondes
+            html_only: Si True, le corps d'une réponse qui n'est pas du HTML
+                (image, PDF... suivis par le crawl) n'est pas téléchargé
+            skip_oversized: Si True, le corps n'est pas téléchargé quand sa taille
+                annoncée (Content-Length) dépasse MAX_PAGE_BYTES
+        
+        Returns:
+            requests.Response: Réponse dont content est le corps (tronqué au besoin,
+            vide s'il n'a pas été téléchargé)
+        """
+        response = self.session.get(url, timeout=timeout, allow_redirects=True, stream=True)
+        if ((html_only and 'text/html' not in response.headers.get('Content-Type', ''))
+                or (skip_oversized and _declared_length(response) > MAX_PAGE_BYTES)):
+            response.close()
+            response._content = b''
+            response._content_consumed = True
+            return response
+        chunks = []
+        size = 0
+        try:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > MAX_PAGE_BYTES:
+                    logger.debug(f'Page {url} tronquée à {MAX_PAGE_BYTES} octets')
+                    break
+        finally:
+            # Connexion rendue au pool si le corps a été lu en entier, fermée sinon
+            response.close()
+        response._content = b''.join(chunks)[:MAX_PAGE_BYTES]
+        response._content_consumed = True
+        return response
+    
     def detect_server_software(self, headers):
         """Détecte le logiciel serveur depuis les headers"""
         server_info = {}
@@ -184,7 +747,7 @@ class TechnicalAnalyzer:
             server_info['server'] = server_header
             
             # Extraire la version
-            version_match = re.search(r'(\d+\.\d+(?:\.\d+)?)', server_header)
+            version_match = _VERSION_RE.search(server_header)
             if version_match:
                 server_info['server_version'] = version_match.group(1)
             
@@ -193,7 +756,7 @@ class TechnicalAnalyzer:
             if 'apache' in server_header_lower:
                 server_info['server_type'] = 'Apache'
                 # Extraire la version Apache plus précisément
-                apache_version = re.search(r'apache[/\s](\d+\.\d+(?:\.\d+)?)', server_header_lower)
+                apache_version = _APACHE_VERSION_RE.search(server_header_lower)
                 if apache_version:
                     server_info['server_version'] = apache_version.group(1)
             elif 'nginx' in server_header_lower:
@@ -232,7 +795,7 @@ class TechnicalAnalyzer:
         # X-Powered-By (PHP, ASP.NET, etc.)
         if 'X-Powered-By' in headers:
             server_info['powered_by'] = headers['X-Powered-By']
-            version_match = re.search(r'(\d+\.\d+(?:\.\d+)?)', headers['X-Powered-By'])
+            version_match = _VERSION_RE.search(headers['X-Powered-By'])
             if version_match:
                 server_info['powered_by_version'] = version_match.group(1)
         
@@ -246,87 +809,50 @@ class TechnicalAnalyzer:
         
         return server_info
     
-    def detect_framework_version(self, soup, html_content, headers):
-        """Détecte le framework et sa version avec précision"""
+    def detect_framework_version(self, soup, html_content, headers, html_lower=None):
+        """Détecte le framework et sa version avec précision
+        
+        html_lower (HTML déjà mis en minuscules) évite une copie de la page
+        quand l'appelant l'a calculé une fois pour tous les détecteurs.
+        """
         framework_info = {}
-        html_lower = html_content.lower()
+        if html_lower is None:
+            html_lower = html_content.lower()
         
-        # WordPress
-        if 'wp-content' in html_lower or 'wordpress' in html_lower:
-            framework_info['framework'] = 'WordPress'
+        framework = next(
+            (name for name, keywords in FRAMEWORK_KEYWORDS if any(keyword in html_lower for keyword in keywords)),
+            None
+        )
+        if framework in _FRAMEWORK_SCRIPT_VERSION_RE:
+            framework_info['framework'] = framework
+            # Chercher dans les scripts
+            version = _script_version(soup, _FRAMEWORK_SCRIPT_VERSION_RE[framework])
+            if version:
+                framework_info['framework_version'] = version
+        elif framework:
+            framework_info['framework'] = framework
             # Version dans meta generator
             meta_gen = soup.find('meta', {'name': 'generator'})
             if meta_gen:
                 gen_content = meta_gen.get('content', '')
-                version_match = re.search(r'(\d+\.\d+(?:\.\d+)?)', gen_content)
+                version_match = _VERSION_RE.search(gen_content)
                 if version_match:
                     framework_info['framework_version'] = version_match.group(1)
             # Version dans les commentaires HTML
-            if not framework_info.get('framework_version'):
-                version_match = re.search(r'wordpress\s+(\d+\.\d+(?:\.\d+)?)', html_content, re.I)
-                if version_match:
-                    framework_info['framework_version'] = version_match.group(1)
-        
-        # Drupal
-        elif 'drupal' in html_lower:
-            framework_info['framework'] = 'Drupal'
-            meta_gen = soup.find('meta', {'name': 'generator'})
-            if meta_gen:
-                gen_content = meta_gen.get('content', '')
-                version_match = re.search(r'(\d+\.\d+(?:\.\d+)?)', gen_content)
-                if version_match:
-                    framework_info['framework_version'] = version_match.group(1)
-        
-        # Joomla
-        elif 'joomla' in html_lower:
-            framework_info['framework'] = 'Joomla'
-            meta_gen = soup.find('meta', {'name': 'generator'})
-            if meta_gen:
-                gen_content = meta_gen.get('content', '')
-                version_match = re.search(r'(\d+\.\d+(?:\.\d+)?)', gen_content)
-                if version_match:
-                    framework_info['framework_version'] = version_match.group(1)
-        
-        # React
-        elif 'react' in html_lower or 'reactjs' in html_lower:
-            framework_info['framework'] = 'React'
-            # Chercher dans les scripts
-            for script in soup.find_all('script', src=True):
-                src = script.get('src', '')
-                version_match = re.search(r'react[.-]?(\d+\.\d+(?:\.\d+)?)', src, re.I)
-                if version_match:
-                    framework_info['framework_version'] = version_match.group(1)
-                    break
-        
-        # Vue.js
-        elif 'vue' in html_lower or 'vuejs' in html_lower:
-            framework_info['framework'] = 'Vue.js'
-            for script in soup.find_all('script', src=True):
-                src = script.get('src', '')
-                version_match = re.search(r'vue[.-]?(\d+\.\d+(?:\.\d+)?)', src, re.I)
+            if framework == 'WordPress' and not framework_info.get('framework_version'):
+                version_match = _WORDPRESS_VERSION_RE.search(html_lower)
                 if version_match:
                     framework_info['framework_version'] = version_match.group(1)
-                    break
-        
-        # Angular
-        elif 'angular' in html_lower:
-            framework_info['framework'] = 'Angular'
-            for script in soup.find_all('script', src=True):
-                src = script.get('src', '')
-                version_match = re.search(r'angular[.-]?(\d+\.\d+(?:\.\d+)?)', src, re.I)
-                if version_match:
-                    framework_info['framework_version'] = version_match.group(1)
-                    break
         
         # Bootstrap
         if 'bootstrap' in html_lower:
-            version_match = re.search(r'bootstrap[.-]?(\d+\.\d+(?:\.\d+)?)', html_lower)
+            version_match = _BOOTSTRAP_VERSION_RE.search(html_lower)
             if version_match:
                 framework_info['css_framework'] = f"Bootstrap {version_match.group(1)}"
         
         # jQuery
         if 'jquery' in html_lower:
-            version_match = re.search(r'jquery[.-]?(\d+\.\d+(?:\.\d+)?)', html_lower)
+            version_match = _JQUERY_VERSION_RE.search(html_lower)
             if version_match:
                 framework_info['js_library'] = f"jQuery {version_match.group(1)}"
         
@@ -337,13 +863,25 @@ class TechnicalAnalyzer:
         info = {}
         
         # Résolution DNS
-        try:
-            ip = socket.gethostbyname(domain)
+        ip = self._resolve_a(domain)
+        if ip:
             info['ip_address'] = ip
-        except:
-            pass
         
-        # WHOIS
+        info.update(self._get_whois_info(domain))
+        return info
+    
+    @cached(ttl=osint_cache.WHOIS_TTL)
+    def _get_whois_info(self, domain):
+        """
+        Récupère les informations WHOIS du domaine (résultat mis en cache)
+        
+        Args:
+            domain: Domaine à interroger
+        
+        Returns:
+            dict: Dates, registrar et serveurs de noms (vide si WHOIS indisponible)
+        """
+        info = {}
         try:
             if whois:
                 w = whois.whois(domain)
@@ -374,13 +912,25 @@ class TechnicalAnalyzer:
     
     def detect_hosting_provider(self, domain, ip=None):
         """Détecte l'hébergeur via IP et domain"""
-        hosting_info = {}
-        
         if not ip:
-            try:
-                ip = socket.gethostbyname(domain)
-            except:
-                return hosting_info
+            ip = self._resolve_a(domain)
+            if not ip:
+                return {}
+        
+        return self._match_hosting_provider(self._resolve_ptr(ip), self._resolve_ns(domain))
+    
+    def _match_hosting_provider(self, hostname, name_servers):
+        """
+        Identifie l'hébergeur à partir du reverse DNS et des serveurs de noms
+        
+        Args:
+            hostname: Nom d'hôte de l'IP (résolution inverse) ou None
+            name_servers: Serveurs de noms du domaine, en minuscules
+        
+        Returns:
+            dict: hostname et hosting_provider si détectés
+        """
+        hosting_info = {}
         
         # Base de données simple d'hébergeurs (peut être étendue)
         hosting_providers = {
@@ -399,8 +949,7 @@ class TechnicalAnalyzer:
         }
         
         # Reverse DNS lookup
-        try:
-            hostname = socket.gethostbyaddr(ip)[0]
+        if hostname:
             hosting_info['hostname'] = hostname
             
             hostname_lower = hostname.lower()
@@ -408,23 +957,15 @@ class TechnicalAnalyzer:
                 if any(keyword in hostname_lower for keyword in keywords):
                     hosting_info['hosting_provider'] = provider
                     break
-        except:
-            pass
         
         # Si pas trouvé, chercher dans les name servers
-        try:
-            if dns:
-                answers = dns.resolver.resolve(domain, 'NS')
-                for rdata in answers:
-                    ns = str(rdata.target).lower()
-                    for provider, keywords in hosting_providers.items():
-                        if any(keyword in ns for keyword in keywords):
-                            hosting_info['hosting_provider'] = provider
-                            break
-                    if hosting_info.get('hosting_provider'):
-                        break
-        except:
-            pass
+        for ns in name_servers:
+            for provider, keywords in hosting_providers.items():
+                if any(keyword in ns for keyword in keywords):
+                    hosting_info['hosting_provider'] = provider
+                    break
+            if hosting_info.get('hosting_provider'):
+                break
         
         return hosting_info
     
@@ -433,105 +974,153 @@ class TechnicalAnalyzer:
         Effectue un scan nmap du serveur (ports ouverts, services, OS)
         Supporte nmap natif Windows ou via WSL (Kali Linux)
         """
-        scan_results = {}
-        
         if not ip:
-            try:
-                ip = socket.gethostbyname(domain)
-            except:
+            ip = self._resolve_a(domain)
+            if not ip:
                 return {'error': 'Impossible de résoudre le domaine'}
         
+        return self.scan_many([ip])[ip]
+    
+    def scan_many(self, ips):
+        """
+        Scanne plusieurs adresses IP avec un seul appel nmap
+        
+        nmap parallélise lui-même les cibles : un lot ne paie qu'une fois le
+        démarrage du processus (et de WSL), au lieu d'une fois par hôte.
+        
+        Args:
+            ips: Liste d'adresses IP
+        
+        Returns:
+            dict: Résultats par adresse IP (même format que nmap_scan)
+        """
+        ips = list(dict.fromkeys(ips))
+        if not ips:
+            return {}
+        
         # Vérifier si nmap est disponible
         if not self.nmap_cmd_base:
-            scan_results['nmap_scan'] = 'Nmap non disponible (ni natif ni via WSL)'
-            return scan_results
+            return {ip: {'nmap_scan': 'Nmap non disponible (ni natif ni via WSL)'} for ip in ips}
         
-        # Construire la commande complète
-        # Note: pour WSL, on doit passer les arguments après 'nmap'
-        if self.nmap_method == 'wsl':
-            cmd = self.nmap_cmd_base + ['-F', '-sV', '--version-intensity', '0', '-O', '--osscan-guess', ip]
-        else:
-            cmd = self.nmap_cmd_base + ['-F', '-sV', '--version-intensity', '0', '-O', '--osscan-guess', ip]
+        # Sortie XML sur stdout (-oX -) : lue directement, sans analyser le texte
+        # Les cibles sont passées en arguments (le shell WSL persistant n'a pas d'entrée standard)
+        args = ['-F', '-sV', '--version-intensity', '0', '-O', '--osscan-guess', '-oX', '-'] + ips
         
         try:
             # Scan rapide des ports communs avec détection OS
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60  # Augmenté à 60s pour WSL qui peut être plus lent
-            )
-            
-            if result.returncode == 0:
-                output = result.stdout
-                
-                # Extraire les ports ouverts
-                open_ports = []
-                port_pattern = r'(\d+)/(tcp|udp)\s+open\s+(\S+)'
-                for match in re.finditer(port_pattern, output):
-                    port = match.group(1)
-                    protocol = match.group(2)
-                    service = match.group(3)
-                    open_ports.append(f"{port}/{protocol} ({service})")
-                
-                scan_results['open_ports'] = ', '.join(open_ports[:10]) if open_ports else 'Aucun port ouvert détecté'
-                scan_results['nmap_scan'] = 'Réussi'
-                
-                # Détecter le serveur web depuis nmap
-                for line in output.split('\n'):
-                    if 'http' in line.lower() or 'apache' in line.lower() or 'nginx' in line.lower():
-                        if 'version' in line.lower():
-                            version_match = re.search(r'(\d+\.\d+(?:\.\d+)?)', line)
-                            if version_match:
-                                scan_results['web_server_detected'] = line.strip()
-                                break
-                
-                # Détecter l'OS depuis nmap
-                os_lines = []
-                in_os_section = False
-                for line in output.split('\n'):
-                    if 'OS details:' in line or 'OS CPE:' in line or 'Aggressive OS guesses:' in line:
-                        in_os_section = True
-                        continue
-                    if in_os_section:
-                        if line.strip() and not line.strip().startswith('Network Distance'):
-                            # Extraire les informations OS
-                            os_info = line.strip()
-                            # Nettoyer et formater
-                            if 'Linux' in os_info:
-                                if 'Debian' in os_info:
-                                    scan_results['os_detected'] = 'Debian'
-                                elif 'Ubuntu' in os_info:
-                                    scan_results['os_detected'] = 'Ubuntu'
-                                elif 'CentOS' in os_info:
-                                    scan_results['os_detected'] = 'CentOS'
-                                elif 'Red Hat' in os_info or 'RHEL' in os_info:
-                                    scan_results['os_detected'] = 'Red Hat'
-                                elif 'Fedora' in os_info:
-                                    scan_results['os_detected'] = 'Fedora'
-                                else:
-                                    scan_results['os_detected'] = 'Linux'
-                            elif 'Windows' in os_info:
-                                scan_results['os_detected'] = 'Windows'
-                            elif 'FreeBSD' in os_info:
-                                scan_results['os_detected'] = 'FreeBSD'
-                            elif 'OpenBSD' in os_info:
-                                scan_results['os_detected'] = 'OpenBSD'
-                            
-                            if 'os_detected' in scan_results:
-                                break
-                        elif line.strip().startswith('Network Distance') or line.strip().startswith('OS detection'):
-                            break
-            else:
-                scan_results['nmap_scan'] = 'Échec'
-                scan_results['nmap_error'] = result.stderr[:100]
-        
+            # 60s par hôte pour WSL qui peut être plus lent
+            result = self._run_nmap(args, NMAP_TIMEOUT * len(ips))
         except FileNotFoundError:
-            scan_results['nmap_scan'] = 'Nmap non installé'
+            return {ip: {'nmap_scan': 'Nmap non installé'} for ip in ips}
         except subprocess.TimeoutExpired:
-            scan_results['nmap_scan'] = 'Timeout'
+            return {ip: {'nmap_scan': 'Timeout'} for ip in ips}
         except Exception as e:
-            scan_results['nmap_scan'] = f'Erreur: {str(e)[:50]}'
+            return {ip: {'nmap_scan': f'Erreur: {str(e)[:50]}'} for ip in ips}
+        
+        if result.get('error') == 'Timeout':
+            return {ip: {'nmap_scan': 'Timeout'} for ip in ips}
+        if result.get('returncode') != 0:
+            return {ip: {'nmap_scan': 'Échec', 'nmap_error': result.get('stderr', '')[:100]} for ip in ips}
+        
+        # Un élément <host> par cible, traité puis libéré au fil de la lecture
+        hosts = {}
+        try:
+            for _, element in ET.iterparse(io.StringIO(result.get('stdout', '')), events=('end',)):
+                if element.tag != 'host':
+                    continue
+                for address in element.iterfind('address'):
+                    if address.get('addrtype') in ('ipv4', 'ipv6'):
+                        hosts[address.get('addr')] = self._parse_nmap_host(element)
+                        break
+                element.clear()
+        except ET.ParseError as e:
+            logger.debug(f'Sortie XML nmap incomplète: {e}')
+        
+        # Un hôte absent du rapport (injoignable) est traité comme sans port ouvert
+        empty_results = {'open_ports': 'Aucun port ouvert détecté', 'nmap_scan': 'Réussi'}
+        return {ip: hosts.get(ip, dict(empty_results)) for ip in ips}
+    
+    def _run_nmap(self, args, timeout):
+        """
+        Lance nmap avec les arguments donnés
+        
+        Via WSL, la commande passe par un shell persistant du pool partagé avec
+        les outils OSINT : le démarrage de wsl.exe n'est payé qu'une fois.
+        
+        Args:
+            args: Arguments de nmap
+            timeout: Timeout en secondes
+        
+        Returns:
+            dict: Résultat au format de wsl_shell (stdout, stderr, returncode) ou {'error': 'Timeout'}
+        
+        Raises:
+            subprocess.TimeoutExpired, FileNotFoundError: En appel direct
+        """
+        if self.nmap_method == 'wsl' and WSL_PERSISTENT_SHELL:
+            try:
+                # Même shell que nmap_cmd_base, sans le 'nmap' final
+                shell_cmd = self.nmap_cmd_base[:-1] + ['bash']
+                return wsl_shell.get_pool(shell_cmd, WSL_DISTRO).run(['nmap'] + args, timeout)
+            except Exception as e:
+                logger.debug(f'Shell WSL persistant indisponible, appel direct de nmap: {e}')
+        
+        result = subprocess.run(
+            self.nmap_cmd_base + args,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+        return {
+            'success': result.returncode == 0,
+            'stdout': result.stdout,
+            'stderr': result.stderr,
+            'returncode': result.returncode
+        }
+    
+    def _parse_nmap_host(self, host):
+        """
+        Extrait ports ouverts, serveur web et OS d'un élément <host> du XML nmap
+        
+        Args:
+            host: Élément <host> de la sortie -oX
+        
+        Returns:
+            dict: Résultats du scan
+        """
+        scan_results = {}
+        
+        # Ports ouverts (et serveur web versionné parmi eux)
+        open_ports = []
+        web_server = None
+        for port in host.iterfind('ports/port'):
+            state = port.find('state')
+            if state is None or state.get('state') != 'open':
+                continue
+            port_label = f"{port.get('portid')}/{port.get('protocol')}"
+            service = port.find('service')
+            service_name = service.get('name', 'unknown') if service is not None else 'unknown'
+            open_ports.append(f"{port_label} ({service_name})")
+            
+            if web_server is None and service is not None and service.get('version'):
+                description = ' '.join(filter(None, (
+                    service_name, service.get('product'), service.get('version'), service.get('extrainfo')
+                )))
+                description_lower = description.lower()
+                if 'http' in description_lower or 'apache' in description_lower or 'nginx' in description_lower:
+                    web_server = f"{port_label} open {description}"
+        
+        scan_results['open_ports'] = ', '.join(open_ports[:10]) if open_ports else 'Aucun port ouvert détecté'
+        scan_results['nmap_scan'] = 'Réussi'
+        if web_server:
+            scan_results['web_server_detected'] = web_server
+        
+        # OS : première correspondance reconnue (nmap les trie par précision)
+        for osmatch in host.iterfind('os/osmatch'):
+            os_detected = _os_family(osmatch.get('name', ''))
+            if os_detected:
+                scan_results['os_detected'] = os_detected
+                break
         
         return scan_results
     
@@ -559,139 +1148,150 @@ class TechnicalAnalyzer:
         
         return dates
     
-    def _detect_cdn(self, headers, html_content):
+    def _detect_cdn(self, headers, html_content, html_lower=None):
         """Détecte le CDN utilisé"""
-        cdn_detected = None
-        
-        # Headers CDN (vérifier les noms de headers directement)
-        headers_lower = {k.lower(): v.lower() for k, v in headers.items()}
+        # Noms et valeurs de headers en minuscules, dans une seule chaîne
         headers_str = ' '.join([f"{k}: {v}" for k, v in headers.items()]).lower()
-        html_lower = html_content.lower() if html_content else ''
+        header_names = ' '.join(headers).lower()
+        if html_lower is None:
+            html_lower = html_content.lower() if html_content else ''
         
-        # Vérifier chaque CDN
-        for cdn, keywords in self.cdn_providers.items():
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                # Vérifier dans les noms de headers
-                if any(keyword_lower in header_name for header_name in headers_lower.keys()):
-                    cdn_detected = cdn
-                    break
-                # Vérifier dans les valeurs de headers
-                if keyword_lower in headers_str:
-                    cdn_detected = cdn
-                    break
-                # Vérifier dans le contenu HTML
-                if keyword_lower in html_lower:
-                    cdn_detected = cdn
-                    break
-            if cdn_detected:
-                break
+        # Premier CDN (ordre de priorité) dont un mot-clé apparaît là où il peut figurer
+        for keyword, cdn, header_name_only in self._cdn_keywords:
+            if header_name_only:
+                if keyword in header_names:
+                    return cdn
+            elif keyword in headers_str or keyword in html_lower:
+                return cdn
         
-        return cdn_detected
+        return None
     
-    def _detect_analytics(self, soup, html_content):
-        """Détecte les services d'analytics"""
+    def _detect_analytics(self, soup, html_content, html_lower=None, markers=None):
+        """
+        Détecte les services d'analytics
+        
+        markers : marqueurs PAGE_MARKERS déjà repérés sur la page, évite de
+        chercher à nouveau chaque mot-clé
+        """
+        if markers is not None:
+            return [
+                service for service in self.analytics_services
+                if ('analytics', service) in markers
+            ] or None
+        
         analytics_detected = []
-        html_lower = html_content.lower() if html_content else ''
+        if html_lower is None:
+            html_lower = html_content.lower() if html_content else ''
         
         for service, keywords in self.analytics_services.items():
-            if any(keyword.lower() in html_lower for keyword in keywords):
+            if any(keyword in html_lower for keyword in keywords):
                 analytics_detected.append(service)
         
         return analytics_detected if analytics_detected else None
     
-    def detect_cms(self, soup, html_content):
-        """Détecte le CMS utilisé et sa version"""
-        html_lower = html_content.lower() if html_content else ''
+    def detect_cms(self, soup, html_content, html_lower=None, markers=None):
+        """
+        Détecte le CMS utilisé et sa version
+        
+        markers : marqueurs PAGE_MARKERS déjà repérés sur la page, seuls les
+        CMS trouvés sont examinés
+        """
+        if html_lower is None:
+            html_lower = html_content.lower() if html_content else ''
         html_content_full = html_content if html_content else ''
         
         for cms, patterns in self.cms_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, html_lower, re.I):
-                    # Détecter la version
-                    version = None
-                    
-                    # WordPress
-                    if cms == 'WordPress':
-                        # Meta generator
-                        meta_gen = soup.find('meta', {'name': 'generator'}) if soup else None
-                        if meta_gen:
-                            gen_content = meta_gen.get('content', '')
-                            version_match = re.search(r'wordpress\s+(\d+\.\d+(?:\.\d+)?)', gen_content, re.I)
-                            if version_match:
-                                version = version_match.group(1)
-                        # Commentaires HTML
-                        if not version:
-                            version_match = re.search(r'wordpress\s+(\d+\.\d+(?:\.\d+)?)', html_content_full, re.I)
-                            if version_match:
-                                version = version_match.group(1)
-                        # Version dans les fichiers CSS/JS
-                        if not version:
-                            version_match = re.search(r'ver=(\d+\.\d+(?:\.\d+)?)', html_content_full)
-                            if version_match:
-                                version = version_match.group(1)
-                    
-                    # Drupal
-                    elif cms == 'Drupal':
-                        meta_gen = soup.find('meta', {'name': 'generator'}) if soup else None
-                        if meta_gen:
-                            gen_content = meta_gen.get('content', '')
-                            version_match = re.search(r'drupal\s+(\d+\.\d+(?:\.\d+)?)', gen_content, re.I)
-                            if version_match:
-                                version = version_match.group(1)
-                        # Version dans les fichiers
-                        if not version:
-                            version_match = re.search(r'drupal\.js\?v=(\d+\.\d+(?:\.\d+)?)', html_content_full, re.I)
-                            if version_match:
-                                version = version_match.group(1)
-                    
-                    # Joomla
-                    elif cms == 'Joomla':
-                        meta_gen = soup.find('meta', {'name': 'generator'}) if soup else None
-                        if meta_gen:
-                            gen_content = meta_gen.get('content', '')
-                            version_match = re.search(r'joomla[!\s]+(\d+\.\d+(?:\.\d+)?)', gen_content, re.I)
-                            if version_match:
-                                version = version_match.group(1)
-                        # Version dans les fichiers
-                        if not version:
-                            version_match = re.search(r'joomla[.\s]+(\d+\.\d+(?:\.\d+)?)', html_content_full, re.I)
-                            if version_match:
-                                version = version_match.group(1)
-                    
-                    # Magento
-                    elif cms == 'Magento':
-                        # Version dans les fichiers JS/CSS
-                        version_match = re.search(r'magento[.\s]+(\d+\.\d+(?:\.\d+)?)', html_content_full, re.I)
-                        if version_match:
-                            version = version_match.group(1)
-                        # Version dans les meta tags
-                        if not version:
-                            meta_version = soup.find('meta', {'name': 'generator'}) if soup else None
-                            if meta_version:
-                                gen_content = meta_version.get('content', '')
-                                version_match = re.search(r'(\d+\.\d+(?:\.\d+)?)', gen_content)
-                                if version_match:
-                                    version = version_match.group(1)
-                    
-                    # PrestaShop
-                    elif cms == 'PrestaShop':
-                        version_match = re.search(r'prestashop[.\s]+(\d+\.\d+(?:\.\d+)?)', html_content_full, re.I)
-                        if version_match:
-                            version = version_match.group(1)
-                    
-                    # Shopify
-                    elif cms == 'Shopify':
-                        # Shopify ne révèle généralement pas sa version, mais on peut chercher dans les scripts
-                        version_match = re.search(r'shopify[.\s]+(\d+\.\d+(?:\.\d+)?)', html_content_full, re.I)
+            if markers is not None:
+                found = ('cms', cms) in markers
+            else:
+                found = any(pattern in html_lower for pattern in patterns)
+            if not found:
+                continue
+            
+            # Détecter la version
+            version = None
+            
+            # WordPress
+            if cms == 'WordPress':
+                # Meta generator
+                meta_gen = soup.find('meta', {'name': 'generator'}) if soup else None
+                if meta_gen:
+                    gen_content = meta_gen.get('content', '')
+                    version_match = _WORDPRESS_VERSION_RE.search(gen_content.lower())
+                    if version_match:
+                        version = version_match.group(1)
+                # Commentaires HTML
+                if not version:
+                    version_match = _WORDPRESS_VERSION_RE.search(html_lower)
+                    if version_match:
+                        version = version_match.group(1)
+                # Version dans les fichiers CSS/JS
+                if not version:
+                    version_match = _WP_ASSET_VERSION_RE.search(html_content_full)
+                    if version_match:
+                        version = version_match.group(1)
+            
+            # Drupal
+            elif cms == 'Drupal':
+                meta_gen = soup.find('meta', {'name': 'generator'}) if soup else None
+                if meta_gen:
+                    gen_content = meta_gen.get('content', '')
+                    version_match = _DRUPAL_VERSION_RE.search(gen_content.lower())
+                    if version_match:
+                        version = version_match.group(1)
+                # Version dans les fichiers
+                if not version:
+                    version_match = _DRUPAL_JS_VERSION_RE.search(html_lower)
+                    if version_match:
+                        version = version_match.group(1)
+            
+            # Joomla
+            elif cms == 'Joomla':
+                meta_gen = soup.find('meta', {'name': 'generator'}) if soup else None
+                if meta_gen:
+                    gen_content = meta_gen.get('content', '')
+                    version_match = _JOOMLA_GENERATOR_VERSION_RE.search(gen_content.lower())
+                    if version_match:
+                        version = version_match.group(1)
+                # Version dans les fichiers
+                if not version:
+                    version_match = _JOOMLA_VERSION_RE.search(html_lower)
+                    if version_match:
+                        version = version_match.group(1)
+            
+            # Magento
+            elif cms == 'Magento':
+                # Version dans les fichiers JS/CSS
+                version_match = _MAGENTO_VERSION_RE.search(html_lower)
+                if version_match:
+                    version = version_match.group(1)
+                # Version dans les meta tags
+                if not version:
+                    meta_version = soup.find('meta', {'name': 'generator'}) if soup else None
+                    if meta_version:
+                        gen_content = meta_version.get('content', '')
+                        version_match = _VERSION_RE.search(gen_content)
                         if version_match:
                             version = version_match.group(1)
-                    
-                    # Retourner le CMS avec sa version si trouvée
-                    if version:
-                        return {'name': cms, 'version': version}
-                    else:
-                        return {'name': cms, 'version': None}
+            
+            # PrestaShop
+            elif cms == 'PrestaShop':
+                version_match = _PRESTASHOP_VERSION_RE.search(html_lower)
+                if version_match:
+                    version = version_match.group(1)
+            
+            # Shopify
+            elif cms == 'Shopify':
+                # Shopify ne révèle généralement pas sa version, mais on peut chercher dans les scripts
+                version_match = _SHOPIFY_VERSION_RE.search(html_lower)
+                if version_match:
+                    version = version_match.group(1)
+            
+            # Retourner le CMS avec sa version si trouvée
+            if version:
+                return {'name': cms, 'version': version}
+            else:
+                return {'name': cms, 'version': None}
         
         return None
     
@@ -709,23 +1309,31 @@ class TechnicalAnalyzer:
         """Vérifie qu'un lien reste sur le même domaine."""
         if not href:
             return False
-        parsed = urlparse(href)
-        if parsed.netloc and parsed.netloc not in (base_netloc, f'www.{base_netloc}'):
+        netloc, scheme = _href_parts(href)
+        if netloc and netloc not in (base_netloc, f'www.{base_netloc}'):
             return False
-        if parsed.scheme and parsed.scheme not in ('http', 'https'):
+        if scheme and scheme not in ('http', 'https'):
             return False
         return True
 
     def _extract_internal_links(self, soup, current_url, base_netloc, max_links=50):
-        """Extrait les liens internes d'une page HTML."""
+        """
+        Extrait les liens internes d'une page HTML.
+
+        Les balises sont sélectionnées par leur seul nom (le filtre href=True de
+        find_all coûte environ 4x plus cher) et chaque href n'est analysé qu'une
+        fois : menus et pieds de page répètent les mêmes liens.
+        """
         links = set()
         if not soup:
             return links
         from urllib.parse import urljoin
-        for link in soup.find_all('a', href=True):
+        seen_hrefs = set()
+        for link in soup.find_all('a'):
             href = link.get('href')
-            if not href or href.startswith('#'):
+            if not href or href in seen_hrefs or href.startswith('#'):
                 continue
+            seen_hrefs.add(href)
             if self._is_internal_link(href, base_netloc):
                 absolute = urljoin(current_url, href)
                 links.add(absolute.split('#')[0])
@@ -737,18 +1345,9 @@ class TechnicalAnalyzer:
         """Calcule un mini-score de sécurité pour une page (0-25)."""
         if not security_headers or not isinstance(security_headers, dict):
             return 0
-        important_headers = [
-            'content-security-policy',
-            'strict-transport-security',
-            'x-frame-options',
-            'x-content-type-options',
-            'referrer-policy'
-        ]
-        score = 0
-        for header in important_headers:
-            if security_headers.get(header) or security_headers.get(header.replace('-', '_')):
-                score += 5
-        return min(25, score)
+        # Headers présents (valeur renseignée), sous leur forme avec tirets
+        present = {key.replace('_', '-') for key, value in security_headers.items() if value}
+        return 5 * len(_IMPORTANT_SECURITY_HEADERS & present)
 
     def _compute_page_performance_score(self, response, content_length):
         """Calcule un score de performance léger par page (0-100)."""
@@ -796,29 +1395,118 @@ class TechnicalAnalyzer:
             score += 10
         
         # Headers de sécurité (jusqu'à 25 points)
-        important = {
-            'content-security-policy',
-            'strict-transport-security',
-            'x-frame-options',
-            'x-content-type-options',
-            'referrer-policy'
-        }
-        headers_found = 0
         # Normaliser headers_presence pour la comparaison (minuscules avec tirets)
         headers_presence_normalized = {h.lower().replace('_', '-') for h in headers_presence}
-        for header in important:
-            # Vérifier avec et sans tirets/underscores
-            if (header in headers_presence_normalized or 
-                header.replace('-', '_') in headers_presence_normalized):
-                headers_found += 1
+        headers_found = len(_IMPORTANT_SECURITY_HEADERS & headers_presence_normalized)
         score += min(headers_found * 5, 25)
         
         return max(0, min(100, score))
 
+    def _crawl_page(self, current_url, extract_links, base_netloc, request_timeout, skip_oversized=False):
+        """
+        Télécharge et analyse une page du crawl multi-pages.
+
+        Args:
+            current_url (str): URL de la page.
+            extract_links (bool): Extraire les liens internes (profondeur maximale non atteinte).
+            base_netloc (str): Domaine du site.
+            request_timeout (int): Timeout de la requête HTTP en secondes.
+            skip_oversized (bool): Ne pas télécharger une page annoncée plus grosse que
+                MAX_PAGE_BYTES (seules sa taille et ses headers sont analysés).
+
+        Returns:
+            dict: page (résumé de la page), headers_presence (headers de sécurité vus),
+            response_time_ms et content_length (None si la requête a échoué), links.
+        """
+        try:
+            response = self._get_page(
+                current_url, request_timeout, html_only=True, skip_oversized=skip_oversized
+            )
+            status_code = response.status_code
+            final_url = response.url
+            content_type = response.headers.get('Content-Type', '')
+            # Corps non téléchargé (pas du HTML, ou trop gros) : taille annoncée par le serveur
+            content_length = len(response.content or b'') or _declared_length(response)
+            response_time_ms = int(response.elapsed.total_seconds() * 1000) if response.elapsed else 0
+
+            soup = None
+            html_content = None
+            title = None
+            if 'text/html' in content_type:
+                html_content = response.text
+                if extract_links:
+                    soup = BeautifulSoup(html_content, 'lxml')
+                    title = soup.title.get_text(strip=True) if soup.title else None
+                else:
+                    # Profondeur maximale : aucun lien à extraire, le titre est lu sans parser la page
+                    title_match = _TITLE_RE.search(html_content)
+                    title = html.unescape(title_match.group(1)).strip() if title_match else None
+
+            security_headers = analyze_security_headers(response.headers)
+            headers_presence = set()
+            for key in security_headers.keys():
+                if key in ('security_score', 'security_level'):
+                    continue
+                headers_presence.add(key.replace('_', '-'))
+            page_security_score = self._compute_page_security_score(security_headers)
+
+            analytics = []
+            if html_content:
+                analytics = self._detect_analytics(soup, html_content) or []
+
+            page_perf_score = self._compute_page_performance_score(response, content_length)
+
+            page = {
+                'url': current_url,
+                'final_url': final_url,
+                'status_code': status_code,
+                'content_type': content_type,
+                'title': title[:120] if title is not None else None,
+                'response_time_ms': int(response.elapsed.total_seconds() * 1000) if response.elapsed else None,
+                'content_length': content_length,
+                'security_headers': security_headers,
+                'security_score': page_security_score,
+                'performance_score': page_perf_score,
+                'analytics': analytics,
+                'trackers_count': len(analytics or [])
+            }
+
+            links = set()
+            if soup and extract_links:
+                links = self._extract_internal_links(soup, final_url or current_url, base_netloc)
+
+            return {
+                'page': page,
+                'headers_presence': headers_presence,
+                'response_time_ms': response_time_ms,
+                'content_length': content_length,
+                'links': links
+            }
+
+        except Exception as err:
+            return {
+                'page': {
+                    'url': current_url,
+                    'status_code': None,
+                    'error': str(err)[:200],
+                    'security_score': 0,
+                    'performance_score': 0,
+                    'trackers_count': 0
+                },
+                'headers_presence': set(),
+                'response_time_ms': None,
+                'content_length': None,
+                'links': set()
+            }
+
     def analyze_site_multipage(self, url, max_pages=20, max_depth=2, request_timeout=10):
         """
         Analyse technique légère sur plusieurs pages (passive, sans pentest).
 
+        Les pages en attente sont téléchargées et analysées par lots en parallèle
+        (CRAWL_MAX_WORKERS) ; les résultats sont fusionnés dans l'ordre de la file,
+        comme pour un parcours en largeur séquentiel.
+
         Args:
             url (str): URL de départ.
             max_pages (int): Nombre maximum de pages à visiter.
@@ -826,7 +1514,7 @@ class TechnicalAnalyzer:
             request_timeout (int): Timeout par requête HTTP en secondes.
         """
         base_url, base_netloc = self._normalize_base_url(url)
-        to_visit = [(base_url, 0)]
+        to_visit = deque([(base_url, 0)])
         visited = set()
         pages = []
         headers_presence = set()
@@ -834,79 +1522,54 @@ class TechnicalAnalyzer:
         total_resp_time = []
         total_weights = []
 
-        while to_visit and len(pages) < max_pages:
-            current_url, depth = to_visit.pop(0)
-            if current_url in visited:
-                continue
-            visited.add(current_url)
-
-            try:
-                response = requests.get(
-                    current_url,
-                    headers=self.headers,
-                    timeout=request_timeout,
-                    allow_redirects=True
-                )
-                status_code = response.status_code
-                final_url = response.url
-                content_type = response.headers.get('Content-Type', '')
-                content_length = len(response.content or b'')
-                total_resp_time.append(int(response.elapsed.total_seconds() * 1000) if response.elapsed else 0)
-                total_weights.append(content_length)
-
-                soup = None
-                html_content = None
-                if 'text/html' in content_type:
-                    html_content = response.text
-                    soup = BeautifulSoup(html_content, 'html.parser')
-
-                security_headers = analyze_security_headers(response.headers)
-                for key in security_headers.keys():
-                    if key in ('security_score', 'security_level'):
+        with ThreadPoolExecutor(max_workers=CRAWL_MAX_WORKERS) as executor:
+            while to_visit and len(pages) < max_pages:
+                # Lot : les prochaines pages non visitées de la file, dans la limite de max_pages
+                batch = []
+                while to_visit and len(pages) + len(batch) < max_pages:
+                    current_url, depth = to_visit.popleft()
+                    if current_url in visited:
                         continue
-                    headers_presence.add(key.replace('_', '-'))
-                page_security_score = self._compute_page_security_score(security_headers)
-
-                analytics = []
-                if soup and html_content:
-                    analytics = self._detect_analytics(soup, html_content) or []
-                total_trackers += len(analytics or [])
-
-                page_perf_score = self._compute_page_performance_score(response, content_length)
-
-                pages.append({
-                    'url': current_url,
-                    'final_url': final_url,
-                    'status_code': status_code,
-                    'content_type': content_type,
-                    'title': soup.title.get_text(strip=True)[:120] if soup and soup.title else None,
-                    'response_time_ms': int(response.elapsed.total_seconds() * 1000) if response.elapsed else None,
-                    'content_length': content_length,
-                    'security_headers': security_headers,
-                    'security_score': page_security_score,
-                    'performance_score': page_perf_score,
-                    'analytics': analytics,
-                    'trackers_count': len(analytics or [])
-                })
-
-                if soup and depth < max_depth:
-                    links = self._extract_internal_links(soup, final_url or current_url, base_netloc)
-                    for link in links:
-                        if link not in visited and len(to_visit) + len(pages) < max_pages * 2:
+                    visited.add(current_url)
+                    batch.append((current_url, depth))
+
+                # File déjà pleine (elle ne fait que grandir pendant la fusion du lot) :
+                # aucun lien de ce lot n'y entrera, inutile de les extraire
+                links_wanted = len(to_visit) + len(batch) + len(pages) < max_pages * 2
+                crawled = executor.map(
+                    lambda item: self._crawl_page(
+                        item[0], links_wanted and item[1] < max_depth, base_netloc, request_timeout,
+                        # Page de départ toujours analysée ; au-delà, une page énorme n'est pas
+                        # téléchargée (son poids pénalise déjà le score de performance)
+                        skip_oversized=item[1] > 0
+                    ),
+                    batch
+                )
+                for pending, ((current_url, depth), result) in enumerate(zip(batch, crawled), 1):
+                    page = result['page']
+                    pages.append(page)
+                    headers_presence.update(result['headers_presence'])
+                    total_trackers += page.get('trackers_count', 0)
+                    if result['response_time_ms'] is not None:
+                        total_resp_time.append(result['response_time_ms'])
+                        total_weights.append(result['content_length'])
+
+                    # Pages du lot pas encore fusionnées : comptées comme encore dans la file
+                    budget = max_pages * 2 - len(pages) - (len(to_visit) + len(batch) - pending)
+                    for link in result['links']:
+                        if budget <= 0:
+                            break
+                        if link not in visited:
                             to_visit.append((link, depth + 1))
+                            budget -= 1
 
-            except Exception as err:
-                pages.append({
-                    'url': current_url,
-                    'status_code': None,
-                    'error': str(err)[:200],
-                    'security_score': 0,
-                    'performance_score': 0,
-                    'trackers_count': 0
-                })
-
-        pages_ok = len([p for p in pages if p.get('status_code') and 200 <= p['status_code'] < 400])
-        pages_error = len([p for p in pages if not p.get('status_code') or p['status_code'] >= 400])
+        pages_ok = pages_error = 0
+        for page in pages:
+            status_code = page.get('status_code')
+            if not status_code or status_code >= 400:
+                pages_error += 1
+            elif status_code >= 200:
+                pages_ok += 1
 
         avg_resp = int(sum(total_resp_time) / len(total_resp_time)) if total_resp_time else None
         avg_weight = int(sum(total_weights) / len(total_weights)) if total_weights else None
@@ -929,19 +1592,34 @@ class TechnicalAnalyzer:
             'headers_presence': headers_presence
         }
 
+    @cached(ttl=osint_cache.TECHNICAL_ANALYSIS_TTL)
     def analyze_site_overview(self, url, max_pages=20, max_depth=2, enable_nmap=False):
         """
         Analyse complète: page principale + multi-pages léger, avec scoring global.
+        
+        Le résultat est mis en cache quelques minutes : une nouvelle analyse de la
+        même URL (même paramètres) pendant ce délai ne refait ni requêtes ni scan.
         """
-        base_results = self.analyze_technical_details(url, enable_nmap=enable_nmap)
-        multipage = self.analyze_site_multipage(url, max_pages=max_pages, max_depth=max_depth)
+        # Page principale et crawl multi-pages sont indépendants : exécutés en parallèle
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            base_future = executor.submit(self.analyze_technical_details, url, enable_nmap=enable_nmap)
+            multipage_future = executor.submit(
+                self.analyze_site_multipage, url, max_pages=max_pages, max_depth=max_depth
+            )
+            base_results = base_future.result()
+            multipage = multipage_future.result()
 
         summary = multipage.get('summary', {})
         headers_presence = multipage.get('headers_presence', set())
         security_score = self._compute_global_security_score(base_results, headers_presence)
 
-        page_perfs = [p.get('performance_score') for p in multipage.get('pages', []) if p.get('performance_score') is not None]
-        performance_score = int(sum(page_perfs) / len(page_perfs)) if page_perfs else None
+        perf_total = perf_count = 0
+        for page in multipage.get('pages', []):
+            page_perf = page.get('performance_score')
+            if page_perf is not None:
+                perf_total += page_perf
+                perf_count += 1
+        performance_score = int(perf_total / perf_count) if perf_count else None
 
         summary['security_score'] = security_score
         summary['performance_score'] = performance_score
@@ -981,9 +1659,37 @@ class TechnicalAnalyzer:
             domain_clean = domain.replace('www.', '')
             
             results = {}
+            is_https = urlparse(url).scheme == 'https'
+            
+            # Les requêtes réseau indépendantes partent toutes en même temps ;
+            # les résultats sont ensuite fusionnés dans l'ordre habituel
+            # (A, NS et WHOIS ne dépendent que du domaine)
+            # Chaque tâche a son propre délai (ANALYSIS_TASK_TIMEOUTS) : une tâche lente
+            # (WHOIS, nmap...) donne des résultats partiels au lieu de bloquer l'analyse
+            started = time.monotonic()
+            # Tâches hors délai : résultat partiel, signalé (et jamais mis en cache)
+            timed_out = []
+            executor = ThreadPoolExecutor(max_workers=ANALYSIS_MAX_WORKERS)
+            page_future = executor.submit(self._fetch_page, url)
+            ip_future = executor.submit(self._resolve_a, domain_clean)
+            ns_future = executor.submit(self._resolve_ns, domain_clean)
+            whois_future = executor.submit(self._get_whois_info, domain_clean)
+            dns_future = executor.submit(analyze_dns_advanced, domain_clean)
+            ssl_future = executor.submit(analyze_ssl_certificate, domain_clean) if is_https else None
+            robots_future = executor.submit(analyze_robots_txt, url, self.session)
+            sitemap_future = executor.submit(analyze_sitemap, url, self.session)
+            
+            # Reverse DNS et scan nmap dépendent de l'IP : lancés dès qu'elle est connue,
+            # sans attendre la page ni le WHOIS
+            ip = _task_result(ip_future, started, 'dns', timed_out=timed_out)
+            ptr_future = executor.submit(self._resolve_ptr, ip) if ip else None
+            nmap_future = executor.submit(self.nmap_scan, domain_clean, ip) if enable_nmap else None
             
-            # Headers HTTP
-            headers = self.get_server_headers(url)
+            # Headers HTTP (ceux de la page téléchargée)
+            headers, response = _task_result(page_future, started, 'page', ({}, None), timed_out=timed_out)
+            if response is None and 'page' not in timed_out:
+                # Site injoignable : analyse sans contenu HTML, signalée (et jamais mise en cache)
+                results['page_error'] = 'Page inaccessible'
             results.update(self.get_http_dates(headers))
             
             # Informations serveur
@@ -991,36 +1697,53 @@ class TechnicalAnalyzer:
             results.update(server_info)
             
             # Informations domaine
-            domain_info = self.get_domain_info(domain_clean)
-            results.update(domain_info)
+            if ip:
+                results['ip_address'] = ip
+            results.update(_task_result(whois_future, started, 'whois', {}, timed_out=timed_out))
             
             # Analyse DNS avancée
             try:
-                dns_advanced = analyze_dns_advanced(domain_clean)
+                dns_advanced = _task_result(dns_future, started, 'dns_advanced', {}, timed_out=timed_out)
                 results.update(dns_advanced)
             except Exception:
                 pass
             
-            # Hébergeur
-            ip = domain_info.get('ip_address')
-            hosting_info = self.detect_hosting_provider(domain_clean, ip)
-            results.update(hosting_info)
+            # Hébergeur (sans IP, ni reverse DNS ni serveurs de noms, comme detect_hosting_provider)
+            if ptr_future:
+                hosting_info = self._match_hosting_provider(
+                    _task_result(ptr_future, started, 'dns', timed_out=timed_out),
+                    _task_result(ns_future, started, 'dns', [], timed_out=timed_out)
+                )
+                results.update(hosting_info)
             
-            # Récupérer le contenu HTML pour analyses approfondies
-            response = None
+            # Contenu HTML pour analyses approfondies (réponse déjà téléchargée)
             soup = None
             html_content = None
             try:
-                response = requests.get(url, headers=self.headers, timeout=15, allow_redirects=True)
-                soup = BeautifulSoup(response.text, 'html.parser')
+                # response.text décode le corps à chaque accès : lu une seule fois
                 html_content = response.text
+                soup = BeautifulSoup(html_content, 'lxml')
+                # Mis en minuscules une seule fois pour tous les détecteurs
+                html_lower = _lower_html(response, html_content)
+                
+                # Seul détecteur à faire des requêtes (sondes de blocage) : lancé en tâche
+                # de fond pendant que les autres détecteurs parcourent la page
+                # Utiliser les headers de la réponse réelle pour une meilleure détection
+                response_headers = response.headers if response else headers
+                waf_future = executor.submit(detect_waf, response_headers, html_content, url, response, html_lower)
+                
+                # Marqueurs CMS et analytics repérés en une seule passe sur la page (sans
+                # pyahocorasick, recherche habituelle : detect_cms s'arrête au premier CMS)
+                markers = None
+                if _PAGE_MARKERS_AUTOMATON is not None:
+                    markers = _keyword_matches(html_lower, PAGE_MARKERS, _PAGE_MARKERS_AUTOMATON)
                 
                 # Framework et CMS
-                framework_info = self.detect_framework_version(soup, html_content, headers)
+                framework_info = self.detect_framework_version(soup, html_content, headers, html_lower)
                 results.update(framework_info)
                 
                 # Détection CMS
-                cms_info = self.detect_cms(soup, html_content)
+                cms_info = self.detect_cms(soup, html_content, html_lower, markers)
                 if cms_info:
                     if isinstance(cms_info, dict):
                         results['cms'] = cms_info.get('name')
@@ -1031,25 +1754,25 @@ class TechnicalAnalyzer:
                     # Détection de plugins
                     try:
                         cms_name = cms_info.get('name') if isinstance(cms_info, dict) else cms_info
-                        plugins = detect_cms_plugins(soup, html_content, cms_name)
+                        plugins = detect_cms_plugins(soup, html_content, cms_name, html_lower)
                         if plugins:
                             results['cms_plugins'] = plugins
                     except Exception:
                         pass
                 
                 # CDN
-                cdn = self._detect_cdn(headers, html_content)
+                cdn = self._detect_cdn(headers, html_content, html_lower)
                 if cdn:
                     results['cdn'] = cdn
                 
                 # Analytics
-                analytics = self._detect_analytics(soup, html_content)
+                analytics = self._detect_analytics(soup, html_content, html_lower, markers)
                 if analytics:
                     results['analytics'] = analytics
                 
                 # Services tiers
                 try:
-                    third_party = detect_third_party_services(soup, html_content)
+                    third_party = detect_third_party_services(soup, html_content, html_lower)
                     results.update(third_party)
                 except Exception:
                     pass
@@ -1078,9 +1801,7 @@ class TechnicalAnalyzer:
                 
                 # WAF
                 try:
-                    # Utiliser les headers de la réponse réelle pour une meilleure détection
-                    response_headers = response.headers if response else headers
-                    waf = detect_waf(response_headers, html_content, url, response)
+                    waf = _task_result(waf_future, started, 'waf', timed_out=timed_out)
                     if waf:
                         results['waf'] = waf
                 except Exception:
@@ -1103,14 +1824,14 @@ class TechnicalAnalyzer:
                 # Performance avancée
                 if response:
                     try:
-                        perf_advanced = analyze_performance_advanced(url, response, html_content)
+                        perf_advanced = analyze_performance_advanced(url, response, html_content, soup)
                         results.update(perf_advanced)
                     except Exception:
                         pass
                 
                 # Frameworks modernes
                 try:
-                    modern_frameworks = detect_modern_frameworks(soup, html_content, headers)
+                    modern_frameworks = detect_modern_frameworks(soup, html_content, headers, html_lower)
                     results.update(modern_frameworks)
                 except Exception:
                     pass
@@ -1124,41 +1845,41 @@ class TechnicalAnalyzer:
                 
                 # Sécurité avancée
                 try:
-                    security_advanced = analyze_security_advanced(url, headers, html_content)
+                    security_advanced = analyze_security_advanced(url, headers, html_content, soup)
                     results.update(security_advanced)
                 except Exception:
                     pass
                 
                 # Mobilité et accessibilité
                 try:
-                    mobile_info = analyze_mobile_accessibility(soup, html_content)
+                    mobile_info = analyze_mobile_accessibility(soup, html_content, html_lower)
                     results.update(mobile_info)
                 except Exception:
                     pass
                 
                 # API endpoints
                 try:
-                    api_info = detect_api_endpoints(soup, html_content)
+                    api_info = detect_api_endpoints(soup, html_content, html_lower)
                     results.update(api_info)
                 except Exception:
                     pass
                 
                 # Plus de services tiers
                 try:
-                    more_services = detect_more_services(soup, html_content)
+                    more_services = detect_more_services(soup, html_content, html_lower)
                     results.update(more_services)
                 except Exception:
                     pass
                 
             except Exception as e:
                 pass  # Continuer même si le HTML ne peut pas être récupéré
+            executor.shutdown(wait=False)
             
             # SSL/TLS
             # Vérifier d'abord si l'URL utilise HTTPS
-            parsed_ssl = urlparse(url)
-            if parsed_ssl.scheme == 'https':
+            if is_https:
                 try:
-                    ssl_info = analyze_ssl_certificate(domain_clean)
+                    ssl_info = _task_result(ssl_future, started, 'ssl', {}, timed_out=timed_out)
                     results.update(ssl_info)
                     # Si ssl_valid n'est pas défini mais qu'on a réussi à se connecter, c'est valide
                     if 'ssl_valid' not in results or results.get('ssl_valid') is None:
@@ -1173,23 +1894,26 @@ class TechnicalAnalyzer:
             
             # Robots.txt
             try:
-                robots_info = analyze_robots_txt(url)
+                robots_info = _task_result(robots_future, started, 'robots', {}, timed_out=timed_out)
                 results.update(robots_info)
             except Exception:
                 pass
             
             # Sitemap
             try:
-                sitemap_info = analyze_sitemap(url)
+                sitemap_info = _task_result(sitemap_future, started, 'sitemap', {}, timed_out=timed_out)
                 results.update(sitemap_info)
             except Exception:
                 pass
             
             # Scan nmap (optionnel, peut être long)
-            if enable_nmap:
-                nmap_results = self.nmap_scan(domain_clean, ip)
+            if nmap_future:
+                nmap_results = _task_result(nmap_future, started, 'nmap', {'nmap_scan': 'Timeout'}, timed_out=timed_out)
                 results.update(nmap_results)
             
+            if timed_out:
+                results['timed_out_tasks'] = timed_out
+            
             return results
         
         except Exception as e:
@@ -1230,10 +1954,11 @@ def analyze_ssl_certificate(domain):
     return ssl_info
 
 
-def detect_cms_plugins(soup, html_content, cms_type):
+def detect_cms_plugins(soup, html_content, cms_type, html_lower=None):
     """Détecte les plugins/extensions selon le CMS."""
     plugins = []
-    html_lower = html_content.lower()
+    if html_lower is None:
+        html_lower = html_content.lower()
     if cms_type == 'WordPress':
         wp_plugins = [
             'woocommerce', 'yoast', 'elementor', 'contact-form-7',
@@ -1243,12 +1968,15 @@ def detect_cms_plugins(soup, html_content, cms_type):
         for plugin in wp_plugins:
             if plugin in html_lower or f'/{plugin}/' in html_lower:
                 plugins.append(plugin)
-        for link in soup.find_all(['link', 'script'], src=True):
-            src = link.get('src', '') or link.get('href', '')
-            if '/wp-content/plugins/' in src:
-                plugin_name = src.split('/wp-content/plugins/')[1].split('/')[0]
-                if plugin_name not in plugins:
-                    plugins.append(plugin_name)
+        # Scripts (src) et feuilles de style (href) servis depuis le dossier des plugins
+        plugin_assets = soup.select(
+            'script[src*="/wp-content/plugins/"], link[href*="/wp-content/plugins/"]'
+        ) if soup else []
+        for asset in plugin_assets:
+            src = asset.get('src') if asset.name == 'script' else asset.get('href')
+            plugin_name = src.split('/wp-content/plugins/')[1].split('/')[0]
+            if plugin_name not in plugins:
+                plugins.append(plugin_name)
     elif cms_type == 'Drupal':
         drupal_modules = ['views', 'ctools', 'panels', 'pathauto']
         for module in drupal_modules:
@@ -1257,60 +1985,39 @@ def detect_cms_plugins(soup, html_content, cms_type):
     return ', '.join(plugins[:10]) if plugins else None
 
 
-def detect_third_party_services(soup, html_content):
+def detect_third_party_services(soup, html_content, html_lower=None):
     """Détecte les services tiers utilisés."""
     services = {}
-    html_lower = html_content.lower()
-    chat_services = {
-        'Intercom': ['intercom'],
-        'Zendesk Chat': ['zendesk', 'zopim'],
-        'LiveChat': ['livechatinc'],
-        'Tawk.to': ['tawk'],
-        'Drift': ['drift'],
-        'Crisp': ['crisp']
-    }
-    for service, keywords in chat_services.items():
-        if any(keyword in html_lower for keyword in keywords):
+    if html_lower is None:
+        html_lower = html_content.lower()
+    found = _keyword_matches(html_lower, THIRD_PARTY_SERVICES, _THIRD_PARTY_AUTOMATON)
+    for service in THIRD_PARTY_SERVICES['chat_service']:
+        if ('chat_service', service) in found:
             services['chat_service'] = service
             break
-    payment_gateways = {
-        'Stripe': ['stripe', 'stripe.com'],
-        'PayPal': ['paypal'],
-        'Square': ['square'],
-        'Mollie': ['mollie'],
-        'Lydia': ['lydia']
-    }
-    for gateway, keywords in payment_gateways.items():
-        if any(keyword in html_lower for keyword in keywords):
-            if 'payment_gateway' not in services:
-                services['payment_gateway'] = []
-            services['payment_gateway'].append(gateway)
-    email_services = {
-        'Mailchimp': ['mailchimp', 'mc-embedded-subscribe-form'],
-        'SendGrid': ['sendgrid'],
-        'Mandrill': ['mandrill'],
-        'Sendinblue': ['sendinblue', 'sib-form']
-    }
-    for service, keywords in email_services.items():
-        if any(keyword in html_lower for keyword in keywords):
+    gateways = [gateway for gateway in THIRD_PARTY_SERVICES['payment_gateway'] if ('payment_gateway', gateway) in found]
+    if gateways:
+        services['payment_gateway'] = gateways
+    for service in THIRD_PARTY_SERVICES['email_service']:
+        if ('email_service', service) in found:
             services['email_service'] = service
             break
     return services
 
 
-def analyze_robots_txt(base_url):
-    """Analyse le fichier robots.txt."""
+def analyze_robots_txt(base_url, session=None):
+    """Analyse le fichier robots.txt (session HTTP optionnelle pour réutiliser les connexions)."""
     robots_info = {}
     try:
         from urllib.parse import urljoin
         robots_url = urljoin(base_url, '/robots.txt')
-        response = requests.get(robots_url, timeout=5)
+        response = (session or requests).get(robots_url, timeout=5)
         if response.status_code == 200:
             robots_info['robots_txt_exists'] = True
             content = response.text.lower()
             if 'user-agent' in content:
                 robots_info['robots_has_rules'] = True
-            sitemap_match = re.search(r'sitemap:\s*(.+)', content, re.I)
+            sitemap_match = _SITEMAP_RE.search(content)
             if sitemap_match:
                 robots_info['sitemap_url'] = sitemap_match.group(1).strip()
         else:
@@ -1320,13 +2027,13 @@ def analyze_robots_txt(base_url):
     return robots_info
 
 
-def analyze_sitemap(base_url):
-    """Analyse le sitemap.xml."""
+def analyze_sitemap(base_url, session=None):
+    """Analyse le sitemap.xml (session HTTP optionnelle pour réutiliser les connexions)."""
     sitemap_info = {}
     try:
         from urllib.parse import urljoin
         sitemap_url = urljoin(base_url, '/sitemap.xml')
-        response = requests.get(sitemap_url, timeout=5)
+        response = (session or requests).get(sitemap_url, timeout=5)
         if response.status_code == 200:
             sitemap_info['sitemap_exists'] = True
             try:
@@ -1342,7 +2049,7 @@ def analyze_sitemap(base_url):
     return sitemap_info
 
 
-def detect_waf(headers, html_content, url=None, response=None):
+def detect_waf(headers, html_content, url=None, response=None, html_lower=None):
     """
     Détecte un WAF éventuel.
     
@@ -1351,57 +2058,30 @@ def detect_waf(headers, html_content, url=None, response=None):
         html_content: Contenu HTML de la page
         url: URL de la page (optionnel, pour tester des requêtes suspectes)
         response: Objet response requests (optionnel, pour vérifier les codes de statut)
+        html_lower: HTML déjà mis en minuscules (optionnel, évite une copie de la page)
     
     Returns:
         str: Nom du WAF détecté ou None
     """
     waf_detected = None
     
-    # Liste étendue de WAF commerciaux avec leurs indicateurs
-    waf_headers = {
-        'Cloudflare': ['cf-ray', 'cf-request-id', 'cf-connecting-ip', 'server: cloudflare', 'cf-visitor'],
-        'Sucuri': ['x-sucuri-id', 'x-sucuri-cache', 'x-sucuri-blocked'],
-        'Incapsula': ['x-iinfo', 'x-cdn', 'incap_ses', 'incap_ses_'],
-        'Akamai': ['x-akamai-transformed', 'akamai-', 'x-akamai-request-id'],
-        'AWS WAF': ['x-amzn-requestid', 'x-amzn-trace-id'],
-        'ModSecurity': ['x-modsec', 'mod_security'],
-        'Wordfence': ['x-wf-', 'wordfence'],
-        'Barracuda': ['barracuda', 'x-barracuda'],
-        'FortiWeb': ['fortinet', 'fortiweb'],
-        'F5 BIG-IP': ['f5', 'bigip', 'x-f5-'],
-        'Imperva': ['imperva', 'x-imperva'],
-        'Radware': ['radware', 'x-radware'],
-        'Citrix NetScaler': ['netscaler', 'ns-cache'],
-        'Palo Alto': ['palo-alto', 'pan-'],
-        'SonicWall': ['sonicwall', 'x-sonicwall'],
-        'Sophos': ['sophos', 'x-sophos'],
-        'Juniper': ['juniper', 'x-juniper']
-    }
-    
-    # Vérifier les headers
+    # Vérifier les headers (une seule passe sur les lignes "nom: valeur")
     headers_str = ' '.join([f"{k}: {v}" for k, v in headers.items()]).lower()
-    for waf, indicators in waf_headers.items():
-        if any(ind.lower() in headers_str for ind in indicators):
+    found = _keyword_matches(headers_str, WAF_HEADER_PATTERNS, _WAF_HEADER_AUTOMATON)
+    for waf in WAF_HEADER_PATTERNS['waf']:
+        if ('waf', waf) in found:
             waf_detected = waf
             break
     
     # Vérifier le contenu HTML pour des patterns de WAF
     if html_content:
-        html_lower = html_content.lower()
+        if html_lower is None:
+            html_lower = html_content.lower()
         
-        # Patterns spécifiques dans le HTML
-        html_patterns = {
-            'Cloudflare': ['cloudflare', 'checking your browser', 'cf-browser-verification'],
-            'Sucuri': ['sucuri', 'access denied', 'sucuri website firewall'],
-            'Wordfence': ['wordfence', 'blocked by wordfence'],
-            'ModSecurity': ['mod_security', 'modsecurity', 'this error was generated by mod_security'],
-            'Barracuda': ['barracuda', 'barracuda web application firewall'],
-            'FortiWeb': ['fortinet', 'fortiweb'],
-            'Incapsula': ['incapsula', 'incapsula incident id']
-        }
-        
-        for waf, patterns in html_patterns.items():
-            if any(pattern in html_lower for pattern in patterns):
+        # Patterns spécifiques dans le HTML (une seule passe sur la page)
+        found = _keyword_matches(html_lower, WAF_HTML_PATTERNS, _WAF_HTML_AUTOMATON)
+        for waf in WAF_HTML_PATTERNS['waf']:
+            if ('waf', waf) in found:
                 waf_detected = waf
                 break
     
@@ -1415,6 +2095,8 @@ def detect_waf(headers, html_content, url=None, response=None):
                 # Tester une requête suspecte pour confirmer
                 if url:
                     try:
+                        # Requêtes de test hors de la session de l'analyse : un cookie de
+                        # blocage posé par le WAF ne doit pas suivre les autres requêtes
                         test_url = f"{url.rstrip('/')}/../../../etc/passwd"
                         test_response = requests.get(
                             test_url,
@@ -1480,13 +2162,13 @@ def analyze_seo_meta(soup):
     if meta_keywords:
         seo_info['meta_keywords'] = meta_keywords.get('content', '').strip()[:200]
     og_tags = {}
-    for tag in soup.find_all('meta', property=re.compile(r'^og:')):
+    for tag in soup.find_all('meta', property=_OG_PROPERTY_RE):
         prop = tag.get('property', '').replace('og:', '')
         og_tags[prop] = tag.get('content', '')
     if og_tags:
         seo_info['open_graph'] = json.dumps(og_tags)
     twitter_tags = {}
-    for tag in soup.find_all('meta', attrs={'name': re.compile(r'^twitter:')}):
+    for tag in soup.find_all('meta', attrs={'name': _TWITTER_NAME_RE}):
         name = tag.get('name', '').replace('twitter:', '')
         twitter_tags[name] = tag.get('content', '')
     if twitter_tags:
@@ -1613,14 +2295,15 @@ def analyze_security_headers(headers):
     return security
 
 
-def analyze_performance_advanced(url, response, html_content):
-    """Analyse de performance avancée (taille, ressources...)."""
+def analyze_performance_advanced(url, response, html_content, soup=None):
+    """Analyse de performance avancée (taille, ressources...), sur la soup fournie si elle existe."""
     perf_info = {}
     try:
         perf_info['response_time_ms'] = int(response.elapsed.total_seconds() * 1000)
         perf_info['page_size_bytes'] = len(response.content)
         perf_info['page_size_kb'] = round(perf_info['page_size_bytes'] / 1024, 2)
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if soup is None:
+            soup = BeautifulSoup(html_content, 'lxml')
         images = soup.find_all('img')
         perf_info['images_count'] = len(images)
         images_without_alt = len([img for img in images if not img.get('alt')])
@@ -1634,7 +2317,7 @@ def analyze_performance_advanced(url, response, html_content):
         perf_info['stylesheets_count'] = len(stylesheets)
         links = soup.find_all('a', href=True)
         perf_info['links_count'] = len(links)
-        font_links = soup.find_all('link', {'rel': re.compile(r'font|preload', re.I)})
+        font_links = soup.find_all('link', {'rel': _FONT_REL_RE})
         perf_info['fonts_count'] = len(font_links)
         images_without_lazy = len([img for img in images if not img.get('loading') and not img.get('data-src')])
         if images_without_lazy > 0:
@@ -1656,18 +2339,16 @@ def analyze_performance_advanced(url, response, html_content):
     return perf_info
 
 
-def detect_modern_frameworks(soup, html_content, headers):
+def detect_modern_frameworks(soup, html_content, headers, html_lower=None):
     """Détecte les frameworks modernes (Next, Nuxt, Svelte, etc.)."""
     frameworks = {}
-    html_lower = html_content.lower()
+    if html_lower is None:
+        html_lower = html_content.lower()
     if '__next' in html_lower or '_next' in html_lower or 'next.js' in html_lower:
         frameworks['nextjs'] = True
-        for script in soup.find_all('script', src=True):
-            src = script.get('src', '')
-            version_match = re.search(r'next[.-]?(\d+\.\d+(?:\.\d+)?)', src, re.I)
-            if version_match:
-                frameworks['nextjs_version'] = version_match.group(1)
-                break
+        version = _script_version(soup, _NEXT_VERSION_RE)
+        if version:
+            frameworks['nextjs_version'] = version
     if '__nuxt' in html_lower or 'nuxt' in html_lower:
         frameworks['nuxtjs'] = True
     if 'svelte' in html_lower or '__svelte' in html_lower:
@@ -1700,9 +2381,9 @@ def analyze_content_structure(soup, html_content):
         if meta_charset:
             content_info['charset'] = meta_charset.get('charset')
         else:
-            meta_http_equiv = soup.find('meta', attrs={'http-equiv': re.compile(r'content-type', re.I)})
+            meta_http_equiv = soup.find('meta', attrs={'http-equiv': _CONTENT_TYPE_RE})
             if meta_http_equiv:
-                content_match = re.search(r'charset=([^;]+)', meta_http_equiv.get('content', ''), re.I)
+                content_match = _CHARSET_RE.search(meta_http_equiv.get('content', ''))
                 if content_match:
                     content_info['charset'] = content_match.group(1).strip()
         semantic_tags = ['header', 'nav', 'main', 'article', 'section', 'aside', 'footer']
@@ -1807,12 +2488,13 @@ def analyze_dns_advanced(domain):
     return dns_info
 
 
-def analyze_security_advanced(url, headers, html_content):
-    """Analyse de sécurité avancée (mixed content, SRI, CORS...)."""
+def analyze_security_advanced(url, headers, html_content, soup=None):
+    """Analyse de sécurité avancée (mixed content, SRI, CORS...), sur la soup fournie si elle existe."""
     security_info = {}
     try:
+        if soup is None:
+            soup = BeautifulSoup(html_content, 'lxml')
         if url.startswith('https://'):
-            soup = BeautifulSoup(html_content, 'html.parser')
             mixed_content = []
             for img in soup.find_all('img', src=True):
                 src = img.get('src', '')
@@ -1833,7 +2515,6 @@ def analyze_security_advanced(url, headers, html_content):
                 security_info['mixed_content_detected'] = '; '.join(set(mixed_content))
             else:
                 security_info['mixed_content_detected'] = False
-        soup = BeautifulSoup(html_content, 'html.parser')
         scripts_with_sri = 0
         scripts_without_sri = 0
         for script in soup.find_all('script', src=True):
@@ -1856,22 +2537,24 @@ def analyze_security_advanced(url, headers, html_content):
     return security_info
 
 
-def analyze_mobile_accessibility(soup, html_content):
+def analyze_mobile_accessibility(soup, html_content, html_lower=None):
     """Analyse mobilité / accessibilité basique (viewport, alt, ARIA...)."""
     mobile_info = {}
     try:
+        if html_lower is None:
+            html_lower = html_content.lower()
         viewport = soup.find('meta', {'name': 'viewport'})
         if viewport:
             mobile_info['viewport_meta'] = viewport.get('content', '')
         else:
             mobile_info['viewport_meta'] = 'Manquant'
         mobile_friendly_indicators = [
-            'width=device-width' in html_content.lower(),
-            'initial-scale=1' in html_content.lower(),
-            'maximum-scale=1' in html_content.lower()
+            'width=device-width' in html_lower,
+            'initial-scale=1' in html_lower,
+            'maximum-scale=1' in html_lower
         ]
         mobile_info['mobile_friendly'] = all(mobile_friendly_indicators) if viewport else False
-        apple_touch_icon = soup.find('link', {'rel': re.compile(r'apple-touch-icon', re.I)})
+        apple_touch_icon = soup.find('link', {'rel': _APPLE_TOUCH_ICON_RE})
         if apple_touch_icon:
             mobile_info['apple_touch_icon'] = True
         theme_color = soup.find('meta', {'name': 'theme-color'})
@@ -1883,7 +2566,7 @@ def analyze_mobile_accessibility(soup, html_content):
             mobile_info['images_missing_alt_count'] = len(images_without_alt)
         elements_with_aria = soup.find_all(attrs={'aria-label': True})
         mobile_info['aria_labels_count'] = len(elements_with_aria)
-        skip_links = soup.find_all('a', href=re.compile(r'#(main|content|skip)', re.I))
+        skip_links = soup.find_all('a', href=_SKIP_LINK_RE)
         if skip_links:
             mobile_info['skip_links'] = True
     except Exception:
@@ -1891,11 +2574,13 @@ def analyze_mobile_accessibility(soup, html_content):
     return mobile_info
 
 
-def detect_api_endpoints(soup, html_content):
+def detect_api_endpoints(soup, html_content, html_lower=None):
     """Détecte des patterns d'API (REST, GraphQL, WebSocket...)."""
     api_info = {}
     try:
-        if '/graphql' in html_content.lower() or 'graphql' in html_content.lower():
+        if html_lower is None:
+            html_lower = html_content.lower()
+        if '/graphql' in html_lower or 'graphql' in html_lower:
             api_info['graphql_detected'] = True
         api_patterns = {
             '/api/': 'REST API',
@@ -1907,11 +2592,11 @@ def detect_api_endpoints(soup, html_content):
         }
         detected_apis = []
         for pattern, api_type in api_patterns.items():
-            if pattern in html_content.lower():
+            if pattern in html_lower:
                 detected_apis.append(api_type)
         if detected_apis:
             api_info['api_endpoints_detected'] = ', '.join(set(detected_apis))
-        if 'ws://' in html_content.lower() or 'wss://' in html_content.lower():
+        if 'ws://' in html_lower or 'wss://' in html_lower:
             api_info['websocket_detected'] = True
         json_ld = soup.find_all('script', {'type': 'application/ld+json'})
         if json_ld:
@@ -1933,10 +2618,11 @@ def detect_api_endpoints(soup, html_content):
     return api_info
 
 
-def detect_more_services(soup, html_content):
+def detect_more_services(soup, html_content, html_lower=None):
     """Détecte d'autres services tiers (CRM, vidéo, maps, fonts, commentaires...)."""
     services = {}
-    html_lower = html_content.lower()
+    if html_lower is None:
+        html_lower = html_content.lower()
     crm_services = {
         'Salesforce': ['salesforce', 'sfdc'],
         'HubSpot': ['hubspot'],
@@ -0,0 +1,589 @@
+"""
+Shells WSL persistants pour l'exécution des outils externes
+
+Chaque appel `wsl -d <distro> -u <user> <commande>` paie le démarrage de WSL
+(300 à 800 ms). Ce module garde des shells bash ouverts et leur envoie les
+commandes sur stdin ; la fin d'une commande est repérée par un marqueur unique
+écrit sur stdout (avec le code de retour) et sur stderr.
+
+Chaque commande est lancée sous `timeout -k` côté Linux : l'outil et ses enfants
+sont tués dans la distribution quand le timeout expire. Le délai côté Python
+(timeout + marge) ne sert que si WSL lui-même est bloqué ; le shell ou le
+processus wsl est alors tué, et deux blocages rapprochés provoquent un
+`wsl --terminate` de la distribution.
+"""
+
+import atexit
+import logging
+import queue
+import shlex
+import subprocess
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Dict, Iterator, List
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# Délai supplémentaire accordé pour lire stderr une fois la commande terminée
+STDERR_GRACE_SECONDS = 5
+
+# Nombre maximum de shells inactifs conservés par pool
+MAX_IDLE_SHELLS = 4
+
+# Délai avant SIGKILL quand l'outil ignore SIGTERM (option -k de timeout)
+KILL_AFTER_SECONDS = 5
+
+# Marge côté Python au-delà du timeout Linux avant de considérer WSL bloqué
+WATCHDOG_GRACE_SECONDS = 10
+
+# Deux blocages de WSL dans cet intervalle déclenchent un redémarrage de la distribution
+HANG_WINDOW_SECONDS = 60
+
+# Codes de retour de `timeout` (SIGTERM puis SIGKILL)
+TIMEOUT_EXIT_CODES = (124, 137)
+
+# Variables propres à la session qui a lu l'environnement de login : non transmises
+# aux outils (env -i), toutes les autres variables exportées le sont (proxy, clés d'API...)
+SESSION_ENV_VARS = ('PWD', 'OLDPWD', 'SHLVL', '_', 'WSL_INTEROP')
+
+
+def decode_output(data: bytes) -> str:
+    """Décode une sortie d'outil (octets invalides remplacés, pas supprimés)"""
+    return data.decode('utf-8', errors='replace')
+
+
+def with_linux_timeout(command: List[str], timeout: int) -> List[str]:
+    """
+    Préfixe une commande par `timeout` pour qu'elle soit tuée côté Linux
+    
+    Args:
+        command: Commande et arguments
+        timeout: Timeout en secondes
+    
+    Returns:
+        List[str]: Commande encapsulée
+    """
+    return ['timeout', '-k', str(KILL_AFTER_SECONDS), str(max(1, int(timeout)))] + list(command)
+
+
+def watchdog_timeout(timeout: int) -> float:
+    """Délai côté Python au-delà duquel WSL est considéré comme bloqué"""
+    return timeout + KILL_AFTER_SECONDS + WATCHDOG_GRACE_SECONDS
+
+
+def kill_process_tree(process: subprocess.Popen):
+    """
+    Tue un processus et tous ses descendants
+    
+    subprocess ne tue que le processus direct : sans psutil, les enfants
+    éventuels (et les pipes qu'ils gardent ouverts) survivent.
+    """
+    if psutil is not None:
+        try:
+            parent = psutil.Process(process.pid)
+            for child in parent.children(recursive=True):
+                try:
+                    child.kill()
+                except psutil.Error:
+                    pass
+        except psutil.Error:
+            pass
+    try:
+        process.kill()
+    except Exception:
+        pass
+
+
+_login_envs = {}
+_login_envs_lock = threading.Lock()
+
+
+def get_env_prefix(wsl_cmd_base: List[str]) -> List[str]:
+    """
+    Retourne le préfixe lançant une commande avec l'environnement de login, sans shell
+    
+    L'environnement exporté par `bash -l` est lu une seule fois par processus ;
+    les commandes sont ensuite lancées avec `wsl ... --exec env -i VAR=...` (pas
+    de shell intermédiaire ni de scripts de profil). Toutes les variables sont
+    transmises, sauf celles propres à la session de lecture (SESSION_ENV_VARS).
+    Les chemins Windows (/mnt/...) sont retirés du PATH : leur parcours via WSL
+    ralentit chaque recherche d'exécutable.
+    
+    Args:
+        wsl_cmd_base: Commande WSL de base (ex: ['wsl', '-d', 'kali-linux', '-u', 'user'])
+    
+    Returns:
+        List[str]: Préfixe à placer après wsl_cmd_base, vide si l'environnement
+        n'a pas pu être lu
+    """
+    key = tuple(wsl_cmd_base)
+    with _login_envs_lock:
+        if key in _login_envs:
+            return _login_envs[key]
+    
+    prefix = []
+    try:
+        result = subprocess.run(
+            list(wsl_cmd_base) + ['bash', '-lc', 'env -0'],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            timeout=15
+        )
+        env = {}
+        for entry in result.stdout.split(b'\0'):
+            name, sep, value = entry.decode('utf-8', errors='ignore').partition('=')
+            if sep and name and name not in SESSION_ENV_VARS:
+                env[name] = value
+        if result.returncode == 0 and env.get('PATH'):
+            env['PATH'] = ':'.join(p for p in env['PATH'].split(':') if p and not p.startswith('/mnt/'))
+            prefix = ['--exec', 'env', '-i'] + [f'{name}={value}' for name, value in env.items()]
+    except Exception as e:
+        logger.debug(f'Environnement de login WSL indisponible: {e}')
+    
+    with _login_envs_lock:
+        _login_envs[key] = prefix
+    return prefix
+
+
+_hangs = {}
+_hangs_lock = threading.Lock()
+
+
+def report_hang(distro: str) -> bool:
+    """
+    Signale un blocage de WSL et redémarre la distribution si nécessaire
+    
+    Args:
+        distro: Distribution WSL concernée
+    
+    Returns:
+        bool: True si la distribution a été redémarrée (wsl --terminate)
+    """
+    now = time.monotonic()
+    with _hangs_lock:
+        recent = _hangs.setdefault(distro, deque(maxlen=2))
+        recent.append(now)
+        if len(recent) < 2 or now - recent[0] > HANG_WINDOW_SECONDS:
+            return False
+        recent.clear()
+    
+    logger.warning(f'WSL bloqué à plusieurs reprises, redémarrage de la distribution {distro}')
+    close_all_pools()
+    try:
+        subprocess.run(['wsl', '--terminate', distro], capture_output=True, timeout=30)
+    except Exception as e:
+        logger.debug(f'Erreur wsl --terminate {distro}: {e}')
+    return True
+
+
+def run_process(cmd: List[str], timeout: int, distro: str = None, max_stdout_bytes: int = None) -> Dict:
+    """
+    Exécute une commande WSL dans un processus dédié, avec watchdog
+    
+    La commande (sans le préfixe wsl) doit déjà être encapsulée par
+    with_linux_timeout ; le délai Python est watchdog_timeout(timeout).
+    
+    Args:
+        cmd: Commande complète (wsl -d ... suivi de la commande)
+        timeout: Timeout de l'outil en secondes
+        distro: Distribution WSL (pour la détection des blocages)
+        max_stdout_bytes: Si fourni, seuls ces premiers octets de stdout sont lus
+            et la commande est tuée au-delà (voir run_process_head)
+    
+    Returns:
+        Dictionnaire au format de subprocess (success, stdout, stderr, returncode)
+        ou {'error': 'Timeout'}
+    """
+    if max_stdout_bytes:
+        return run_process_head(cmd, timeout, max_stdout_bytes, distro)
+    
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    try:
+        stdout, stderr = process.communicate(timeout=watchdog_timeout(timeout))
+    except subprocess.TimeoutExpired:
+        kill_process_tree(process)
+        try:
+            process.communicate(timeout=KILL_AFTER_SECONDS)
+        except subprocess.TimeoutExpired:
+            # Des processus orphelins gardent les pipes ouverts : abandonner la lecture
+            pass
+        if distro:
+            report_hang(distro)
+        return {'error': 'Timeout'}
+    
+    if process.returncode in TIMEOUT_EXIT_CODES:
+        return {'error': 'Timeout'}
+    return {
+        'success': process.returncode == 0,
+        'stdout': decode_output(stdout),
+        'stderr': decode_output(stderr),
+        'returncode': process.returncode
+    }
+
+
+def run_process_head(cmd: List[str], timeout: int, max_stdout_bytes: int, distro: str = None) -> Dict:
+    """
+    Exécute une commande WSL en ne lisant que le début de sa sortie standard
+    
+    La lecture s'arrête après max_stdout_bytes octets et l'arbre de processus est
+    tué : le reste de la sortie n'est ni produit en entier, ni alloué, ni décodé.
+    stderr n'est pas collecté.
+    
+    Args:
+        cmd: Commande complète, encapsulée par with_linux_timeout
+        timeout: Timeout de l'outil en secondes
+        max_stdout_bytes: Nombre maximum d'octets de stdout lus
+        distro: Distribution WSL (pour la détection des blocages)
+    
+    Returns:
+        Dictionnaire au format de subprocess, avec 'truncated' si la sortie a été
+        coupée (la commande est alors considérée comme réussie), ou {'error': 'Timeout'}
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    hung = threading.Event()
+    
+    def watchdog():
+        # WSL ne répond plus malgré le timeout côté Linux
+        hung.set()
+        kill_process_tree(process)
+    
+    timer = threading.Timer(watchdog_timeout(timeout), watchdog)
+    timer.start()
+    try:
+        stdout = process.stdout.read(max_stdout_bytes)
+        truncated = len(stdout) >= max_stdout_bytes
+        if truncated:
+            kill_process_tree(process)
+        process.stdout.close()
+        process.wait()
+    finally:
+        timer.cancel()
+    
+    if hung.is_set():
+        if distro:
+            report_hang(distro)
+        return {'error': 'Timeout'}
+    if not truncated and process.returncode in TIMEOUT_EXIT_CODES:
+        return {'error': 'Timeout'}
+    return {
+        'success': truncated or process.returncode == 0,
+        'stdout': decode_output(stdout),
+        'stderr': '',
+        'returncode': process.returncode,
+        'truncated': truncated
+    }
+
+
+class WSLShell:
+    """
+    Shell bash persistant (via WSL) piloté par stdin/stdout
+    """
+    
+    def __init__(self, shell_cmd: List[str]):
+        """
+        Args:
+            shell_cmd: Commande lançant le shell (ex: ['wsl', '-d', 'kali-linux', '-u', 'user', 'bash'])
+        """
+        self.process = subprocess.Popen(
+            shell_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0
+        )
+        self._stdout_lines = queue.Queue()
+        self._stderr_lines = queue.Queue()
+        self._killed = False
+        # Vrai si une commande a dépassé le délai du watchdog (WSL bloqué)
+        self.hung = False
+        for pipe, lines in ((self.process.stdout, self._stdout_lines), (self.process.stderr, self._stderr_lines)):
+            threading.Thread(target=self._read_pipe, args=(pipe, lines), daemon=True).start()
+    
+    @staticmethod
+    def _read_pipe(pipe, lines: queue.Queue):
+        """
+        Lit un pipe ligne par ligne (thread dédié) ; None signale la fin du flux
+        
+        Les lignes restent en octets : elles ne sont décodées que si elles sont utilisées.
+        """
+        try:
+            for line in iter(pipe.readline, b''):
+                lines.put(line)
+        except Exception:
+            pass
+        finally:
+            lines.put(None)
+    
+    def is_alive(self) -> bool:
+        """Indique si le shell est toujours utilisable"""
+        return not self._killed and self.process.poll() is None
+    
+    def kill(self):
+        """Tue le shell (et la commande en cours)"""
+        self._killed = True
+        try:
+            self.process.kill()
+        except Exception:
+            pass
+    
+    def run(self, command: List[str], timeout: int = 30, max_stdout_bytes: int = None) -> Dict:
+        """
+        Exécute une commande dans le shell
+        
+        Args:
+            command: Commande et arguments
+            timeout: Timeout en secondes
+            max_stdout_bytes: Si fourni, la sortie est coupée par `head -c` côté Linux
+                (la commande reçoit SIGPIPE au lieu de produire le reste)
+        
+        Returns:
+            Dictionnaire au format de subprocess (success, stdout, stderr, returncode,
+            et 'truncated' si max_stdout_bytes est fourni) ou {'error': 'Timeout'}
+        
+        Raises:
+            RuntimeError: Si le shell s'est arrêté avant la fin de la commande
+        """
+        marker = self._send(command, timeout, max_stdout_bytes)
+        deadline = time.monotonic() + watchdog_timeout(timeout)
+        stdout, returncode = self._read_until(self._stdout_lines, marker, deadline)
+        if returncode is None:
+            timed_out = time.monotonic() >= deadline
+            self.kill()
+            if not timed_out:
+                raise RuntimeError('Shell WSL terminé avant la fin de la commande')
+            self.hung = True
+            return {'error': 'Timeout'}
+        
+        stderr, _ = self._read_until(self._stderr_lines, marker, time.monotonic() + STDERR_GRACE_SECONDS)
+        truncated = bool(max_stdout_bytes) and len(stdout) >= max_stdout_bytes
+        if not truncated and returncode in TIMEOUT_EXIT_CODES:
+            return {'error': 'Timeout'}
+        result = {
+            'success': truncated or returncode == 0,
+            'stdout': decode_output(stdout),
+            'stderr': decode_output(stderr),
+            'returncode': returncode
+        }
+        if max_stdout_bytes:
+            result['truncated'] = truncated
+        return result
+    
+    def iter_lines(self, command: List[str], timeout: int = 30, needle: bytes = None) -> Iterator[str]:
+        """
+        Exécute une commande et produit sa sortie standard ligne par ligne
+        
+        La lecture s'arrête quand la commande est tuée par son timeout. Si WSL
+        est bloqué ou si l'appelant arrête la lecture avant la fin, le shell est tué.
+        
+        Args:
+            command: Commande et arguments
+            timeout: Timeout en secondes
+            needle: Si fourni, seules les lignes contenant ces octets sont décodées et produites
+        
+        Yields:
+            Lignes de stdout (sans le saut de ligne final)
+        
+        Raises:
+            RuntimeError: Si le shell s'est arrêté avant la fin de la commande
+        """
+        marker = self._send(command, timeout)
+        deadline = time.monotonic() + watchdog_timeout(timeout)
+        completed = False
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    line = self._stdout_lines.get(timeout=max(remaining, 0))
+                except queue.Empty:
+                    logger.debug(f'WSL bloqué : {command[0]} sans réponse après {timeout}s')
+                    self.hung = True
+                    return
+                if line is None:
+                    raise RuntimeError('Shell WSL terminé avant la fin de la commande')
+                if marker in line:
+                    line = line.partition(marker)[0]
+                    if line and (needle is None or needle in line):
+                        yield decode_output(line)
+                    break
+                if needle is None or needle in line:
+                    yield decode_output(line.rstrip(b'\n'))
+            
+            self._read_until(self._stderr_lines, marker, time.monotonic() + STDERR_GRACE_SECONDS)
+            completed = True
+        finally:
+            if not completed:
+                self.kill()
+    
+    def _send(self, command: List[str], timeout: int, max_stdout_bytes: int = None) -> bytes:
+        """
+        Envoie une commande au shell (encapsulée par `timeout`)
+        
+        Args:
+            command: Commande et arguments
+            timeout: Timeout en secondes
+            max_stdout_bytes: Si fourni, stdout passe par `head -c` (le code de
+                retour transmis reste celui de la commande)
+        
+        Returns:
+            bytes: Marqueur unique signalant la fin de la commande
+        """
+        marker = f'__PROSPECTLAB_END_{uuid.uuid4().hex}__'
+        command_line = f'{shlex.join(with_linux_timeout(command, timeout))} </dev/null'
+        if max_stdout_bytes:
+            command_line += f' | head -c {int(max_stdout_bytes)}'
+            status = '${PIPESTATUS[0]}'
+        else:
+            status = '$?'
+        script = f'{command_line}; echo "{marker}{status}"; echo "{marker}" >&2\n'
+        self.process.stdin.write(script.encode('utf-8'))
+        self.process.stdin.flush()
+        return marker.encode('ascii')
+    
+    def _read_until(self, lines: queue.Queue, marker: bytes, deadline: float):
+        """
+        Lit les lignes d'un flux jusqu'au marqueur de fin
+        
+        Returns:
+            Tuple (octets lus, code de retour) ; le code vaut None si le marqueur
+            n'a pas été vu avant l'échéance ou la fin du flux
+        """
+        chunks = []
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return b''.join(chunks), None
+            try:
+                line = lines.get(timeout=remaining)
+            except queue.Empty:
+                return b''.join(chunks), None
+            if line is None:
+                return b''.join(chunks), None
+            if marker in line:
+                # La dernière ligne de la commande peut ne pas finir par un saut de ligne
+                before, _, after = line.partition(marker)
+                if before:
+                    chunks.append(before)
+                code = after.strip()
+                return b''.join(chunks), int(code) if code.lstrip(b'-').isdigit() else 0
+            chunks.append(line)
+
+
+class WSLShellPool:
+    """
+    Pool de shells WSL persistants
+    
+    Chaque commande utilise un shell libre (ou en crée un), ce qui permet
+    d'exécuter plusieurs outils en parallèle depuis des threads différents.
+    """
+    
+    def __init__(self, shell_cmd: List[str], distro: str = None, max_idle: int = MAX_IDLE_SHELLS):
+        self.shell_cmd = list(shell_cmd)
+        self.distro = distro
+        self.max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+    
+    def _acquire(self) -> WSLShell:
+        """Retourne un shell libre et vivant, ou en démarre un nouveau"""
+        with self._lock:
+            while self._idle:
+                shell = self._idle.pop()
+                if shell.is_alive():
+                    return shell
+        return WSLShell(self.shell_cmd)
+    
+    def _release(self, shell: WSLShell):
+        """Remet un shell dans le pool (ou le ferme si le pool est plein ou mort)"""
+        if shell.hung and self.distro:
+            report_hang(self.distro)
+        with self._lock:
+            if shell.is_alive() and len(self._idle) < self.max_idle:
+                self._idle.append(shell)
+                return
+        shell.kill()
+    
+    def run(self, command: List[str], timeout: int = 30, max_stdout_bytes: int = None) -> Dict:
+        """
+        Exécute une commande dans un shell du pool
+        
+        Lève une exception si aucun shell ne peut être démarré ou s'il s'arrête,
+        pour que l'appelant puisse se rabattre sur un appel WSL classique.
+        """
+        shell = self._acquire()
+        try:
+            result = shell.run(command, timeout, max_stdout_bytes)
+        except Exception:
+            shell.kill()
+            raise
+        self._release(shell)
+        return result
+    
+    def iter_lines(self, command: List[str], timeout: int = 30, needle: bytes = None) -> Iterator[str]:
+        """
+        Exécute une commande dans un shell du pool et produit sa sortie ligne par ligne
+        
+        Le shell n'est remis dans le pool que si la commande a été lue jusqu'au bout.
+        """
+        shell = self._acquire()
+        try:
+            for line in shell.iter_lines(command, timeout, needle):
+                yield line
+        finally:
+            # Un shell tué (blocage, lecture interrompue) n'est pas remis dans le pool
+            self._release(shell)
+    
+    def close(self):
+        """Ferme tous les shells inactifs"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for shell in idle:
+            shell.kill()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(shell_cmd: List[str], distro: str = None) -> WSLShellPool:
+    """
+    Retourne le pool partagé associé à une commande de shell
+    
+    Args:
+        shell_cmd: Commande lançant le shell
+        distro: Distribution WSL (pour redémarrer WSL en cas de blocages répétés)
+    
+    Returns:
+        WSLShellPool: Pool partagé par toutes les instances des analyseurs
+    """
+    key = tuple(shell_cmd)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = WSLShellPool(shell_cmd, distro)
+        return pool
+
+
+@atexit.register
+def close_all_pools():
+    """Ferme les shells persistants à l'arrêt du processus"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close()